@@ -0,0 +1,188 @@
+"""
+Parallel, incremental build of the Sphinx docs for all versions of the spec.
+
+Every version in ``spec/`` is built by its own ``sphinx-build`` process, and
+the processes run concurrently. Each version keeps its doctrees in
+``doctrees/<version>/`` between runs, together with a hash of its inputs:
+
+* ``spec/<version>/`` and ``src/array_api_stubs/_<version>/``, which are read
+  by that version only, and
+* the files shared by all versions (``src/_array_api_conf.py``, the templates
+  and static files in ``spec/``, and the files pulled in by ``.. include::``).
+
+A version is only rebuilt when the hash of its inputs differs from the one
+recorded by its last successful build, or when its output is missing. A change
+to a shared input therefore rebuilds every version. Run with ``--force`` to
+rebuild all versions regardless.
+
+Usage::
+
+    python src/_array_api_build.py [-j JOBS] [--force] [VERSION ...]
+
+Options in the ``SPHINXOPTS`` environment variable are passed on to
+``sphinx-build``, as with ``make spec``.
+"""
+import argparse
+import hashlib
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC = ROOT / "spec"
+STUBS = ROOT / "src" / "array_api_stubs"
+BUILD = ROOT / "_site"
+DOCTREES = ROOT / "doctrees"
+
+SHARED_INPUTS = (
+    ROOT / "src" / "_array_api_conf.py",
+    ROOT / "src" / "_array_api_docs_cache.py",
+    STUBS / "__init__.py",
+    SPEC / "_static",
+    SPEC / "_templates",
+    ROOT / "CHANGELOG.md",
+    ROOT / "LICENSE",
+)
+
+# Files written into the source tree by autosummary, and thus not inputs.
+_IGNORED_DIRS = {"generated", "__pycache__"}
+
+_STAMP = ".inputs.sha256"
+
+
+def versions():
+    """Returns the spec versions, with releases in order and the draft last."""
+    names = [p.name for p in SPEC.iterdir() if p.is_dir() and p.name[0] != "_"]
+    return sorted(names, key=lambda name: (name == "draft", name))
+
+
+def latest_release():
+    return [v for v in versions() if v != "draft"][-1]
+
+
+def _files(path):
+    if path.is_file():
+        yield path
+    elif path.is_dir():
+        for child in sorted(path.iterdir()):
+            if child.name not in _IGNORED_DIRS:
+                yield from _files(child)
+
+
+def input_hash(version):
+    """Returns a hash of the contents of every input of ``version``."""
+    stubs = STUBS / "_{}".format(version.replace(".", "_"))
+    h = hashlib.sha256()
+    for path in SHARED_INPUTS + (SPEC / version, stubs):
+        for f in _files(path):
+            if f.suffix == ".pyc":
+                continue
+            h.update(str(f.relative_to(ROOT)).encode())
+            h.update(b"\0")
+            h.update(hashlib.sha256(f.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def is_stale(version, digest):
+    stamp = DOCTREES / version / _STAMP
+    if not (BUILD / version / "index.html").exists() or not stamp.exists():
+        return True
+    return stamp.read_text().strip() != digest
+
+
+def build(version, digest, sphinxopts):
+    """Builds ``version`` and records ``digest`` if the build succeeds."""
+    doctrees = DOCTREES / version
+    log = doctrees / "build.log"
+    doctrees.mkdir(parents=True, exist_ok=True)
+    # The options of the caller come first, such that ``-d`` is always ours:
+    # concurrent builds must not share a doctree directory.
+    cmd = ["sphinx-build", *sphinxopts, "-d", str(doctrees)]
+    cmd += [str(SPEC / version), str(BUILD / version)]
+    start = time.perf_counter()
+    with open(log, "w") as f:
+        returncode = subprocess.call(cmd, cwd=ROOT, stdout=f, stderr=subprocess.STDOUT)
+    elapsed = time.perf_counter() - start
+    if returncode == 0:
+        (doctrees / _STAMP).write_text(digest + "\n")
+    else:
+        # Make sure a failed build is retried by the next run.
+        (doctrees / _STAMP).unlink(missing_ok=True)
+    return returncode, elapsed, log
+
+
+def copy_site_files():
+    BUILD.mkdir(parents=True, exist_ok=True)
+    shutil.copy(SPEC / "_ghpages" / "_gitignore.txt", BUILD / ".gitignore")
+    shutil.copy(SPEC / "_ghpages" / "versions.json", BUILD / "versions.json")
+    shutil.copy(SPEC / "_ghpages" / "index.html", BUILD / "index.html")
+    (BUILD / ".nojekyll").touch()
+
+
+def copy_latest():
+    shutil.rmtree(BUILD / "latest", ignore_errors=True)
+    shutil.copytree(BUILD / latest_release(), BUILD / "latest")
+
+
+def main(argv=None):
+    all_versions = versions()
+    parser = argparse.ArgumentParser(
+        description="Build the docs of all spec versions in parallel, "
+        "skipping versions whose inputs are unchanged."
+    )
+    parser.add_argument(
+        "versions",
+        nargs="*",
+        metavar="VERSION",
+        help="versions to build (default: all of {})".format(", ".join(all_versions)),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="maximum number of concurrent sphinx-build processes",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild versions with unchanged inputs"
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.versions) - set(all_versions))
+    if unknown:
+        parser.error("unknown versions: {}".format(", ".join(unknown)))
+    selected = [v for v in all_versions if v in (args.versions or all_versions)]
+    sphinxopts = shlex.split(os.environ.get("SPHINXOPTS", "-W --keep-going"))
+
+    copy_site_files()
+    digests = {v: input_hash(v) for v in selected}
+    stale = [v for v in selected if args.force or is_stale(v, digests[v])]
+    for v in selected:
+        if v not in stale:
+            print("{}: up to date".format(v))
+    if not stale:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {v: pool.submit(build, v, digests[v], sphinxopts) for v in stale}
+        failed = []
+        for v, future in futures.items():
+            returncode, elapsed, log = future.result()
+            status = "built" if returncode == 0 else "FAILED"
+            print("{}: {} in {:.1f}s (log: {})".format(v, status, elapsed, log))
+            if returncode != 0:
+                failed.append(v)
+                sys.stdout.write(log.read_text())
+
+    latest = latest_release()
+    if latest not in failed and (latest in stale or not (BUILD / "latest").exists()):
+        copy_latest()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
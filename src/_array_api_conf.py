@@ -97,6 +97,13 @@ if hasattr(autosummary_mod, "_module"):
     autosummary_mod = autosummary_mod._module
 autosummary_mod.mangle_signature = lambda sig, max_chars=30: sig
 
+# Most objects are documented identically by several spec versions, so that
+# docstrings and autosummary pages are cached by content and shared between
+# versions. See _array_api_docs_cache.py.
+import _array_api_docs_cache
+
+_array_api_docs_cache.install(autosummary_mod)
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["../_templates"]
 
@@ -0,0 +1,157 @@
+"""
+Content-hash cache for the Sphinx docs of all spec versions.
+
+Most stubs are unchanged from one version of the spec to the next, and, as
+every version documents its stubs as the ``array_api`` module, so are the names
+under which they are documented. This module caches, on disk, the work Sphinx
+repeats for such objects in every version:
+
+* the docstrings rewritten by ``sphinx.ext.napoleon``,
+* the one-line summaries extracted by ``sphinx.ext.autosummary``, and
+* the pages generated by ``sphinx.ext.autosummary`` into ``generated/``.
+
+Entries are keyed by a hash of everything their output depends on, rather than
+by version, such that an entry written by one version is reused by every other
+version (and by later builds of the same version) with identical inputs.
+Entries are written atomically, such that concurrent builds of different
+versions (see ``src/_array_api_build.py``) can share a cache directory.
+
+The cache directory is ``doctrees/_cache`` at the root of the repository, or
+the value of the ``ARRAY_API_DOCS_CACHE`` environment variable. Set the latter
+to an empty string to disable the cache.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import sphinx
+import sphinx.ext.autosummary.generate as autosummary_generate_mod
+import sphinx.ext.napoleon as napoleon_mod
+
+ROOT = Path(__file__).resolve().parents[1]
+# Bump to invalidate all existing entries, e.g. after changing a cache key.
+CACHE_FORMAT = 1
+
+_env = os.environ.get("ARRAY_API_DOCS_CACHE")
+CACHE_DIR = None if _env == "" else Path(_env or ROOT / "doctrees" / "_cache")
+
+
+def _key(kind, *parts):
+    h = hashlib.sha256()
+    h.update(json.dumps([CACHE_FORMAT, sphinx.__version__, kind]).encode())
+    for part in parts:
+        h.update(b"\0")
+        h.update(part if isinstance(part, bytes) else repr(part).encode())
+    return h.hexdigest()
+
+
+def _path(key):
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def get(key):
+    try:
+        with open(_path(key)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def put(key, value):
+    path = _path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(value, f)
+    os.replace(tmp, path)
+
+
+def _cached(kind, func, key_parts):
+    """Wraps ``func`` such that its results are cached under ``key_parts``."""
+
+    def wrapper(*args, **kwargs):
+        key = _key(kind, *key_parts(*args, **kwargs))
+        value = get(key)
+        if value is None:
+            value = func(*args, **kwargs)
+            put(key, value)
+        return value
+
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+# -- napoleon ----------------------------------------------------------------
+
+
+def _napoleon_config(config):
+    names = sorted(k for k in config.values if k.startswith("napoleon_"))
+    return [(k, getattr(config, k)) for k in names]
+
+
+def _process_docstring(app, what, name, obj, options, lines):
+    # ``obj`` only matters to napoleon through its annotations (for the types
+    # of attributes), so that these are part of the key rather than ``obj``.
+    key = _key(
+        "napoleon",
+        what,
+        name,
+        lines,
+        getattr(obj, "__annotations__", None),
+        _napoleon_config(app.config),
+    )
+    value = get(key)
+    if value is None:
+        _process_docstring.__wrapped__(app, what, name, obj, options, lines)
+        put(key, lines)
+    else:
+        lines[:] = value
+
+
+_process_docstring.__wrapped__ = napoleon_mod._process_docstring
+
+# -- autosummary -------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _templates_digest(srcdir, templates_path):
+    h = hashlib.sha256()
+    for templates in templates_path:
+        for path in sorted(Path(srcdir, templates).glob("**/*")):
+            if path.is_file():
+                h.update(path.name.encode())
+                h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _content_key_parts(
+    name, obj, parent, template, template_name, imported_members, app, recursive, *a
+):
+    # The generated page lists the members of classes and modules, and only
+    # depends on the names of functions.
+    members = sorted(dir(obj)) if inspect.isclass(obj) or inspect.ismodule(obj) else ()
+    templates = _templates_digest(app.srcdir, tuple(app.config.templates_path))
+    return (name, template_name, imported_members, recursive, members, a, templates)
+
+
+def _summary_key_parts(doc, document):
+    return (doc, document.settings.language_code)
+
+
+def install(autosummary_mod):
+    """Routes the cached steps of the docs build through the cache."""
+    if CACHE_DIR is None:
+        return
+    napoleon_mod._process_docstring = _process_docstring
+    autosummary_mod.extract_summary = _cached(
+        "summary", autosummary_mod.extract_summary, _summary_key_parts
+    )
+    autosummary_generate_mod.generate_autosummary_content = _cached(
+        "autosummary",
+        autosummary_generate_mod.generate_autosummary_content,
+        _content_key_parts,
+    )
@@ -0,0 +1,487 @@
+"""
+Generates files derived from the array API stubs.
+
+The stubs in ``array_api_stubs/_<version>`` are the single source of truth for
+each version of the specification. This script derives the following from them:
+
+* ``array_api_stubs/signatures/_<version>``, copies of the stubs with all
+  docstrings removed, for tools which only need the API surface (e.g., to call
+  ``inspect.signature``).
+* ``array_api_stubs/special_cases/<version>.json``, the special cases listed in
+  the docstrings of element-wise functions as structured rules.
+
+Run ``python src/_array_api_generate.py`` after editing the stubs, and
+``python src/_array_api_generate.py --check`` to verify that the generated
+files are up to date.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SRC = Path(__file__).parent
+STUBS = SRC / "array_api_stubs"
+SIGNATURES = STUBS / "signatures"
+SPECIAL_CASES = STUBS / "special_cases"
+
+VERSIONS = ("_2021_12", "_2022_12", "_2023_12", "_2024_12", "_2025_12", "_draft")
+
+HEADER = "# Generated by src/_array_api_generate.py from {}. Do not edit.\n"
+
+
+def _is_string(stmt: ast.stmt) -> bool:
+    return (
+        isinstance(stmt, ast.Expr)
+        and isinstance(stmt.value, ast.Constant)
+        and isinstance(stmt.value.value, str)
+    )
+
+
+def strip_docstrings(source: str) -> str:
+    """
+    Removes docstrings (including attribute docstrings) from Python source.
+
+    Edits are applied line-wise, such that the remaining source keeps its
+    original formatting. Function and class bodies consisting solely of a
+    docstring are replaced by ``...``.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    # Maps a 0-based start line to the (end line, replacement) of an edit.
+    edits: Dict[int, Tuple[int, str]] = {}
+    for node in ast.walk(tree):
+        body = getattr(node, "body", None)
+        if not isinstance(body, list):
+            continue
+        strings = [stmt for stmt in body if _is_string(stmt)]
+        for i, stmt in enumerate(body):
+            if not _is_string(stmt):
+                continue
+            start, end = stmt.lineno - 1, stmt.end_lineno
+            replacement = ""
+            if len(strings) == len(body) and not isinstance(node, ast.Module):
+                if stmt is strings[0]:
+                    replacement = " " * stmt.col_offset + "...\n"
+            elif i == 0:
+                # Blank lines following a leading docstring would otherwise
+                # become blank lines at the start of the block.
+                while end < len(lines) and not lines[end].strip():
+                    end += 1
+            edits[start] = (end, replacement)
+
+    out: List[str] = []
+    lineno = 0
+    while lineno < len(lines):
+        if lineno in edits:
+            lineno, replacement = edits[lineno]
+            out.append(replacement)
+        else:
+            out.append(lines[lineno])
+            lineno += 1
+    return "".join(out).strip("\n") + "\n"
+
+
+def generate_signatures() -> Dict[Path, str]:
+    files = {}
+    for version in VERSIONS:
+        for path in sorted((STUBS / version).glob("*.py")):
+            source = strip_docstrings(path.read_text(encoding="utf-8"))
+            header = HEADER.format(path.relative_to(SRC).as_posix())
+            files[SIGNATURES / version / path.name] = header + source
+    return files
+
+
+# -- Special cases ------------------------------------------------------------
+
+# Placeholder for inline literals (e.g., ``NaN``) within a special case.
+_CODE = re.compile(r"``([^`]+)``")
+_V = r"\{(\d+)\}"
+
+# Data type kinds named by the phrasing of special-case sections (e.g., "For
+# real-valued floating-point operands") and of input array descriptions (e.g.,
+# "Should have a numeric data type"), longest phrases first.
+_PHRASE_DTYPES = (
+    ("real-valued floating-point", ["real floating"]),
+    ("complex floating-point", ["complex floating"]),
+    ("real-valued", ["integral", "real floating"]),
+    ("floating-point", ["real floating", "complex floating"]),
+    ("numeric", ["integral", "real floating", "complex floating"]),
+    ("integer or boolean", ["integral", "bool"]),
+    ("integer", ["integral"]),
+    ("boolean", ["bool"]),
+)
+
+
+def _phrase_dtypes(phrase: str) -> Optional[List[str]]:
+    return next((kinds for name, kinds in _PHRASE_DTYPES if name in phrase), None)
+
+
+def accepted_dtypes(docstring: str, complex_: bool = True) -> Optional[List[str]]:
+    """
+    Returns the data type kinds accepted by an element-wise function, as stated
+    by the description of its first parameter, or ``None`` if any data type is
+    accepted. If ``complex_`` is ``False`` (i.e., for versions predating complex
+    number support), complex floating-point data types are excluded.
+    """
+    m = re.search(r"Parameters\n-+\n\w+: [^\n]+\n\s+(.+)", docstring)
+    phrase = m and re.search(r"[Ss]hould\** have an? ([\w ,-]+?) data type", m.group(1))
+    kinds = _phrase_dtypes(phrase.group(1)) if phrase else None
+    if not complex_:
+        kinds = kinds or ["bool", "integral", "real floating"]
+        kinds = [kind for kind in kinds if kind != "complex floating"]
+    return kinds
+
+
+# Predicates which take no value, keyed by their phrasing.
+_PREDICATES = {
+    "is a finite number": "finite",
+    "are both finite numbers": "finite",
+    "is a nonzero number": "nonzero",
+    "is a nonzero finite number": "nonzero_finite",
+    "are both nonzero finite numbers": "nonzero_finite",
+    "is a positive finite number": "positive_finite",
+    "is a positive (i.e., greater than {}) finite number": "positive_finite",
+    "is a negative finite number": "negative_finite",
+    "is a negative (i.e., less than {}) finite number": "negative_finite",
+    "is any value": "any",
+    "is any value (including {})": "any",
+    "is any value, including {}": "any",
+    "is already integer-valued": "integer",
+    "is an integer value": "integer",
+    "is not an integer value": "not_integer",
+    "is an odd integer value": "odd_integer",
+    "is not an odd integer value": "not_odd_integer",
+    "have the same mathematical sign": "same_sign",
+    "have different mathematical signs": "different_signs",
+}
+
+# Predicates which compare against one or more values.
+_COMPARISONS = (
+    (rf"(?:is|equals|are all) {_V}", "equal"),
+    (rf"(?:is not|is not equal to|does not equal) {_V}", "not_equal"),
+    (rf"is greater than {_V}", "greater"),
+    (rf"is greater than or equal to {_V}", "greater_equal"),
+    (rf"is less than {_V}", "less"),
+    (rf"is less than or equal to {_V}", "less_equal"),
+    (rf"is (?:either )?{_V} or {_V}", "in"),
+)
+
+
+def _parse_predicate(phrase: str, codes: List[str]) -> Optional[Dict[str, Any]]:
+    # Literals within these phrases are fixed (e.g., "greater than ``0``").
+    key = re.sub(_V, "{}", phrase)
+    if key in _PREDICATES:
+        return {"predicate": _PREDICATES[key]}
+    for pattern, name in _COMPARISONS:
+        m = re.fullmatch(pattern, phrase)
+        if m:
+            values = [codes[int(i)] for i in m.groups()]
+            if name == "in":
+                return {"predicate": name, "values": values}
+            return {"predicate": name, "value": values[0]}
+    m = re.fullmatch(rf"is (?:either )?a finite number or {_V}", phrase)
+    if m:
+        return {
+            "predicate": "any_of",
+            "predicates": [
+                {"predicate": "finite"},
+                {"predicate": "equal", "value": codes[int(m.group(1))]},
+            ],
+        }
+    return None
+
+
+def _parse_condition(
+    clause: str, codes: List[str], variables: Dict[str, str]
+) -> Optional[Dict[str, Any]]:
+    def operand(i: str) -> str:
+        code = codes[int(i)]
+        return variables.get(code, code)
+
+    m = re.fullmatch(rf"({_V} is .+) or ({_V} is .+)", clause)
+    if m:
+        conditions = [
+            _parse_condition(m.group(1), codes, variables),
+            _parse_condition(m.group(3), codes, variables),
+        ]
+        if None in conditions:
+            return None
+        return {"any_of": conditions}
+
+    m = re.fullmatch(rf"the sign bit of {_V} is {_V}", clause)
+    if m:
+        return {
+            "operands": [operand(m.group(1))],
+            "predicate": "sign_bit",
+            "value": codes[int(m.group(2))],
+        }
+
+    quantifier = None
+    m = re.fullmatch(rf"(?:either )?((?:{_V},? )+)or {_V} (.+)", clause)
+    if m:
+        operands = [operand(i) for i in re.findall(_V, m.group(1))]
+        operands.append(operand(m.group(3)))
+        phrase, quantifier = m.group(4), "any"
+    else:
+        m = re.fullmatch(rf"((?:{_V}(?:,? and |, ))*){_V} (.+)", clause)
+        if not m:
+            return None
+        operands = [operand(i) for i in re.findall(_V, m.group(1) or "")]
+        operands.append(operand(m.group(3)))
+        phrase = m.group(4)
+        if len(operands) > 1:
+            quantifier = "all"
+    predicate = _parse_predicate(phrase, codes)
+    if predicate is None:
+        return None
+    condition: Dict[str, Any] = {"operands": operands}
+    if quantifier is not None:
+        condition["quantifier"] = quantifier
+    condition.update(predicate)
+    return condition
+
+
+def _parse_result(text: str, codes: List[str]) -> Dict[str, Any]:
+    patterns = (
+        (rf"(?:is|is equal to) {_V}", {}),
+        (rf"is equivalent to {_V}", {}),
+        (rf"is {_V} \((.+)\)", {"note": 2}),
+        (rf"is {_V}\. \(\*\*note\*\*: (.+)\)", {"note": 2}),
+        (rf"is {_V}, (even if .+)", {"note": 2}),
+        (rf"is {_V} with a sign bit of {_V}", {"sign_bit": 2}),
+        (rf"is an implementation-dependent approximation to {_V}", {}),
+    )
+    for pattern, extras in patterns:
+        m = re.fullmatch(pattern, text)
+        if m:
+            result = {"value": codes[int(m.group(1))]}
+            if "approximation" in pattern:
+                result["approximate"] = True
+            for key, group in extras.items():
+                value = m.group(group)
+                result[key] = codes[int(value)] if key == "sign_bit" else value
+            return result
+    m = re.fullmatch(r"has a (positive|negative) mathematical sign", text)
+    if m:
+        return {"sign": m.group(1)}
+    return {"text": _CODE.sub(r"``\1``", text.format(*[f"``{c}``" for c in codes]))}
+
+
+def parse_special_case(
+    text: str, variables: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Parses a single special case (e.g., "If ``x_i`` is ``NaN``, the result is ``NaN``.").
+
+    Returns a rule whose ``conditions`` is ``None`` if the condition could not
+    be parsed, and whose ``result`` only contains ``text`` if the result could
+    not be parsed.
+    """
+    codes: List[str] = []
+
+    def protect(m: re.Match) -> str:
+        codes.append(m.group(1))
+        return f"{{{len(codes) - 1}}}"
+
+    rule: Dict[str, Any] = {"text": text, "conditions": None, "result": None}
+    masked = _CODE.sub(protect, text).rstrip(".")
+    m = re.fullmatch(r"In the remaining cases, the result (.+)", masked)
+    if m:
+        rule["otherwise"] = True
+        rule["result"] = _parse_result(m.group(1), codes)
+        return rule
+    m = re.fullmatch(
+        r"(?:Similarly, i|I)f (.+?), the (result|real component of the result|imaginary component of the result) (.+)",
+        masked,
+    )
+    if not m:
+        return rule
+    if re.fullmatch(rf"(?:{_V}, )+or {_V} .+", m.group(1)):
+        # A single clause with several subjects (e.g., "``a``, ``b``, or ``c`` is").
+        clauses = [m.group(1)]
+    else:
+        clauses = re.split(
+            rf",? and (?=\{{\d+\}}|either |the sign bit)|, (?=\{{\d+\}})", m.group(1)
+        )
+    # Re-join subjects which were split apart (e.g., "``a`` and ``b`` are ...").
+    merged: List[str] = []
+    for clause in clauses:
+        if merged and re.fullmatch(rf"{_V}(?: and {_V})*", merged[-1]):
+            merged[-1] = f"{merged[-1]} and {clause}"
+        else:
+            merged.append(clause)
+    # Split predicates sharing a subject (e.g., "... have the same mathematical
+    # sign and are both nonzero finite numbers").
+    for i, clause in enumerate(merged):
+        parts = re.fullmatch(r"(.+?) (have .+?) and (are .+)", clause)
+        if parts:
+            subject = parts.group(1)
+            merged[i : i + 1] = [
+                f"{subject} {parts.group(2)}",
+                f"{subject} {parts.group(3)}",
+            ]
+    conditions = [_parse_condition(c, codes, variables or {}) for c in merged]
+    if None not in conditions:
+        rule["conditions"] = conditions
+    rule["result"] = _parse_result(m.group(3), codes)
+    if m.group(2) != "result":
+        rule["result"]["component"] = m.group(2).split()[0]
+    return rule
+
+
+def parse_special_cases(
+    docstring: str, accepted: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Parses the special cases section of an element-wise function docstring.
+
+    ``accepted`` restricts the data type kinds of each rule to those accepted by
+    the function (e.g., "For floating-point operands" only covers real-valued
+    floating-point operands of a function which does not accept complex numbers).
+    """
+    rules: List[Dict[str, Any]] = []
+    equivalences: List[Dict[str, Any]] = []
+    sections = re.split(r"\*\*Special [Cc]ases\*\*", docstring, maxsplit=1)
+    if len(sections) == 1:
+        return {"rules": rules, "equivalences": equivalences}
+    dtypes = accepted
+    variables: Dict[str, str] = {}
+    for line in sections[1].splitlines():
+        line = line.strip()
+        if line.startswith("For "):
+            # The kind is named by the leading clause; the remainder of the line
+            # may mention other kinds (e.g., "For complex floating-point operands,
+            # real-valued floating-point special cases must ...").
+            clause = line.split(",")[0]
+            dtypes = _phrase_dtypes(clause) or accepted
+            if dtypes is not None and accepted is not None:
+                dtypes = [kind for kind in dtypes if kind in accepted]
+            variables = {
+                name: f"{component}({operand})"
+                for name, component, operand in re.findall(
+                    r"``(\w+) = (real|imag)\((\w+)\)``", line
+                )
+            }
+            # Components of two operands (e.g., "For real components ``a`` and
+            # ``c`` and imaginary components ``b`` and ``d``").
+            m = re.search(
+                r"real components ``(\w+)`` and ``(\w+)`` and "
+                r"imaginary components ``(\w+)`` and ``(\w+)``",
+                line,
+            )
+            if m:
+                a, c, b, d = m.groups()
+                variables = {
+                    a: "real(x1_i)",
+                    b: "imag(x1_i)",
+                    c: "real(x2_i)",
+                    d: "imag(x2_i)",
+                }
+            m = re.search(r"as if the operation is implemented as ``([^`]+)``", line)
+            if m:
+                equivalences.append({"dtypes": dtypes, "expression": m.group(1)})
+        elif re.match(r"-\s+", line):
+            rule = {"dtypes": dtypes}
+            rule.update(parse_special_case(re.sub(r"^-\s+", "", line), variables))
+            rules.append(rule)
+    return {"rules": rules, "equivalences": equivalences}
+
+
+def _dump_special_cases(table: Dict[str, Any]) -> str:
+    # One rule per line keeps the tables compact and their diffs readable.
+    def dump(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    lines = ["{"]
+    lines.append(f'  "version": {dump(table["version"])},')
+    lines.append(f'  "source": {dump(table["source"])},')
+    lines.append('  "functions": {')
+    for i, (name, cases) in enumerate(table["functions"].items()):
+        lines.append(f"    {dump(name)}: {{")
+        for key in ("equivalences", "rules"):
+            items = [f"        {dump(item)}" for item in cases[key]]
+            if items:
+                lines.append(f'      "{key}": [')
+                lines.append(",\n".join(items))
+                lines.append("      ]" + ("," if key == "equivalences" else ""))
+            else:
+                lines.append(
+                    f'      "{key}": []' + ("," if key == "equivalences" else "")
+                )
+        lines.append("    }" + ("," if i < len(table["functions"]) - 1 else ""))
+    lines.append("  }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_special_cases() -> Dict[Path, str]:
+    files = {}
+    for version in VERSIONS:
+        path = STUBS / version / "elementwise_functions.py"
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        # Complex floating-point data types were introduced in 2022.12.
+        complex_ = version != "_2021_12"
+        functions = {}
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef):
+                docstring = ast.get_docstring(node) or ""
+                accepted = accepted_dtypes(docstring, complex_)
+                functions[node.name] = parse_special_cases(docstring, accepted)
+        label = "draft" if version == "_draft" else version[1:].replace("_", ".")
+        table = {
+            "version": label,
+            "source": path.relative_to(SRC).as_posix(),
+            "functions": dict(sorted(functions.items())),
+        }
+        files[SPECIAL_CASES / f"{label}.json"] = _dump_special_cases(table)
+    return files
+
+
+# Each generator is paired with the directory and glob pattern of its outputs.
+GENERATORS = (
+    (generate_signatures, SIGNATURES, "_*/*.py"),
+    (generate_special_cases, SPECIAL_CASES, "*.json"),
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with a non-zero status if generated files are out of date",
+    )
+    args = parser.parse_args(argv)
+
+    stale = []
+    for generate, root, pattern in GENERATORS:
+        expected = generate()
+        existing = set(root.glob(pattern))
+        for path in sorted(existing - set(expected)):
+            stale.append(path)
+            if not args.check:
+                path.unlink()
+        for path, content in expected.items():
+            if path.exists() and path.read_text(encoding="utf-8") == content:
+                continue
+            stale.append(path)
+            if not args.check:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(content, encoding="utf-8")
+
+    for path in stale:
+        action = "out of date" if args.check else "updated"
+        print(f"{path.relative_to(SRC.parent).as_posix()}: {action}")
+    if args.check and stale:
+        print("Run `python src/_array_api_generate.py` to update generated files.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""Benchmark suite for implementations of the array API standard."""
+
+from ._cases import Case, Context, discover_cases
+from ._runner import run_benchmarks
+
+__all__ = ["Case", "Context", "discover_cases", "run_benchmarks"]
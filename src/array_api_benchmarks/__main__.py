@@ -0,0 +1,89 @@
+"""
+Command-line interface for the array API benchmark suite.
+
+Example::
+
+    python -m array_api_benchmarks numpy --sizes 1000 1000000 -o numpy.json
+"""
+import argparse
+import importlib
+import json
+import sys
+
+from ._runner import DEFAULT_SIZES, run_benchmarks
+
+
+def _import(path: str):
+    module_name, _, attr = path.partition(":")
+    obj = importlib.import_module(module_name)
+    return getattr(obj, attr) if attr else obj
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m array_api_benchmarks",
+        description="Time the functions of the array API standard against an array library.",
+    )
+    parser.add_argument(
+        "namespace",
+        help="importable array API namespace (e.g., 'numpy' or 'array_api_strict')",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="approximate number of elements in each input array",
+    )
+    parser.add_argument(
+        "--dtypes",
+        nargs="+",
+        help="data types to benchmark (default: bool and the default data types)",
+    )
+    parser.add_argument(
+        "-k",
+        "--functions",
+        nargs="+",
+        help="fnmatch-style patterns selecting functions (e.g., 'linalg.*')",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.01)
+    parser.add_argument(
+        "--sync",
+        help="'module:function' called on every output to force evaluation",
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write the JSON report to (default: stdout)"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    xp = _import(args.namespace)
+    if not hasattr(xp, "__array_namespace_info__"):
+        parser.error(f"{args.namespace!r} does not expose __array_namespace_info__")
+
+    def progress(desc):
+        print(desc, file=sys.stderr)
+
+    report = run_benchmarks(
+        xp,
+        sizes=args.sizes,
+        dtypes=args.dtypes,
+        functions=args.functions,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        sync=_import(args.sync) if args.sync else None,
+        progress=None if args.quiet else progress,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,656 @@
+"""
+Benchmark cases derived from the draft array API stubs.
+
+Every function stubbed in ``array_api_stubs._draft`` becomes a :class:`Case`.
+Arguments for a case are inferred from the stub signature: required positional
+parameters named ``x``, ``x1``, ``x2``, etc. receive input arrays. Functions
+whose arguments cannot be inferred that way (e.g., ``reshape`` or
+``linalg.cholesky``) register an explicit argument builder in this module.
+"""
+from __future__ import annotations
+
+__all__ = ["Case", "Context", "discover_cases"]
+
+import inspect
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from array_api_stubs import _draft as stubs
+
+# Stub modules whose functions are exposed in the main namespace.
+MODULES = (
+    "creation_functions",
+    "data_type_functions",
+    "elementwise_functions",
+    "indexing_functions",
+    "linear_algebra_functions",
+    "manipulation_functions",
+    "searching_functions",
+    "set_functions",
+    "sorting_functions",
+    "statistical_functions",
+    "utility_functions",
+)
+
+# Stub modules for extensions, which are exposed as namespace attributes.
+EXTENSIONS = ("linalg", "fft")
+
+Arguments = Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+_ARRAY_PARAMETER = re.compile(r"x[0-9]*")
+
+# Data type kinds named by the description of an input array (e.g., "Should
+# have a numeric data type"), longest phrases first.
+_KINDS = (
+    ("real-valued floating-point", ("real floating",)),
+    ("complex floating-point", ("complex floating",)),
+    ("real-valued", ("integral", "real floating")),
+    ("floating-point", ("real floating", "complex floating")),
+    ("numeric", ("integral", "real floating", "complex floating")),
+    ("integer or boolean", ("integral", "bool")),
+    ("integer", ("integral",)),
+    ("boolean", ("bool",)),
+)
+
+_ALIAS = re.compile(r"Alias for :func:`~array_api\.(\w+)`")
+_FIRST_PARAMETER = re.compile(r"Parameters\n-+\n\w+: [^\n]+\n\s+(.+)")
+_DTYPE_PHRASE = re.compile(r"(?:[Ss]hould|[Mm]ust)\** have an? ([\w ,-]+?) data type")
+
+
+def _accepted_kinds(func: Callable[..., Any]) -> Optional[Tuple[str, ...]]:
+    # Returns the data type kinds of the first parameter as stated by its stub,
+    # or ``None`` if the stub does not restrict them.
+    doc = inspect.getdoc(func) or ""
+    alias = _ALIAS.match(doc)
+    if alias:
+        return _accepted_kinds(getattr(stubs, alias.group(1)))
+    m = _FIRST_PARAMETER.search(doc)
+    phrase = m and _DTYPE_PHRASE.search(m.group(1))
+    if not phrase:
+        return None
+    return next((kinds for name, kinds in _KINDS if name in phrase.group(1)), None)
+
+
+@dataclass
+class Context:
+    """Inputs shared by all argument builders for a single benchmark point."""
+
+    xp: Any
+    dtype: Any
+    size: Optional[int]
+    device: Any = None
+
+    @property
+    def m(self) -> int:
+        """Side length of square inputs having approximately ``size`` elements."""
+        return max(1, math.isqrt(self.size or 1))
+
+    def default_dtype(self, kind: str) -> Any:
+        info = self.xp.__array_namespace_info__()
+        return info.default_dtypes(device=self.device)[kind]
+
+    def array(
+        self,
+        shape: Optional[Tuple[int, ...]] = None,
+        *,
+        dtype: Any = None,
+        low: float = 0.1,
+        high: float = 0.9,
+    ) -> Any:
+        """
+        Returns a deterministic array whose values lie in ``[low, high]``.
+
+        Integer arrays contain values on the interval ``[1, 64]`` and boolean
+        arrays alternate between ``True`` and ``False``. The default shape is
+        ``(m, m)``.
+        """
+        xp = self.xp
+        dtype = self.dtype if dtype is None else dtype
+        shape = (self.m, self.m) if shape is None else shape
+        n = math.prod(shape)
+        if xp.isdtype(dtype, "bool"):
+            x = xp.arange(n, device=self.device) % 2 == 0
+        elif xp.isdtype(dtype, "integral"):
+            x = xp.astype(xp.arange(n, device=self.device) % 64 + 1, dtype)
+        elif xp.isdtype(dtype, "complex floating"):
+            x = xp.linspace(
+                complex(low, high),
+                complex(high, low),
+                n,
+                dtype=dtype,
+                device=self.device,
+            )
+        else:
+            x = xp.linspace(low, high, n, dtype=dtype, device=self.device)
+        return xp.reshape(x, shape)
+
+    def indices(self, shape: Tuple[int, ...], bound: int) -> Any:
+        """Returns a scrambled index array with values on ``[0, bound)``."""
+        xp = self.xp
+        dtype = self.default_dtype("indexing")
+        x = xp.arange(math.prod(shape), dtype=dtype, device=self.device)
+        return xp.reshape(x * 7919 % bound, shape)
+
+    def matrix(self) -> Any:
+        """Returns a well-conditioned (diagonally dominant) square matrix."""
+        m = self.m
+        eye = self.xp.eye(m, dtype=self.dtype, device=self.device)
+        return self.array() + m * eye
+
+    def spd_matrix(self) -> Any:
+        """Returns a symmetric (Hermitian) positive-definite square matrix."""
+        x = self.array()
+        if self.xp.isdtype(self.dtype, "complex floating"):
+            x = x @ self.xp.conj(x).mT
+        else:
+            x = x @ x.mT
+        eye = self.xp.eye(self.m, dtype=self.dtype, device=self.device)
+        return x + self.m * eye
+
+    def fill_value(self) -> Any:
+        """Returns a Python scalar whose kind matches the benchmark data type."""
+        xp = self.xp
+        if xp.isdtype(self.dtype, "bool"):
+            return True
+        if xp.isdtype(self.dtype, "integral"):
+            return 1
+        if xp.isdtype(self.dtype, "complex floating"):
+            return 1 + 1j
+        return 1.0
+
+
+ArgumentBuilder = Callable[[Context], Arguments]
+
+
+@dataclass(frozen=True)
+class _Builder:
+    build: ArgumentBuilder
+    sized: bool
+    axes: Optional[Tuple[Optional[int], ...]]
+
+
+_BUILDERS: Dict[str, _Builder] = {}
+
+# Value ranges for functions whose domain excludes the default ``[0.1, 0.9]``.
+_DOMAINS: Dict[str, Tuple[float, float]] = {
+    "acosh": (1.1, 1.9),
+}
+
+_NUMERIC = ("integral", "real floating", "complex floating")
+
+# Data type kinds for functions whose stub does not state them for its first
+# array parameter, or which define the result for integer arrays to be
+# implementation-specific (e.g., ``divide``).
+_SUPPORTED_KINDS: Dict[str, Tuple[str, ...]] = {
+    "arange": ("integral", "real floating"),
+    "astype": ("bool", "integral", "real floating"),
+    "bincount": _NUMERIC,
+    "divide": ("real floating", "complex floating"),
+    "einsum": _NUMERIC,
+    "finfo": ("real floating", "complex floating"),
+    "iinfo": ("integral",),
+    "linspace": ("real floating", "complex floating"),
+    "merge_moments": ("real floating",),
+    "moments_var": ("real floating",),
+    "put": _NUMERIC,
+    "put_along_axis": _NUMERIC,
+    "result_type": ("real floating", "complex floating"),
+    "linalg.multi_dot": _NUMERIC,
+    "linalg.tensordot": _NUMERIC,
+    "fft.fftfreq": ("real floating",),
+    "fft.rfftfreq": ("real floating",),
+}
+
+
+def _builder(
+    *names: str,
+    sized: bool = True,
+    axes: Optional[Tuple[Optional[int], ...]] = None,
+) -> Callable[[ArgumentBuilder], ArgumentBuilder]:
+    """
+    Registers an argument builder for one or more functions.
+
+    ``sized=False`` marks functions whose cost does not depend on the problem
+    size (e.g., ``finfo``), which are timed once per data type. ``axes``
+    overrides the values swept for the ``axis`` keyword argument.
+    """
+
+    def register(build: ArgumentBuilder) -> ArgumentBuilder:
+        for name in names:
+            _BUILDERS[name] = _Builder(build, sized, axes)
+        return build
+
+    return register
+
+
+@dataclass(frozen=True)
+class Case:
+    """A single stubbed function together with how to call it."""
+
+    name: str
+    module: str
+    signature: inspect.Signature
+    sized: bool = True
+    axes: Tuple[Optional[int], ...] = ()
+    kinds: Optional[Tuple[str, ...]] = None
+
+    def accepts(self, xp: Any, dtype: Any) -> bool:
+        """Returns whether this case is benchmarked for ``dtype``."""
+        return self.kinds is None or xp.isdtype(dtype, self.kinds)
+
+    def resolve(self, xp: Any) -> Optional[Callable[..., Any]]:
+        """Returns the function implementing this case in ``xp``, if any."""
+        obj = xp
+        for part in self.name.split("."):
+            obj = getattr(obj, part, None)
+            if obj is None:
+                return None
+        return obj
+
+    def arguments(self, ctx: Context, axis: Optional[int] = None) -> Arguments:
+        builder = _BUILDERS.get(self.name)
+        if builder is None:
+            args, kwargs = self._infer_arguments(ctx)
+        else:
+            args, kwargs = builder.build(ctx)
+        if self.axes:
+            kwargs = dict(kwargs, axis=axis)
+        return args, kwargs
+
+    def _infer_arguments(self, ctx: Context) -> Arguments:
+        low, high = _DOMAINS.get(self.name, (0.1, 0.9))
+        args = []
+        for param in self.signature.parameters.values():
+            if param.default is not param.empty or param.kind in (
+                param.KEYWORD_ONLY,
+                param.VAR_KEYWORD,
+            ):
+                continue
+            if param.kind is param.VAR_POSITIONAL or not _ARRAY_PARAMETER.fullmatch(
+                param.name
+            ):
+                raise NotImplementedError(
+                    f"cannot infer a value for parameter {param.name!r}; "
+                    "register an argument builder"
+                )
+            args.append(ctx.array(low=low, high=high))
+        return tuple(args), {}
+
+
+def _default_axes(signature: inspect.Signature) -> Tuple[Optional[int], ...]:
+    param = signature.parameters.get("axis")
+    if param is None or param.default is param.empty:
+        return ()
+    if param.default is None:
+        return (None, 0, -1)
+    return (0, -1)
+
+
+def discover_cases(patterns: Optional[Sequence[str]] = None) -> Tuple[Case, ...]:
+    """
+    Returns a case for every function stubbed in the draft specification.
+
+    Parameters
+    ----------
+    patterns: Optional[Sequence[str]]
+        ``fnmatch``-style patterns (e.g., ``"linalg.*"``) selecting which cases
+        to return. By default, all cases are returned.
+    """
+    from fnmatch import fnmatchcase
+
+    cases = []
+    for module_name in MODULES + EXTENSIONS:
+        module = getattr(stubs, module_name)
+        prefix = f"{module_name}." if module_name in EXTENSIONS else ""
+        for func_name in module.__all__:
+            name = prefix + func_name
+            if patterns and not any(fnmatchcase(name, p) for p in patterns):
+                continue
+            func = getattr(module, func_name)
+            signature = inspect.signature(func)
+            builder = _BUILDERS.get(name)
+            axes = _default_axes(signature)
+            kinds = _SUPPORTED_KINDS.get(name) or _accepted_kinds(func)
+            if builder is not None and builder.axes is not None:
+                axes = builder.axes
+            sized = True if builder is None else builder.sized
+            cases.append(Case(name, module_name, signature, sized, axes, kinds))
+    return tuple(cases)
+
+
+# -- Creation functions -------------------------------------------------------
+
+
+@_builder("arange")
+def _arange(ctx: Context) -> Arguments:
+    return (ctx.size,), {"dtype": ctx.dtype, "device": ctx.device}
+
+
+@_builder("empty", "ones", "zeros")
+def _empty(ctx: Context) -> Arguments:
+    return ((ctx.m, ctx.m),), {"dtype": ctx.dtype, "device": ctx.device}
+
+
+@_builder("asarray")
+def _asarray(ctx: Context) -> Arguments:
+    return (ctx.array(),), {"copy": True}
+
+
+@_builder("eye")
+def _eye(ctx: Context) -> Arguments:
+    return (ctx.m,), {"dtype": ctx.dtype, "device": ctx.device}
+
+
+@_builder("full")
+def _full(ctx: Context) -> Arguments:
+    shape = (ctx.m, ctx.m)
+    return (shape, ctx.fill_value()), {"dtype": ctx.dtype, "device": ctx.device}
+
+
+@_builder("full_like")
+def _full_like(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.fill_value()), {}
+
+
+@_builder("linspace")
+def _linspace(ctx: Context) -> Arguments:
+    return (0, 1, ctx.size), {"dtype": ctx.dtype, "device": ctx.device}
+
+
+@_builder("meshgrid")
+def _meshgrid(ctx: Context) -> Arguments:
+    return (ctx.array((ctx.m,)), ctx.array((ctx.m,))), {}
+
+
+# -- Data type functions ------------------------------------------------------
+
+
+@_builder("astype")
+def _astype(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.default_dtype("real floating")), {}
+
+
+@_builder("can_cast", sized=False)
+def _can_cast(ctx: Context) -> Arguments:
+    return (ctx.dtype, ctx.default_dtype("real floating")), {}
+
+
+@_builder("finfo", "iinfo", sized=False)
+def _finfo(ctx: Context) -> Arguments:
+    return (ctx.dtype,), {}
+
+
+@_builder("isdtype", sized=False)
+def _isdtype(ctx: Context) -> Arguments:
+    return (ctx.dtype, ("integral", "real floating")), {}
+
+
+@_builder("result_type", sized=False)
+def _result_type(ctx: Context) -> Arguments:
+    return (ctx.dtype, ctx.default_dtype("real floating")), {}
+
+
+# -- Elementwise functions ----------------------------------------------------
+
+
+@_builder("bitwise_left_shift", "bitwise_right_shift")
+def _bitwise_left_shift(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.array() % 4), {}
+
+
+@_builder("clip")
+def _clip(ctx: Context) -> Arguments:
+    bounds = {"min": ctx.array(low=0.2, high=0.3), "max": ctx.array(low=0.7, high=0.8)}
+    return (ctx.array(),), bounds
+
+
+# -- Indexing functions -------------------------------------------------------
+
+
+# Accumulation is the common use of scattering (e.g., for sparse gradients).
+@_builder("put", axes=(0, -1))
+def _put(ctx: Context) -> Arguments:
+    indices = ctx.indices((ctx.m,), ctx.m)
+    return (ctx.array(), indices, ctx.array()), {"reduction": "add"}
+
+
+@_builder("put_along_axis")
+def _put_along_axis(ctx: Context) -> Arguments:
+    indices = ctx.indices((ctx.m, ctx.m), ctx.m)
+    return (ctx.array(), indices, ctx.array()), {"reduction": "add"}
+
+
+@_builder("take", axes=(0, -1))
+def _take(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.indices((ctx.m,), ctx.m)), {}
+
+
+@_builder("take_along_axis")
+def _take_along_axis(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.indices((ctx.m, ctx.m), ctx.m)), {}
+
+
+# -- Linear algebra functions -------------------------------------------------
+
+
+@_builder("einsum")
+def _einsum(ctx: Context) -> Arguments:
+    # A chain of matrix products, whose cost depends on the contraction order.
+    x = ctx.array()
+    return ("ij,jk,kl->il", x, x, ctx.array((ctx.m, 1))), {}
+
+
+@_builder("tensordot", "linalg.tensordot")
+def _tensordot(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.array()), {"axes": 1}
+
+
+# -- Manipulation functions ---------------------------------------------------
+
+
+@_builder("broadcast_arrays")
+def _broadcast_arrays(ctx: Context) -> Arguments:
+    return (ctx.array((1, ctx.m)), ctx.array((ctx.m, 1))), {}
+
+
+@_builder("broadcast_shapes", sized=False)
+def _broadcast_shapes(ctx: Context) -> Arguments:
+    return ((8, 1, 6, 1), (7, 1, 5)), {}
+
+
+@_builder("broadcast_to")
+def _broadcast_to(ctx: Context) -> Arguments:
+    return (ctx.array((1, ctx.m)), (ctx.m, ctx.m)), {}
+
+
+@_builder("concat", "stack")
+def _concat(ctx: Context) -> Arguments:
+    return ([ctx.array(), ctx.array()],), {}
+
+
+@_builder("expand_dims")
+def _expand_dims(ctx: Context) -> Arguments:
+    return (ctx.array(),), {"axis": 0}
+
+
+@_builder("moveaxis")
+def _moveaxis(ctx: Context) -> Arguments:
+    return (ctx.array(), 0, -1), {}
+
+
+@_builder("permute_dims")
+def _permute_dims(ctx: Context) -> Arguments:
+    return (ctx.array(), (1, 0)), {}
+
+
+@_builder("repeat")
+def _repeat(ctx: Context) -> Arguments:
+    return (ctx.array(), 2), {}
+
+
+@_builder("reshape")
+def _reshape(ctx: Context) -> Arguments:
+    return (ctx.array(), (-1,)), {}
+
+
+@_builder("roll")
+def _roll(ctx: Context) -> Arguments:
+    return (ctx.array(), 1), {}
+
+
+@_builder("squeeze")
+def _squeeze(ctx: Context) -> Arguments:
+    return (ctx.array((1, ctx.m, ctx.m)),), {"axis": 0}
+
+
+@_builder("tile")
+def _tile(ctx: Context) -> Arguments:
+    return (ctx.array(), (2, 1)), {}
+
+
+# -- Searching functions ------------------------------------------------------
+
+
+@_builder("searchsorted")
+def _searchsorted(ctx: Context) -> Arguments:
+    x1 = ctx.xp.sort(ctx.array((ctx.m * ctx.m,)))
+    return (x1, ctx.array((ctx.m,))), {}
+
+
+@_builder("where")
+def _where(ctx: Context) -> Arguments:
+    condition = ctx.array(dtype=ctx.xp.bool)
+    return (condition, ctx.array(), ctx.array()), {}
+
+
+# -- Sorting functions --------------------------------------------------------
+
+
+@_builder("argpartition", "partition", axes=(0, -1))
+def _partition(ctx: Context) -> Arguments:
+    return (ctx.array(), ctx.m // 2), {}
+
+
+@_builder("top_k", axes=(0, -1))
+def _top_k(ctx: Context) -> Arguments:
+    return (ctx.array(), min(ctx.m, 10)), {}
+
+
+# -- Statistical functions ----------------------------------------------------
+
+
+# A fixed number of bins, as required by libraries which build computation graphs.
+@_builder("bincount")
+def _bincount(ctx: Context) -> Arguments:
+    shape = (ctx.m * ctx.m,)
+    return (ctx.indices(shape, 64),), {"weights": ctx.array(shape), "length": 64}
+
+
+# Multi-dimensional inputs require an explicit axis.
+@_builder("cumulative_sum", "cumulative_prod", axes=(0, -1))
+def _cumulative_sum(ctx: Context) -> Arguments:
+    return (ctx.array(),), {}
+
+
+@_builder("histogram")
+def _histogram(ctx: Context) -> Arguments:
+    return (ctx.array(),), {"bins": 64}
+
+
+@_builder("merge_moments")
+def _merge_moments(ctx: Context) -> Arguments:
+    x = ctx.array()
+    return (ctx.xp.moments(x, axis=0), ctx.xp.moments(x, axis=0)), {}
+
+
+@_builder("moments_var")
+def _moments_var(ctx: Context) -> Arguments:
+    return (ctx.xp.moments(ctx.array(), axis=0),), {"correction": 1}
+
+
+@_builder("segment_max", "segment_mean", "segment_min", "segment_sum")
+def _segment_sum(ctx: Context) -> Arguments:
+    # Segment indices lie on [1, 64], leaving the first segment empty.
+    ids = ctx.array((ctx.m,), dtype=ctx.default_dtype("integral"))
+    return (ctx.array(), ids, 65), {}
+
+
+# -- Linear algebra extension -------------------------------------------------
+
+
+# Solves against a factorization computed once, outside of the timed call.
+@_builder("linalg.cho_solve")
+def _linalg_cho_solve(ctx: Context) -> Arguments:
+    return (ctx.xp.linalg.cholesky(ctx.spd_matrix()), ctx.array()), {}
+
+
+@_builder("linalg.cholesky", "linalg.eigh", "linalg.eigvalsh")
+def _linalg_cholesky(ctx: Context) -> Arguments:
+    return (ctx.spd_matrix(),), {}
+
+
+@_builder(
+    "linalg.det",
+    "linalg.eig",
+    "linalg.eigvals",
+    "linalg.inv",
+    "linalg.lu_factor",
+    "linalg.slogdet",
+)
+def _linalg_det(ctx: Context) -> Arguments:
+    return (ctx.matrix(),), {}
+
+
+@_builder("linalg.cross", axes=(-1,))
+def _linalg_cross(ctx: Context) -> Arguments:
+    shape = (max(1, (ctx.size or 3) // 3), 3)
+    return (ctx.array(shape), ctx.array(shape)), {}
+
+
+# An overdetermined system, as in linear regression.
+@_builder("linalg.lstsq")
+def _linalg_lstsq(ctx: Context) -> Arguments:
+    shape = (ctx.m, max(1, ctx.m // 2))
+    return (ctx.array(shape), ctx.array((ctx.m,))), {}
+
+
+@_builder("linalg.lu_solve")
+def _linalg_lu_solve(ctx: Context) -> Arguments:
+    return (ctx.xp.linalg.lu_factor(ctx.matrix()), ctx.array()), {}
+
+
+@_builder("linalg.matrix_power")
+def _linalg_matrix_power(ctx: Context) -> Arguments:
+    return (ctx.matrix(), 3), {}
+
+
+# A chain ending with a vector, whose left-to-right evaluation is the most
+# expensive order.
+@_builder("linalg.multi_dot")
+def _linalg_multi_dot(ctx: Context) -> Arguments:
+    return ([ctx.matrix(), ctx.matrix(), ctx.array((ctx.m,))],), {}
+
+
+@_builder("linalg.outer")
+def _linalg_outer(ctx: Context) -> Arguments:
+    return (ctx.array((ctx.m,)), ctx.array((ctx.m,))), {}
+
+
+@_builder("linalg.solve")
+def _linalg_solve(ctx: Context) -> Arguments:
+    return (ctx.matrix(), ctx.array()), {}
+
+
+@_builder("linalg.solve_triangular")
+def _linalg_solve_triangular(ctx: Context) -> Arguments:
+    return (ctx.matrix(), ctx.array()), {"upper": True}
+
+
+# -- Fourier transform extension ----------------------------------------------
+
+
+@_builder("fft.fftfreq", "fft.rfftfreq")
+def _fft_fftfreq(ctx: Context) -> Arguments:
+    return (ctx.size,), {"dtype": ctx.dtype, "device": ctx.device}
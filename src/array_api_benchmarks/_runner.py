@@ -0,0 +1,190 @@
+"""
+Timing of benchmark cases against an array API namespace.
+"""
+from __future__ import annotations
+
+__all__ = ["run_benchmarks"]
+
+import datetime
+import platform
+import statistics
+import sys
+import timeit
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from ._cases import Case, Context, discover_cases
+
+SCHEMA_VERSION = 1
+
+DEFAULT_SIZES = (10_000, 1_000_000)
+
+
+def _default_dtype_names(info: Any, device: Any) -> List[str]:
+    names = {dt: name for name, dt in info.dtypes(device=device).items()}
+    defaults = info.default_dtypes(device=device)
+    kinds = ("real floating", "complex floating", "integral")
+    return ["bool"] + [names[defaults[kind]] for kind in kinds]
+
+
+def _library(xp: Any) -> Dict[str, Optional[str]]:
+    name = getattr(xp, "__name__", type(xp).__name__)
+    module = sys.modules.get(name.split(".")[0])
+    return {"name": name, "version": getattr(module, "__version__", None)}
+
+
+def _shape(args: Sequence[Any]) -> Optional[List[int]]:
+    for arg in args:
+        if isinstance(arg, (list, tuple)) and arg:
+            arg = arg[0]
+        shape = getattr(arg, "shape", None)
+        if shape is not None:
+            return list(shape)
+    return None
+
+
+def _autorange(timer: timeit.Timer, min_time: float) -> int:
+    # Mirrors ``timeit.Timer.autorange``, but with a configurable time budget.
+    i = 1
+    while True:
+        for j in (1, 2, 5):
+            number = i * j
+            if timer.timeit(number) >= min_time:
+                return number
+        i *= 10
+
+
+def _time(call: Callable[[], Any], *, repeat: int, min_time: float) -> Dict[str, Any]:
+    timer = timeit.Timer(call)
+    number = _autorange(timer, min_time)
+    times = [t / number for t in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "times": times,
+        "best": min(times),
+        "median": statistics.median(times),
+    }
+
+
+def _points(
+    xp: Any,
+    cases: Sequence[Case],
+    dtypes: Dict[str, Any],
+    sizes: Sequence[int],
+) -> Iterator[tuple]:
+    for case in cases:
+        for dtype_name, dtype in dtypes.items():
+            # Data types which the specification does not require a function to
+            # support are skipped rather than reported as errors.
+            if not case.accepts(xp, dtype):
+                continue
+            for size in sizes if case.sized else (None,):
+                for axis in case.axes or (None,):
+                    yield case, dtype_name, size, axis
+
+
+def run_benchmarks(
+    xp: Any,
+    *,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    dtypes: Optional[Sequence[str]] = None,
+    functions: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.01,
+    sync: Optional[Callable[[Any], Any]] = None,
+    progress: Optional[Callable[[str], Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Times every function stubbed in the draft specification against ``xp``.
+
+    Parameters
+    ----------
+    xp: Any
+        array API namespace. Must expose ``__array_namespace_info__``.
+    sizes: Sequence[int]
+        approximate number of elements in each input array. Default: ``(10_000, 1_000_000)``.
+    dtypes: Optional[Sequence[str]]
+        names of the data types to benchmark (e.g., ``"float32"``). By default, ``"bool"`` and the default real-valued floating-point, complex floating-point, and integral data types of ``xp`` are benchmarked.
+    functions: Optional[Sequence[str]]
+        ``fnmatch``-style patterns selecting which functions to benchmark (e.g., ``"linalg.*"``). By default, all functions are benchmarked.
+    repeat: int
+        number of timing samples to collect for each benchmark point. Default: ``5``.
+    min_time: float
+        minimum duration, in seconds, of each timing sample. Fast functions are called repeatedly until this duration is reached. Default: ``0.01``.
+    sync: Optional[Callable[[Any], Any]]
+        callable invoked on the output of every function call before the call is considered complete. Lazy or asynchronous libraries should use this to force evaluation (e.g., ``lambda out: out.compute()``). Default: ``None``.
+    progress: Optional[Callable[[str], Any]]
+        callable invoked with a short description of each benchmark point before it is run. Default: ``None``.
+
+    Returns
+    -------
+    out: Dict[str, Any]
+        JSON-serializable benchmark report. Each entry in ``out["results"]`` describes one benchmark point, with a ``"status"`` of ``"ok"``, ``"error"`` (the function raised for the given inputs) or ``"missing"`` (``xp`` does not provide the function). Data types which a function is not required to support (e.g., ``bool`` for ``sin``) are skipped.
+    """
+    info = xp.__array_namespace_info__()
+    device = info.default_device()
+    available = info.dtypes(device=device)
+    if dtypes is None:
+        dtypes = _default_dtype_names(info, device)
+    unknown = [name for name in dtypes if name not in available]
+    if unknown:
+        raise ValueError(f"data types not supported by the namespace: {unknown}")
+    cases = discover_cases(functions)
+
+    results = []
+    selected = {name: available[name] for name in dtypes}
+    for case, dtype_name, size, axis in _points(xp, cases, selected, sizes):
+        result: Dict[str, Any] = {
+            "function": case.name,
+            "module": case.module,
+            "dtype": dtype_name,
+            "size": size,
+            "shape": None,
+            "parameters": {"axis": axis} if case.axes else {},
+        }
+        results.append(result)
+        if progress is not None:
+            desc = ", ".join(f"{k}={v}" for k, v in result["parameters"].items())
+            progress(
+                f"{case.name}[{dtype_name}, size={size}{', ' if desc else ''}{desc}]"
+            )
+        func = case.resolve(xp)
+        if func is None:
+            result["status"] = "missing"
+            continue
+        ctx = Context(xp, available[dtype_name], size, device)
+        try:
+            args, kwargs = case.arguments(ctx, axis)
+            result["shape"] = _shape(args)
+
+            def call(func=func, args=args, kwargs=kwargs):
+                out = func(*args, **kwargs)
+                if sync is not None:
+                    sync(out)
+
+            # Calling once outside of the timer both surfaces errors and
+            # absorbs one-time costs (e.g., kernel compilation).
+            call()
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+            continue
+        result["status"] = "ok"
+        result.update(_time(call, repeat=repeat, min_time=min_time))
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "library": _library(xp),
+        "array_api_version": getattr(xp, "__array_api_version__", None),
+        "device": str(device),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "config": {
+            "sizes": list(sizes),
+            "dtypes": list(dtypes),
+            "functions": list(functions) if functions else None,
+            "repeat": repeat,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
@@ -0,0 +1,108 @@
+"""
+Cold-import benchmarks for the ``array_api_stubs`` package.
+
+Each statement is timed in a fresh interpreter, such that no module imported by
+a previous measurement is cached in ``sys.modules``. Example::
+
+    python -m array_api_benchmarks.imports -o imports.json
+"""
+from __future__ import annotations
+
+__all__ = ["DEFAULT_STATEMENTS", "time_imports"]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, Optional, Sequence
+
+DEFAULT_STATEMENTS = (
+    "import array_api_stubs",
+    "from array_api_stubs import _draft",
+    "from array_api_stubs import _2021_12, _2022_12, _2023_12, _2024_12, _2025_12, _draft",
+)
+
+_SCRIPT = """\
+import sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(elapsed, sum(m.startswith("array_api_stubs") for m in sys.modules))
+"""
+
+
+def _measure(statement: str) -> tuple:
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, statement],
+        # Resolve ``array_api_stubs`` exactly as the calling interpreter does.
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    elapsed, modules = out.split()
+    return float(elapsed), int(modules)
+
+
+def time_imports(
+    statements: Sequence[str] = DEFAULT_STATEMENTS, *, repeat: int = 10
+) -> Dict[str, Any]:
+    """
+    Times cold imports of the stubs package.
+
+    Parameters
+    ----------
+    statements: Sequence[str]
+        import statements to time. Default: importing the package alone, the draft stubs, and all versions of the stubs.
+    repeat: int
+        number of fresh interpreters in which each statement is timed. Default: ``10``.
+
+    Returns
+    -------
+    out: Dict[str, Any]
+        JSON-serializable report with one result per statement. Each result records the per-interpreter import ``times`` (in seconds), their ``best`` and ``median``, and the number of ``array_api_stubs`` modules loaded by the statement.
+    """
+    results = []
+    for statement in statements:
+        # The first interpreter writes bytecode caches and is not recorded.
+        _measure(statement)
+        samples = [_measure(statement) for _ in range(repeat)]
+        times = [t for t, _ in samples]
+        results.append(
+            {
+                "statement": statement,
+                "modules": samples[0][1],
+                "times": times,
+                "best": min(times),
+                "median": statistics.median(times),
+            }
+        )
+    return {"python": sys.version.split()[0], "repeat": repeat, "results": results}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m array_api_benchmarks.imports",
+        description="Time cold imports of the array_api_stubs package.",
+    )
+    parser.add_argument("statements", nargs="*", default=list(DEFAULT_STATEMENTS))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "-o", "--output", help="file to write the JSON report to (default: stdout)"
+    )
+    args = parser.parse_args(argv)
+    report = time_imports(args.statements, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
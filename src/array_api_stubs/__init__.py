@@ -1 +1,17 @@
-from . import _2021_12, _2022_12, _2023_12, _2024_12, _draft
+"""Function stubs and API documentation for the array API standard."""
+import importlib
+
+# Each version of the specification is a sizeable module tree, so versions are
+# imported on first access (PEP 562) rather than when the package is imported.
+_VERSIONS = ("_2021_12", "_2022_12", "_2023_12", "_2024_12", "_2025_12", "_draft")
+_SUBMODULES = _VERSIONS + ("reference", "signatures", "special_cases")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
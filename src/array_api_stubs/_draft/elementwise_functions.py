@@ -26,6 +26,7 @@ __all__ = [
     "expm1",
     "floor",
     "floor_divide",
+    "fma",
     "greater",
     "greater_equal",
     "hypot",
@@ -72,7 +73,7 @@ __all__ = [
 from ._types import Optional, Union, array
 
 
-def abs(x: array, /) -> array:
+def abs(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates the absolute value for each element ``x_i`` of the input array ``x``.
 
@@ -97,6 +98,8 @@ def abs(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -126,10 +129,13 @@ def abs(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def acos(x: array, /) -> array:
+def acos(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation of the principal value of the inverse cosine for each element ``x_i`` of the input array ``x``.
 
@@ -160,6 +166,8 @@ def acos(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -195,10 +203,13 @@ def acos(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def acosh(x: array, /) -> array:
+def acosh(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the inverse hyperbolic cosine for each element ``x_i`` of the input array ``x``.
 
@@ -234,6 +245,8 @@ def acosh(x: array, /) -> array:
     ----------
     x: array
         input array whose elements each represent the area of a hyperbolic sector. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -269,11 +282,18 @@ def acosh(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def add(
-    x1: Union[array, int, float, complex], x2: Union[array, int, float, complex], /
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the sum for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -284,6 +304,8 @@ def add(
         first input array. Should have a numeric data type.
     x2: Union[array, int, float, complex]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -344,10 +366,13 @@ def add(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def asin(x: array, /) -> array:
+def asin(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation of the principal value of the inverse sine for each element ``x_i`` of the input array ``x``.
 
@@ -378,6 +403,8 @@ def asin(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -401,10 +428,13 @@ def asin(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def asinh(x: array, /) -> array:
+def asinh(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the inverse hyperbolic sine for each element ``x_i`` in the input array ``x``.
 
@@ -433,6 +463,8 @@ def asinh(x: array, /) -> array:
     ----------
     x: array
         input array whose elements each represent the area of a hyperbolic sector. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -466,10 +498,13 @@ def asinh(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def atan(x: array, /) -> array:
+def atan(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation of the principal value of the inverse tangent for each element ``x_i`` of the input array ``x``.
 
@@ -495,6 +530,8 @@ def atan(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -518,10 +555,19 @@ def atan(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def atan2(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def atan2(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Calculates an implementation-dependent approximation of the inverse tangent of the quotient ``x1/x2``, having domain ``[-infinity, +infinity] x [-infinity, +infinity]`` (where the ``x`` notation denotes the set of ordered pairs of elements ``(x1_i, x2_i)``) and codomain ``[-π, +π]``, for each pair of elements ``(x1_i, x2_i)`` of the input arrays ``x1`` and ``x2``, respectively. Each element-wise result is expressed in radians.
 
@@ -538,6 +584,8 @@ def atan2(x1: Union[array, int, float], x2: Union[array, int, float], /) -> arra
         input array corresponding to the y-coordinates. Should have a real-valued floating-point data type.
     x2: Union[array, int, float]
         input array corresponding to the x-coordinates. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -579,10 +627,13 @@ def atan2(x1: Union[array, int, float], x2: Union[array, int, float], /) -> arra
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def atanh(x: array, /) -> array:
+def atanh(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the inverse hyperbolic tangent for each element ``x_i`` of the input array ``x``.
 
@@ -611,6 +662,8 @@ def atanh(x: array, /) -> array:
     ----------
     x: array
         input array whose elements each represent the area of a hyperbolic sector. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -648,10 +701,19 @@ def atanh(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def bitwise_and(x1: Union[array, int, bool], x2: Union[array, int, bool], /) -> array:
+def bitwise_and(
+    x1: Union[array, int, bool],
+    x2: Union[array, int, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Computes the bitwise AND of the underlying binary representation of each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -661,6 +723,8 @@ def bitwise_and(x1: Union[array, int, bool], x2: Union[array, int, bool], /) ->
         first input array. Should have an integer or boolean data type.
     x2: Union[array, int, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have an integer or boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -674,10 +738,15 @@ def bitwise_and(x1: Union[array, int, bool], x2: Union[array, int, bool], /) ->
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def bitwise_left_shift(x1: Union[array, int], x2: Union[array, int], /) -> array:
+def bitwise_left_shift(
+    x1: Union[array, int], x2: Union[array, int], /, *, out: Optional[array] = None
+) -> array:
     """
     Shifts the bits of each element ``x1_i`` of the input array ``x1`` to the left by appending ``x2_i`` (i.e., the respective element in the input array ``x2``) zeros to the right of ``x1_i``.
 
@@ -687,6 +756,8 @@ def bitwise_left_shift(x1: Union[array, int], x2: Union[array, int], /) -> array
         first input array. Should have an integer data type.
     x2: Union[array, int]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have an integer data type. Each element must be greater than or equal to ``0``.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -700,10 +771,13 @@ def bitwise_left_shift(x1: Union[array, int], x2: Union[array, int], /) -> array
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def bitwise_invert(x: array, /) -> array:
+def bitwise_invert(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Inverts (flips) each bit for each element ``x_i`` of the input array ``x``.
 
@@ -711,15 +785,29 @@ def bitwise_invert(x: array, /) -> array:
     ----------
     x: array
         input array. Should have an integer or boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
     out: array
         an array containing the element-wise results. The returned array must have the same data type as ``x``.
+
+    Notes
+    -----
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def bitwise_or(x1: Union[array, int, bool], x2: Union[array, int, bool], /) -> array:
+def bitwise_or(
+    x1: Union[array, int, bool],
+    x2: Union[array, int, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Computes the bitwise OR of the underlying binary representation of each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -729,6 +817,8 @@ def bitwise_or(x1: Union[array, int, bool], x2: Union[array, int, bool], /) -> a
         first input array. Should have an integer or boolean data type.
     x2: Union[array, int, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have an integer or boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -742,10 +832,15 @@ def bitwise_or(x1: Union[array, int, bool], x2: Union[array, int, bool], /) -> a
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def bitwise_right_shift(x1: Union[array, int], x2: Union[array, int], /) -> array:
+def bitwise_right_shift(
+    x1: Union[array, int], x2: Union[array, int], /, *, out: Optional[array] = None
+) -> array:
     """
     Shifts the bits of each element ``x1_i`` of the input array ``x1`` to the right according to the respective element ``x2_i`` of the input array ``x2``.
 
@@ -758,6 +853,8 @@ def bitwise_right_shift(x1: Union[array, int], x2: Union[array, int], /) -> arra
         first input array. Should have an integer data type.
     x2: Union[array, int]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have an integer data type. Each element must be greater than or equal to ``0``.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -771,10 +868,19 @@ def bitwise_right_shift(x1: Union[array, int], x2: Union[array, int], /) -> arra
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def bitwise_xor(x1: Union[array, int, bool], x2: Union[array, int, bool], /) -> array:
+def bitwise_xor(
+    x1: Union[array, int, bool],
+    x2: Union[array, int, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Computes the bitwise XOR of the underlying binary representation of each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -784,6 +890,8 @@ def bitwise_xor(x1: Union[array, int, bool], x2: Union[array, int, bool], /) ->
         first input array. Should have an integer or boolean data type.
     x2: Union[array, int, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have an integer or boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -797,10 +905,13 @@ def bitwise_xor(x1: Union[array, int, bool], x2: Union[array, int, bool], /) ->
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def ceil(x: array, /) -> array:
+def ceil(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Rounds each element ``x_i`` of the input array ``x`` to the smallest (i.e., closest to ``-infinity``) integer-valued number that is not less than ``x_i``.
 
@@ -808,6 +919,8 @@ def ceil(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -828,6 +941,9 @@ def ceil(x: array, /) -> array:
     - If ``x_i`` is ``+0``, the result is ``+0``.
     - If ``x_i`` is ``-0``, the result is ``-0``.
     - If ``x_i`` is ``NaN``, the result is ``NaN``.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
@@ -836,6 +952,8 @@ def clip(
     /,
     min: Optional[Union[int, float, array]] = None,
     max: Optional[Union[int, float, array]] = None,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     r"""
     Clamps each element ``x_i`` of the input array ``x`` to the range ``[min, max]``.
@@ -848,6 +966,8 @@ def clip(
       lower-bound of the range to which to clamp. If ``None``, no lower bound must be applied. Must be compatible with ``x`` and ``max`` (see :ref:`broadcasting`). Should have the same data type as ``x``. Default: ``None``.
     max: Optional[Union[int, float, array]]
       upper-bound of the range to which to clamp. If ``None``, no upper bound must be applied. Must be compatible with ``x`` and ``min`` (see :ref:`broadcasting`). Should have the same data type as ``x``. Default: ``None``.
+    out: Optional[array]
+      array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -880,10 +1000,13 @@ def clip(
 
     .. versionchanged:: 2024.12
        Clarified that behavior is only defined when elements of ``min`` and ``max`` are inside the bounds of the input array data type.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def conj(x: array, /) -> array:
+def conj(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Returns the complex conjugate for each element ``x_i`` of the input array ``x``.
 
@@ -903,6 +1026,8 @@ def conj(x: array, /) -> array:
     ----------
     x: array
         input array. Must have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -918,10 +1043,19 @@ def conj(x: array, /) -> array:
 
     .. versionchanged:: 2024.12
        Added support for real-valued arrays.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def copysign(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def copysign(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     r"""
     Composes a floating-point value with the magnitude of ``x1_i`` and the sign of ``x2_i`` for each element of the input array ``x1``.
 
@@ -931,6 +1065,8 @@ def copysign(x1: Union[array, int, float], x2: Union[array, int, float], /) -> a
        input array containing magnitudes. Should have a real-valued floating-point data type.
     x2: Union[array, int, float]
        input array whose sign bits are applied to the magnitudes of ``x1``. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued floating-point data type.
+    out: Optional[array]
+       array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -964,10 +1100,13 @@ def copysign(x1: Union[array, int, float], x2: Union[array, int, float], /) -> a
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def cos(x: array, /) -> array:
+def cos(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the cosine for each element ``x_i`` of the input array ``x``.
 
@@ -988,6 +1127,8 @@ def cos(x: array, /) -> array:
     ----------
     x: array
         input array whose elements are each expressed in radians. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1011,10 +1152,13 @@ def cos(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def cosh(x: array, /) -> array:
+def cosh(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the hyperbolic cosine for each element ``x_i`` in the input array ``x``.
 
@@ -1030,6 +1174,8 @@ def cosh(x: array, /) -> array:
     ----------
     x: array
         input array whose elements each represent a hyperbolic angle. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1074,11 +1220,18 @@ def cosh(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def divide(
-    x1: Union[array, int, float, complex], x2: Union[array, int, float, complex], /
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     r"""
     Calculates the division of each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -1089,6 +1242,8 @@ def divide(
         dividend input array. Should have a numeric data type.
     x2: Union[array, int, float, complex]
         divisor input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1163,6 +1318,9 @@ def divide(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
@@ -1170,6 +1328,8 @@ def equal(
     x1: Union[array, int, float, complex, bool],
     x2: Union[array, int, float, complex, bool],
     /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     r"""
     Computes the truth value of ``x1_i == x2_i`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -1180,6 +1340,8 @@ def equal(
         first input array. May have any data type.
     x2: Union[array, int, float, complex, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). May have any data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1222,10 +1384,13 @@ def equal(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def exp(x: array, /) -> array:
+def exp(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Calculates an implementation-dependent approximation to the exponential function for each element ``x_i`` of the input array ``x`` (``e`` raised to the power of ``x_i``, where ``e`` is the base of the natural logarithm).
 
@@ -1239,6 +1404,8 @@ def exp(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1278,10 +1445,13 @@ def exp(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def expm1(x: array, /) -> array:
+def expm1(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Calculates an implementation-dependent approximation to ``exp(x)-1`` for each element ``x_i`` of the input array ``x``.
 
@@ -1298,6 +1468,8 @@ def expm1(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1337,10 +1509,13 @@ def expm1(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def floor(x: array, /) -> array:
+def floor(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Rounds each element ``x_i`` of the input array ``x`` to the greatest (i.e., closest to ``+infinity``) integer-valued number that is not greater than ``x_i``.
 
@@ -1348,6 +1523,8 @@ def floor(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1368,11 +1545,18 @@ def floor(x: array, /) -> array:
     - If ``x_i`` is ``+0``, the result is ``+0``.
     - If ``x_i`` is ``-0``, the result is ``-0``.
     - If ``x_i`` is ``NaN``, the result is ``NaN``.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def floor_divide(
-    x1: Union[array, int, float], x2: Union[array, int, float], /
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     r"""
     Rounds the result of dividing each element ``x1_i`` of the input array ``x1`` by the respective element ``x2_i`` of the input array ``x2`` to the greatest (i.e., closest to `+infinity`) integer-value number that is not greater than the division result.
@@ -1383,6 +1567,8 @@ def floor_divide(
         dividend input array. Should have a real-valued data type.
     x2: Union[array, int, float]
         divisor input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1433,10 +1619,69 @@ def floor_divide(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
+    """
+
+
+def fma(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    x3: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    r"""
+    Computes the fused multiply-add ``x1_i * x2_i + x3_i`` for each element ``x1_i`` of the input array ``x1`` with the respective elements ``x2_i`` and ``x3_i`` of the input arrays ``x2`` and ``x3``.
+
+    The product and the sum must be computed as a single operation (i.e., as if with unbounded range and precision), with only one rounding of the final result (see :ref:`accuracy`).
+
+    Parameters
+    ----------
+    x1: Union[array, int, float]
+        first input array (multiplicand). Should have a real-valued floating-point data type.
+    x2: Union[array, int, float]
+        second input array (multiplier). Must be compatible with ``x1`` and ``x3`` (see :ref:`broadcasting`). Should have a real-valued floating-point data type.
+    x3: Union[array, int, float]
+        third input array (addend). Must be compatible with ``x1`` and ``x2`` (see :ref:`broadcasting`). Should have a real-valued floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the element-wise results. The returned array must have a real-valued floating-point data type determined by :ref:`type-promotion`.
+
+    Notes
+    -----
+
+    -   At least one of ``x1``, ``x2``, or ``x3`` must be an array.
+    -   Unlike ``add(multiply(x1, x2), x3)``, this function must not round the intermediate product. Accordingly, conforming implementations must not implement this function as a separate multiplication followed by an addition unless doing so produces correctly rounded results (e.g., by performing the intermediate computation in a sufficiently wider floating-point data type and rounding to odd).
+    -   A scaled vector addition (a.k.a., "axpy") ``a * x + y``, where ``a`` is a scalar, may be computed as ``fma(a, x, y)``.
+
+    **Special cases**
+
+    For real-valued floating-point operands,
+
+    - If ``x1_i``, ``x2_i``, or ``x3_i`` is ``NaN``, the result is ``NaN``.
+    - If ``x1_i`` is either ``+infinity`` or ``-infinity`` and ``x2_i`` is either ``+0`` or ``-0``, the result is ``NaN``.
+    - If ``x1_i`` is either ``+0`` or ``-0`` and ``x2_i`` is either ``+infinity`` or ``-infinity``, the result is ``NaN``.
+    - If the exact product ``x1_i * x2_i`` is an infinity and ``x3_i`` is an infinity having the opposite mathematical sign, the result is ``NaN``.
+    - In the remaining cases, the result must be equal to the exact value of ``x1_i * x2_i + x3_i`` rounded once to the output data type, where, if the exact value is zero, the sign of the result must be determined as for :func:`~array_api.add` applied to the exact product ``x1_i * x2_i`` and ``x3_i``.
+
+    .. versionadded:: 2026.12
     """
 
 
-def greater(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def greater(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Computes the truth value of ``x1_i > x2_i`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -1446,6 +1691,8 @@ def greater(x1: Union[array, int, float], x2: Union[array, int, float], /) -> ar
         first input array. Should have a real-valued data type.
     x2: Union[array, int, float]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1464,11 +1711,18 @@ def greater(x1: Union[array, int, float], x2: Union[array, int, float], /) -> ar
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def greater_equal(
-    x1: Union[array, int, float], x2: Union[array, int, float], /
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     """
     Computes the truth value of ``x1_i >= x2_i`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -1479,6 +1733,8 @@ def greater_equal(
         first input array. Should have a real-valued data type.
     x2: Union[array, int, float]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1497,10 +1753,19 @@ def greater_equal(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def hypot(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def hypot(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     r"""
     Computes the square root of the sum of squares for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -1513,6 +1778,8 @@ def hypot(x1: Union[array, int, float], x2: Union[array, int, float], /) -> arra
        first input array. Should have a real-valued floating-point data type.
     x2: Union[array, int, float]
        second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued floating-point data type.
+    out: Optional[array]
+       array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1548,10 +1815,13 @@ def hypot(x1: Union[array, int, float], x2: Union[array, int, float], /) -> arra
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def imag(x: array, /) -> array:
+def imag(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Returns the imaginary component of a complex number for each element ``x_i`` of the input array ``x``.
 
@@ -1559,6 +1829,8 @@ def imag(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a complex floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1569,10 +1841,13 @@ def imag(x: array, /) -> array:
     -----
 
     .. versionadded:: 2022.12
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def isfinite(x: array, /) -> array:
+def isfinite(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Tests each element ``x_i`` of the input array ``x`` to determine if finite.
 
@@ -1580,6 +1855,8 @@ def isfinite(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1606,10 +1883,13 @@ def isfinite(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def isinf(x: array, /) -> array:
+def isinf(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Tests each element ``x_i`` of the input array ``x`` to determine if equal to positive or negative infinity.
 
@@ -1617,6 +1897,8 @@ def isinf(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1641,10 +1923,13 @@ def isinf(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def isnan(x: array, /) -> array:
+def isnan(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Tests each element ``x_i`` of the input array ``x`` to determine whether the element is ``NaN``.
 
@@ -1652,6 +1937,8 @@ def isnan(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1675,10 +1962,19 @@ def isnan(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def less(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def less(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Computes the truth value of ``x1_i < x2_i`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -1688,6 +1984,8 @@ def less(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array
         first input array. Should have a real-valued data type.
     x2: Union[array, int, float]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1706,10 +2004,19 @@ def less(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def less_equal(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def less_equal(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Computes the truth value of ``x1_i <= x2_i`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -1719,6 +2026,8 @@ def less_equal(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
         first input array. Should have a real-valued data type.
     x2: Union[array, int, float]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1737,10 +2046,13 @@ def less_equal(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def log(x: array, /) -> array:
+def log(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the natural (base ``e``) logarithm for each element ``x_i`` of the input array ``x``.
 
@@ -1763,6 +2075,8 @@ def log(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1799,10 +2113,13 @@ def log(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def log1p(x: array, /) -> array:
+def log1p(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to ``log(1+x)``, where ``log`` refers to the natural (base ``e``) logarithm, for each element ``x_i`` of the input array ``x``.
 
@@ -1825,6 +2142,8 @@ def log1p(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1861,10 +2180,13 @@ def log1p(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def log2(x: array, /) -> array:
+def log2(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the base ``2`` logarithm for each element ``x_i`` of the input array ``x``.
 
@@ -1875,6 +2197,8 @@ def log2(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1903,10 +2227,13 @@ def log2(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def log10(x: array, /) -> array:
+def log10(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the base ``10`` logarithm for each element ``x_i`` of the input array ``x``.
 
@@ -1917,6 +2244,8 @@ def log10(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1945,10 +2274,19 @@ def log10(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def logaddexp(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def logaddexp(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Calculates the logarithm of the sum of exponentiations ``log(exp(x1) + exp(x2))`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -1958,6 +2296,8 @@ def logaddexp(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
         first input array. Should have a real-valued floating-point data type.
     x2: Union[array, int, float]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -1979,10 +2319,15 @@ def logaddexp(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def logical_and(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
+def logical_and(
+    x1: Union[array, bool], x2: Union[array, bool], /, *, out: Optional[array] = None
+) -> array:
     """
     Computes the logical AND for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -1995,6 +2340,8 @@ def logical_and(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
         first input array. Should have a boolean data type.
     x2: Union[array, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2008,10 +2355,13 @@ def logical_and(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def logical_not(x: array, /) -> array:
+def logical_not(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Computes the logical NOT for each element ``x_i`` of the input array ``x``.
 
@@ -2022,15 +2372,25 @@ def logical_not(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
     out: array
         an array containing the element-wise results. The returned array must have a data type of ``bool``.
+
+    Notes
+    -----
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def logical_or(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
+def logical_or(
+    x1: Union[array, bool], x2: Union[array, bool], /, *, out: Optional[array] = None
+) -> array:
     """
     Computes the logical OR for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -2043,6 +2403,8 @@ def logical_or(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
         first input array. Should have a boolean data type.
     x2: Union[array, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2056,10 +2418,15 @@ def logical_or(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def logical_xor(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
+def logical_xor(
+    x1: Union[array, bool], x2: Union[array, bool], /, *, out: Optional[array] = None
+) -> array:
     """
     Computes the logical XOR for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
 
@@ -2072,6 +2439,8 @@ def logical_xor(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
         first input array. Should have a boolean data type.
     x2: Union[array, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a boolean data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2085,10 +2454,19 @@ def logical_xor(x1: Union[array, bool], x2: Union[array, bool], /) -> array:
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def maximum(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def maximum(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     r"""
     Computes the maximum value for each element ``x1_i`` of the input array ``x1`` relative to the respective element ``x2_i`` of the input array ``x2``.
 
@@ -2098,6 +2476,8 @@ def maximum(x1: Union[array, int, float], x2: Union[array, int, float], /) -> ar
        first input array. Should have a real-valued data type.
     x2: Union[array, int, float]
        second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+       array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2121,10 +2501,19 @@ def maximum(x1: Union[array, int, float], x2: Union[array, int, float], /) -> ar
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def minimum(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def minimum(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     r"""
     Computes the minimum value for each element ``x1_i`` of the input array ``x1`` relative to the respective element ``x2_i`` of the input array ``x2``.
 
@@ -2134,6 +2523,8 @@ def minimum(x1: Union[array, int, float], x2: Union[array, int, float], /) -> ar
        first input array. Should have a real-valued data type.
     x2: Union[array, int, float]
        second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+       array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2157,11 +2548,18 @@ def minimum(x1: Union[array, int, float], x2: Union[array, int, float], /) -> ar
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def multiply(
-    x1: Union[array, int, float, complex], x2: Union[array, int, float, complex], /
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     r"""
     Calculates the product for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -2175,6 +2573,8 @@ def multiply(
         first input array. Should have a numeric data type.
     x2: Union[array, int, float, complex]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2232,10 +2632,13 @@ def multiply(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def negative(x: array, /) -> array:
+def negative(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Computes the numerical negative of each element ``x_i`` (i.e., ``y_i = -x_i``) of the input array ``x``.
 
@@ -2249,6 +2652,8 @@ def negative(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2260,10 +2665,19 @@ def negative(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def nextafter(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def nextafter(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Returns the next representable floating-point value for each element ``x1_i`` of the input array ``x1`` in the direction of the respective element ``x2_i`` of the input array ``x2``.
 
@@ -2273,6 +2687,8 @@ def nextafter(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
         first input array. Should have a real-valued floating-point data type.
     x2: Union[array, int, float]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have the same data type as ``x1``.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2293,6 +2709,9 @@ def nextafter(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
     - If ``x1_i`` is ``+0`` and ``x2_i`` is ``-0``, the result is ``-0``.
 
     .. versionadded:: 2024.12
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
@@ -2300,6 +2719,8 @@ def not_equal(
     x1: Union[array, int, float, complex, bool],
     x2: Union[array, int, float, complex, bool],
     /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     """
     Computes the truth value of ``x1_i != x2_i`` for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -2310,6 +2731,8 @@ def not_equal(
         first input array. May have any data type.
     x2: Union[array, int, float, complex, bool]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`).
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2350,10 +2773,13 @@ def not_equal(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def positive(x: array, /) -> array:
+def positive(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Computes the numerical positive of each element ``x_i`` (i.e., ``y_i = +x_i``) of the input array ``x``.
 
@@ -2361,6 +2787,8 @@ def positive(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2372,11 +2800,18 @@ def positive(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def pow(
-    x1: Union[array, int, float, complex], x2: Union[array, int, float, complex], /
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     r"""
     Calculates an implementation-dependent approximation of exponentiation by raising each element ``x1_i`` (the base) of the input array ``x1`` to the power of ``x2_i`` (the exponent), where ``x2_i`` is the corresponding element of the input array ``x2``.
@@ -2387,6 +2822,8 @@ def pow(
         first input array whose elements correspond to the exponentiation base. Should have a numeric data type.
     x2: Union[array, int, float, complex]
         second input array whose elements correspond to the exponentiation exponent. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2447,10 +2884,13 @@ def pow(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def real(x: array, /) -> array:
+def real(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Returns the real component of a complex number for each element ``x_i`` of the input array ``x``.
 
@@ -2458,6 +2898,8 @@ def real(x: array, /) -> array:
     ----------
     x: array
         input array. Must have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2473,10 +2915,13 @@ def real(x: array, /) -> array:
 
     .. versionchanged:: 2024.12
        Added support for real-valued arrays.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def reciprocal(x: array, /) -> array:
+def reciprocal(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Returns the reciprocal for each element ``x_i`` of the input array ``x``.
 
@@ -2484,6 +2929,8 @@ def reciprocal(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2498,10 +2945,19 @@ def reciprocal(x: array, /) -> array:
     For floating-point operands, special cases must be handled as if the operation is implemented as ``1.0 / x`` (see :func:`~array_api.divide`).
 
     .. versionadded:: 2024.12
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def remainder(x1: Union[array, int, float], x2: Union[array, int, float], /) -> array:
+def remainder(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
     """
     Returns the remainder of division for each element ``x1_i`` of the input array ``x1`` and the respective element ``x2_i`` of the input array ``x2``.
 
@@ -2514,6 +2970,8 @@ def remainder(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
         dividend input array. Should have a real-valued data type.
     x2: Union[array, int, float]
         divisor input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2556,10 +3014,13 @@ def remainder(x1: Union[array, int, float], x2: Union[array, int, float], /) ->
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def round(x: array, /) -> array:
+def round(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Rounds each element ``x_i`` of the input array ``x`` to the nearest integer-valued number.
 
@@ -2572,6 +3033,8 @@ def round(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2599,10 +3062,13 @@ def round(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def sign(x: array, /) -> array:
+def sign(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Returns an indication of the sign of a number for each element ``x_i`` of the input array ``x``.
 
@@ -2620,6 +3086,8 @@ def sign(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2646,10 +3114,13 @@ def sign(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def signbit(x: array, /) -> array:
+def signbit(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Determines whether the sign bit is set for each element ``x_i`` of the input array ``x``.
 
@@ -2659,6 +3130,8 @@ def signbit(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a real-valued floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2682,10 +3155,13 @@ def signbit(x: array, /) -> array:
     - If ``x_i`` is ``NaN`` and the sign bit of ``x_i`` is ``1``, the result is ``True``.
 
     .. versionadded:: 2023.12
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def sin(x: array, /) -> array:
+def sin(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the sine for each element ``x_i`` of the input array ``x``.
 
@@ -2706,6 +3182,8 @@ def sin(x: array, /) -> array:
     ----------
     x: array
         input array whose elements are each expressed in radians. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2728,10 +3206,13 @@ def sin(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def sinh(x: array, /) -> array:
+def sinh(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the hyperbolic sine for each element ``x_i`` of the input array ``x``.
 
@@ -2747,6 +3228,8 @@ def sinh(x: array, /) -> array:
     ----------
     x: array
         input array whose elements each represent a hyperbolic angle. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2791,10 +3274,13 @@ def sinh(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def square(x: array, /) -> array:
+def square(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Squares each element ``x_i`` of the input array ``x``.
 
@@ -2807,6 +3293,8 @@ def square(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2822,10 +3310,13 @@ def square(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def sqrt(x: array, /) -> array:
+def sqrt(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates the principal square root for each element ``x_i`` of the input array ``x``.
 
@@ -2848,6 +3339,8 @@ def sqrt(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2881,11 +3374,18 @@ def sqrt(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
 def subtract(
-    x1: Union[array, int, float, complex], x2: Union[array, int, float, complex], /
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the difference for each element ``x1_i`` of the input array ``x1`` with the respective element ``x2_i`` of the input array ``x2``.
@@ -2896,6 +3396,8 @@ def subtract(
         first input array. Should have a numeric data type.
     x2: Union[array, int, float, complex]
         second input array. Must be compatible with ``x1`` (see :ref:`broadcasting`). Should have a numeric data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2913,10 +3415,13 @@ def subtract(
 
     .. versionchanged:: 2024.12
        Added scalar argument support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def tan(x: array, /) -> array:
+def tan(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the tangent for each element ``x_i`` of the input array ``x``.
 
@@ -2937,6 +3442,8 @@ def tan(x: array, /) -> array:
     ----------
     x: array
         input array whose elements are expressed in radians. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -2959,10 +3466,13 @@ def tan(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def tanh(x: array, /) -> array:
+def tanh(x: array, /, *, out: Optional[array] = None) -> array:
     r"""
     Calculates an implementation-dependent approximation to the hyperbolic tangent for each element ``x_i`` of the input array ``x``.
 
@@ -2980,6 +3490,8 @@ def tanh(x: array, /) -> array:
     ----------
     x: array
         input array whose elements each represent a hyperbolic angle. Should have a floating-point data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -3026,10 +3538,13 @@ def tanh(x: array, /) -> array:
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
-def trunc(x: array, /) -> array:
+def trunc(x: array, /, *, out: Optional[array] = None) -> array:
     """
     Rounds each element ``x_i`` of the input array ``x`` to the nearest integer-valued number that is closer to zero than ``x_i``.
 
@@ -3037,6 +3552,8 @@ def trunc(x: array, /) -> array:
     ----------
     x: array
         input array. Should have a real-valued data type.
+    out: Optional[array]
+        array into which the result must be written (see :ref:`out-keyword-argument`). If provided, ``out`` must have the shape and data type of the result, and the function must return ``out``. If ``None``, the result must be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -3057,4 +3574,7 @@ def trunc(x: array, /) -> array:
     - If ``x_i`` is ``+0``, the result is ``+0``.
     - If ``x_i`` is ``-0``, the result is ``-0``.
     - If ``x_i`` is ``NaN``, the result is ``NaN``.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
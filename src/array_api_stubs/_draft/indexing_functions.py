@@ -1,6 +1,120 @@
-__all__ = ["take", "take_along_axis"]
+__all__ = ["put", "put_along_axis", "take", "take_along_axis"]
 
-from ._types import Union, Optional, array
+from ._types import Literal, Union, Optional, array
+
+
+def put(
+    x: array,
+    indices: array,
+    values: Union[int, float, complex, bool, array],
+    /,
+    *,
+    axis: Optional[int] = None,
+    reduction: Literal["replace", "add", "multiply", "max", "min"] = "replace",
+) -> array:
+    """
+    Returns a copy of an array with values written at the specified indices along an axis.
+
+    This function is the counterpart of :func:`~array_api.take`: the elements of the returned array at the positions selected by ``take(x, indices, axis=axis)`` **must** be combined with the corresponding elements of ``values`` according to ``reduction``, and all other elements **must** equal the corresponding elements of ``x``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have one or more axes.
+    indices: array
+        array indices. The array **must** be one-dimensional and have an integer data type. If an index is negative, the function **must** determine the position along a specified axis by counting from the last element (where ``-1`` refers to the last element). Indices **may** contain duplicates.
+    values: Union[int, float, complex, bool, array]
+        values to write. **Must** be compatible with the shape of ``take(x, indices, axis=axis)`` (see :ref:`broadcasting`).
+    axis: Optional[int]
+        axis along which to write values. If ``axis`` is negative, the function **must** determine the axis along which to write values by counting from the last axis (where ``-1`` refers to the last axis).
+
+        If ``x`` is a one-dimensional array, providing an ``axis`` **must** be optional; however, if ``x`` has more than one axis, providing an ``axis`` **must** be required.
+    reduction: Literal["replace", "add", "multiply", "max", "min"]
+        how ``values`` **must** be combined with the elements of ``x`` at the positions specified by ``indices``. **Must** be one of the following:
+
+        -   ``"replace"``: an element **must** be replaced by a corresponding element of ``values``.
+        -   ``"add"``: an element **must** be replaced by its sum with every corresponding element of ``values`` (see :func:`~array_api.add`).
+        -   ``"multiply"``: an element **must** be replaced by its product with every corresponding element of ``values`` (see :func:`~array_api.multiply`).
+        -   ``"max"``: an element **must** be replaced by the maximum of itself and every corresponding element of ``values`` (see :func:`~array_api.maximum`).
+        -   ``"min"``: an element **must** be replaced by the minimum of itself and every corresponding element of ``values`` (see :func:`~array_api.minimum`).
+
+        Default: ``"replace"``.
+
+    Returns
+    -------
+    out: array
+        an array having the same shape and data type as ``x``.
+
+    Notes
+    -----
+
+    -   This function **must not** modify ``x``. Unlike in-place updates via ``__setitem__`` (see :meth:`array.__setitem__`), the result is well-defined when ``indices`` contains duplicate indices: for each reduction other than ``"replace"``, every element of ``values`` **must** contribute to the result (e.g., ``"add"`` accumulates all values written to the same position). The order in which contributions are combined is unspecified and thus implementation-defined; accordingly, for floating-point data types, results of ``"add"`` and ``"multiply"`` **may** differ by rounding. For ``"replace"``, which of the values written to the same position is retained is unspecified and thus implementation-defined.
+
+    -   ``values`` **must** be promoted to the data type of ``x`` according to :ref:`type-promotion`, and the returned array **must** have the same data type as ``x``. If this is not supported according to :ref:`type-promotion`, behavior is unspecified and thus implementation-defined.
+
+    -   For ``"add"`` and ``"multiply"``, ``x`` **should** have a numeric data type. For ``"max"`` and ``"min"``, ``x`` **should** have a real-valued data type, and ``NaN`` values **must** propagate.
+
+    -   This specification does not require bounds checking. The behavior for out-of-bounds indices is unspecified and thus implementation-defined.
+
+    -   When ``x`` is a zero-dimensional array, behavior is unspecified and thus implementation-defined.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def put_along_axis(
+    x: array,
+    indices: array,
+    values: Union[int, float, complex, bool, array],
+    /,
+    *,
+    axis: int = -1,
+    reduction: Literal["replace", "add", "multiply", "max", "min"] = "replace",
+) -> array:
+    """
+    Returns a copy of an array with values written at the one-dimensional indices specified by ``indices`` along a provided ``axis``.
+
+    This function is the counterpart of :func:`~array_api.take_along_axis`: the elements of the returned array at the positions selected by ``take_along_axis(x, indices, axis=axis)`` **must** be combined with the corresponding elements of ``values`` according to ``reduction``, and all other elements **must** equal the corresponding elements of ``x``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Must** be compatible with ``indices``, except for the axis specified by ``axis`` (see :ref:`broadcasting`).
+    indices: array
+        array indices. **Must** have the same number of axes as ``x`` and **must** be compatible with ``x``, except for the axis specified by ``axis`` (see :ref:`broadcasting`). If an index is negative, the function **must** determine the position along a specified axis by counting from the last element (where ``-1`` refers to the last element). Indices **may** contain duplicates.
+    values: Union[int, float, complex, bool, array]
+        values to write. **Must** be compatible with the shape of ``take_along_axis(x, indices, axis=axis)`` (see :ref:`broadcasting`).
+    axis: int
+        axis along which to write values. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``-1``.
+    reduction: Literal["replace", "add", "multiply", "max", "min"]
+        how ``values`` **must** be combined with the elements of ``x`` at the positions specified by ``indices``. **Must** be one of the following:
+
+        -   ``"replace"``: an element **must** be replaced by a corresponding element of ``values``.
+        -   ``"add"``: an element **must** be replaced by its sum with every corresponding element of ``values`` (see :func:`~array_api.add`).
+        -   ``"multiply"``: an element **must** be replaced by its product with every corresponding element of ``values`` (see :func:`~array_api.multiply`).
+        -   ``"max"``: an element **must** be replaced by the maximum of itself and every corresponding element of ``values`` (see :func:`~array_api.maximum`).
+        -   ``"min"``: an element **must** be replaced by the minimum of itself and every corresponding element of ``values`` (see :func:`~array_api.minimum`).
+
+        Default: ``"replace"``.
+
+    Returns
+    -------
+    out: array
+        an array having the same shape and data type as ``x``.
+
+    Notes
+    -----
+
+    -   This function **must not** modify ``x``. Unlike in-place updates via ``__setitem__`` (see :meth:`array.__setitem__`), the result is well-defined when ``indices`` contains duplicate indices: for each reduction other than ``"replace"``, every element of ``values`` **must** contribute to the result (e.g., ``"add"`` accumulates all values written to the same position). The order in which contributions are combined is unspecified and thus implementation-defined; accordingly, for floating-point data types, results of ``"add"`` and ``"multiply"`` **may** differ by rounding. For ``"replace"``, which of the values written to the same position is retained is unspecified and thus implementation-defined.
+
+    -   ``values`` **must** be promoted to the data type of ``x`` according to :ref:`type-promotion`, and the returned array **must** have the same data type as ``x``. If this is not supported according to :ref:`type-promotion`, behavior is unspecified and thus implementation-defined.
+
+    -   For ``"add"`` and ``"multiply"``, ``x`` **should** have a numeric data type. For ``"max"`` and ``"min"``, ``x`` **should** have a real-valued data type, and ``NaN`` values **must** propagate.
+
+    -   This specification does not require bounds checking. The behavior for out-of-bounds indices is unspecified and thus implementation-defined.
+
+    .. versionadded:: 2026.12
+    """
 
 
 def take(x: array, indices: array, /, *, axis: Optional[int] = None) -> array:
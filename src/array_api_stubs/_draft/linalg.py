@@ -1,4 +1,5 @@
 __all__ = [
+    "cho_solve",
     "cholesky",
     "cross",
     "det",
@@ -8,16 +9,21 @@ __all__ = [
     "eigvals",
     "eigvalsh",
     "inv",
+    "lstsq",
+    "lu_factor",
+    "lu_solve",
     "matmul",
     "matrix_norm",
     "matrix_power",
     "matrix_rank",
     "matrix_transpose",
+    "multi_dot",
     "outer",
     "pinv",
     "qr",
     "slogdet",
     "solve",
+    "solve_triangular",
     "svd",
     "svdvals",
     "tensordot",
@@ -31,6 +37,49 @@ from ._types import Literal, Optional, Tuple, Union, Sequence, array, dtype
 from .constants import inf
 
 
+def cho_solve(x1: array, x2: array, /, *, upper: bool = False) -> array:
+    r"""
+    Returns the solution of a system of linear equations given the Cholesky factor of its coefficient matrix.
+
+    Let ``x1`` equal a Cholesky factor :math:`L` (or :math:`U`) of a complex Hermitian or real symmetric positive-definite matrix :math:`A` (see :func:`~array_api.linalg.cholesky`) and ``x2`` equal :math:`B`. If the promoted data type of ``x1`` and ``x2`` is real-valued, let :math:`\mathbb{K}` be the set of real numbers :math:`\mathbb{R}`, and, if the promoted data type of ``x1`` and ``x2`` is complex-valued, let :math:`\mathbb{K}` be the set of complex numbers :math:`\mathbb{C}`.
+
+    This function computes the solution :math:`X \in\ \mathbb{K}^{m \times k}` of the **linear system** associated to :math:`A \in\ \mathbb{K}^{m \times m}` and :math:`B \in\ \mathbb{K}^{m \times k}` and defined as
+
+    .. math::
+       AX = LL^{H}X = B
+
+    or, if ``upper`` is ``True``, as
+
+    .. math::
+       AX = U^{H}UX = B
+
+    Accordingly, the Cholesky decomposition of :math:`A`, which requires :math:`O(m^3)` operations, can be computed once and reused to solve any number of systems, each requiring :math:`O(m^2 k)` operations.
+
+    When ``x1`` and/or ``x2`` is a stack of matrices, the function must compute a solution for each matrix in the stack.
+
+    Parameters
+    ----------
+    x1: array
+        Cholesky factors having shape ``(..., M, M)``, as returned by :func:`~array_api.linalg.cholesky` for the same value of ``upper``. Only the triangle specified by ``upper`` must be accessed; the elements of the other triangle must be ignored. Should have a floating-point data type.
+    x2: array
+        ordinate (or "dependent variable") array ``B``. If ``x2`` has shape ``(M,)``, ``x2`` is equivalent to an array having shape ``(..., M, 1)``. If ``x2`` has shape ``(..., M, K)``, each column ``k`` defines a set of ordinate values for which to compute a solution, and ``shape(x2)[:-2]`` must be compatible with ``shape(x1)[:-2]`` (see :ref:`broadcasting`). Should have a floating-point data type.
+    upper: bool
+        If ``True``, ``x1`` must be treated as the upper-triangular Cholesky factor :math:`U`. If ``False``, ``x1`` must be treated as the lower-triangular Cholesky factor :math:`L`. Default: ``False``.
+
+    Returns
+    -------
+    out: array
+        an array containing the solution to the system ``AX = B`` for each square matrix. If ``x2`` has shape ``(M,)``, the returned array must have shape equal to ``shape(x1)[:-2] + shape(x2)[-1:]``. Otherwise, if ``x2`` has shape ``(..., M, K)``, the returned array must have shape equal to ``(..., M, K)``, where ``...`` refers to the result of broadcasting ``shape(x1)[:-2]`` and ``shape(x2)[:-2]``. The returned array must have a floating-point data type determined by :ref:`type-promotion`.
+
+    Notes
+    -----
+
+    -   The result must be equal to the result of two triangular solves (see :func:`~array_api.linalg.solve_triangular`), up to rounding.
+
+    .. versionadded:: 2026.12
+    """
+
+
 def cholesky(x: array, /, *, upper: bool = False) -> array:
     r"""
     Returns the lower (upper) Cholesky decomposition of a complex Hermitian or real symmetric positive-definite matrix ``x``.
@@ -119,7 +168,20 @@ def cross(x1: array, x2: array, /, *, axis: int = -1) -> array:
     """
 
 
-def det(x: array, /) -> array:
+def det(
+    x: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> array:
     """
     Returns the determinant of a square matrix (or a stack of square matrices) ``x``.
 
@@ -127,6 +189,18 @@ def det(x: array, /) -> array:
     ----------
     x: array
         input array having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Should have a floating-point data type.
+    assume_a: Literal["general", "symmetric", "hermitian", "positive definite", "diagonal", "lower triangular", "upper triangular"]
+        structure of the matrices in ``x``, which conforming implementations may use to choose a less expensive algorithm. Must be one of the following:
+
+        -   ``"general"``: no structure is assumed.
+        -   ``"symmetric"``: each matrix is assumed to be equal to its transpose.
+        -   ``"hermitian"``: each matrix is assumed to be equal to its conjugate transpose. For real-valued matrices, ``"hermitian"`` is equivalent to ``"symmetric"``.
+        -   ``"positive definite"``: each matrix is assumed to be a complex Hermitian or real symmetric positive-definite matrix (e.g., enabling a Cholesky decomposition, rather than an LU decomposition, to be used).
+        -   ``"diagonal"``: each matrix is assumed to be a diagonal matrix.
+        -   ``"lower triangular"``: each matrix is assumed to be a lower triangular matrix.
+        -   ``"upper triangular"``: each matrix is assumed to be an upper triangular matrix.
+
+        Default: ``"general"``.
 
     Returns
     -------
@@ -136,8 +210,13 @@ def det(x: array, /) -> array:
     Notes
     -----
 
+    -   If the matrices in ``x`` do not have the structure specified by ``assume_a``, behavior is unspecified and thus implementation-defined. In particular, conforming implementations may only access the elements which determine a matrix having the assumed structure (e.g., only one triangle of a symmetric matrix or only the diagonal of a diagonal matrix), and whether an array library explicitly checks whether ``x`` has the assumed structure is implementation-defined.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``assume_a`` keyword argument.
     """
 
 
@@ -234,7 +313,9 @@ def eig(x: array, /) -> Tuple[array, array]:
     """
 
 
-def eigh(x: array, /) -> Tuple[array, array]:
+def eigh(
+    x: array, /, *, subset_by_index: Optional[Tuple[int, int]] = None
+) -> Tuple[array, array]:
     r"""
     Returns an eigenvalue decomposition of a complex Hermitian or real symmetric matrix (or a stack of matrices) ``x``.
 
@@ -262,27 +343,36 @@ def eigh(x: array, /) -> Tuple[array, array]:
     ----------
     x: array
         input array having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Should have a floating-point data type.
+    subset_by_index: Optional[Tuple[int, int]]
+        inclusive range ``(lo, hi)`` of the indices of the eigenvalues to compute, where the eigenvalues of each matrix are indexed in ascending order (i.e., index ``0`` corresponds to the smallest eigenvalue). Must satisfy ``0 <= lo <= hi < M``. If provided, only the ``hi - lo + 1`` selected eigenvalues and their eigenvectors must be returned. If ``None``, all eigenvalues and their eigenvectors must be returned. Default: ``None``.
 
     Returns
     -------
     out: Tuple[array, array]
         a namedtuple (``eigenvalues``, ``eigenvectors``) whose
 
-        -   first element must have the field name ``eigenvalues`` (corresponding to :math:`\operatorname{diag}\Lambda` above) and must be an array consisting of computed eigenvalues. The array containing the eigenvalues must have shape ``(..., M)`` and must have a real-valued floating-point data type whose precision matches the precision of ``x`` (e.g., if ``x`` is ``complex128``, then ``eigenvalues`` must be ``float64``).
-        -   second element must have the field name ``eigenvectors`` (corresponding to :math:`Q` above) and must be an array where the columns of the inner most matrices contain the computed eigenvectors. These matrices must be orthogonal. The array containing the eigenvectors must have shape ``(..., M, M)`` and must have the same data type as ``x``.
+        -   first element must have the field name ``eigenvalues`` (corresponding to :math:`\operatorname{diag}\Lambda` above) and must be an array consisting of computed eigenvalues. The array containing the eigenvalues must have shape ``(..., M)`` (``(..., K)``, where ``K = hi - lo + 1``, if ``subset_by_index`` is provided) and must have a real-valued floating-point data type whose precision matches the precision of ``x`` (e.g., if ``x`` is ``complex128``, then ``eigenvalues`` must be ``float64``).
+        -   second element must have the field name ``eigenvectors`` (corresponding to :math:`Q` above) and must be an array where the columns of the inner most matrices contain the computed eigenvectors. These matrices must be orthogonal. The array containing the eigenvectors must have shape ``(..., M, M)`` (``(..., M, K)`` if ``subset_by_index`` is provided) and must have the same data type as ``x``.
 
     Notes
     -----
 
     .. note::
-       Eigenvalue sort order is left unspecified and is thus implementation-dependent.
+       Eigenvalue sort order is left unspecified and is thus implementation-dependent. However, if ``subset_by_index`` is provided, the returned eigenvalues must be sorted in ascending order.
+
+    -   When ``subset_by_index`` is provided, conforming implementations may use methods which do not compute the full spectrum (e.g., Lanczos iteration or bisection followed by inverse iteration) and which require fewer than :math:`O(M^3)` operations when only a few eigenvalues are selected. However, each returned eigenvalue must have the accuracy of a full eigenvalue decomposition (i.e., must differ from the corresponding exact eigenvalue by at most a modest multiple of :math:`\epsilon \|x\|_2`, where :math:`\epsilon` is the machine epsilon of the data type of ``x``). Each returned eigenvector :math:`q` must have a residual :math:`\|xq - \lambda q\|_2` of at most a modest multiple of :math:`\epsilon \|x\|_2`, and the returned eigenvectors must be orthonormal to working accuracy.
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``subset_by_index`` keyword argument.
     """
 
 
-def eigvalsh(x: array, /) -> array:
+def eigvalsh(
+    x: array, /, *, subset_by_index: Optional[Tuple[int, int]] = None
+) -> array:
     r"""
     Returns the eigenvalues of a complex Hermitian or real symmetric matrix (or a stack of matrices) ``x``.
 
@@ -305,20 +395,27 @@ def eigvalsh(x: array, /) -> array:
     ----------
     x: array
         input array having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Should have a floating-point data type.
+    subset_by_index: Optional[Tuple[int, int]]
+        inclusive range ``(lo, hi)`` of the indices of the eigenvalues to compute, where the eigenvalues of each matrix are indexed in ascending order (i.e., index ``0`` corresponds to the smallest eigenvalue). Must satisfy ``0 <= lo <= hi < M``. If provided, only the ``hi - lo + 1`` selected eigenvalues must be returned. If ``None``, all eigenvalues must be returned. Default: ``None``.
 
     Returns
     -------
     out: array
-        an array containing the computed eigenvalues. The returned array must have shape ``(..., M)`` and have a real-valued floating-point data type whose precision matches the precision of ``x`` (e.g., if ``x`` is ``complex128``, then must have a ``float64`` data type).
+        an array containing the computed eigenvalues. The returned array must have shape ``(..., M)`` (``(..., K)``, where ``K = hi - lo + 1``, if ``subset_by_index`` is provided) and have a real-valued floating-point data type whose precision matches the precision of ``x`` (e.g., if ``x`` is ``complex128``, then must have a ``float64`` data type).
 
     Notes
     -----
 
     .. note::
-       Eigenvalue sort order is left unspecified and is thus implementation-dependent.
+       Eigenvalue sort order is left unspecified and is thus implementation-dependent. However, if ``subset_by_index`` is provided, the returned eigenvalues must be sorted in ascending order.
+
+    -   When ``subset_by_index`` is provided, conforming implementations may use methods which do not compute the full spectrum (e.g., Lanczos iteration or bisection followed by inverse iteration) and which require fewer than :math:`O(M^3)` operations when only a few eigenvalues are selected. However, each returned eigenvalue must have the accuracy of a full eigenvalue decomposition (i.e., must differ from the corresponding exact eigenvalue by at most a modest multiple of :math:`\epsilon \|x\|_2`, where :math:`\epsilon` is the machine epsilon of the data type of ``x``).
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``subset_by_index`` keyword argument.
     """
 
 
@@ -361,7 +458,20 @@ def eigvals(x: array, /) -> array:
     """
 
 
-def inv(x: array, /) -> array:
+def inv(
+    x: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> array:
     r"""
     Returns the multiplicative inverse of a square matrix (or a stack of square matrices) ``x``.
 
@@ -382,6 +492,18 @@ def inv(x: array, /) -> array:
     ----------
     x: array
         input array having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Should have a floating-point data type.
+    assume_a: Literal["general", "symmetric", "hermitian", "positive definite", "diagonal", "lower triangular", "upper triangular"]
+        structure of the matrices in ``x``, which conforming implementations may use to choose a less expensive algorithm. Must be one of the following:
+
+        -   ``"general"``: no structure is assumed.
+        -   ``"symmetric"``: each matrix is assumed to be equal to its transpose.
+        -   ``"hermitian"``: each matrix is assumed to be equal to its conjugate transpose. For real-valued matrices, ``"hermitian"`` is equivalent to ``"symmetric"``.
+        -   ``"positive definite"``: each matrix is assumed to be a complex Hermitian or real symmetric positive-definite matrix (e.g., enabling a Cholesky decomposition, rather than an LU decomposition, to be used).
+        -   ``"diagonal"``: each matrix is assumed to be a diagonal matrix.
+        -   ``"lower triangular"``: each matrix is assumed to be a lower triangular matrix.
+        -   ``"upper triangular"``: each matrix is assumed to be an upper triangular matrix.
+
+        Default: ``"general"``.
 
     Returns
     -------
@@ -391,12 +513,146 @@ def inv(x: array, /) -> array:
     Notes
     -----
 
+    -   If the matrices in ``x`` do not have the structure specified by ``assume_a``, behavior is unspecified and thus implementation-defined. In particular, conforming implementations may only access the elements which determine a matrix having the assumed structure (e.g., only one triangle of a symmetric matrix or only the diagonal of a diagonal matrix), and whether an array library explicitly checks whether ``x`` has the assumed structure is implementation-defined.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``assume_a`` keyword argument.
+    """
+
+
+def lstsq(
+    x1: array, x2: array, /, *, rtol: Optional[Union[float, array]] = None
+) -> array:
+    r"""
+    Returns the minimum-norm least-squares solution of a system of linear equations.
+
+    Let ``x1`` equal :math:`A` and ``x2`` equal :math:`B`. If the promoted data type of ``x1`` and ``x2`` is real-valued, let :math:`\mathbb{K}` be the set of real numbers :math:`\mathbb{R}`, and, if the promoted data type of ``x1`` and ``x2`` is complex-valued, let :math:`\mathbb{K}` be the set of complex numbers :math:`\mathbb{C}`.
+
+    This function computes the solution :math:`X \in\ \mathbb{K}^{n \times k}` of the **least-squares problem** associated to :math:`A \in\ \mathbb{K}^{m \times n}` and :math:`B \in\ \mathbb{K}^{m \times k}` and is defined as
+
+    .. math::
+       \min_{X} \|AX - B\|_F
+
+    If the problem has more than one solution (i.e., if :math:`A` is rank-deficient), the function must return the solution having the smallest Frobenius norm, which equals :math:`A^{+}B` (see :func:`~array_api.linalg.pinv`).
+
+    When ``x1`` and/or ``x2`` is a stack of matrices, the function must compute a solution for each matrix in the stack.
+
+    Parameters
+    ----------
+    x1: array
+        coefficient array ``A`` having shape ``(..., M, N)`` and whose innermost two dimensions form ``MxN`` matrices. Should have a floating-point data type.
+    x2: array
+        ordinate (or "dependent variable") array ``B``. If ``x2`` has shape ``(M,)``, ``x2`` is equivalent to an array having shape ``(..., M, 1)``. If ``x2`` has shape ``(..., M, K)``, each column ``k`` defines a set of ordinate values for which to compute a solution, and ``shape(x2)[:-2]`` must be compatible with ``shape(x1)[:-2]`` (see :ref:`broadcasting`). Should have a floating-point data type.
+    rtol: Optional[Union[float, array]]
+        relative tolerance for small singular values of ``x1``, having the same meaning as for :func:`~array_api.linalg.pinv`. Singular values approximately less than or equal to ``rtol * largest_singular_value`` are treated as zero when determining the rank of ``x1``. If a ``float``, the value is equivalent to a zero-dimensional array having a real-valued floating-point data type determined by :ref:`type-promotion` (as applied to ``x1``) and must be broadcast against each matrix. If an ``array``, must have a real-valued floating-point data type and must be compatible with ``shape(x1)[:-2]`` (see :ref:`broadcasting`). If ``None``, the default value is ``max(M, N) * eps``, where ``eps`` must be the machine epsilon associated with the real-valued floating-point data type determined by :ref:`type-promotion` (as applied to ``x1``). Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the least-squares solution for each matrix. If ``x2`` has shape ``(M,)``, the returned array must have shape equal to ``shape(x1)[:-2] + (N,)``. Otherwise, if ``x2`` has shape ``(..., M, K)``, the returned array must have shape equal to ``(..., N, K)``, where ``...`` refers to the result of broadcasting ``shape(x1)[:-2]`` and ``shape(x2)[:-2]``. The returned array must have a floating-point data type determined by :ref:`type-promotion`.
+
+    Notes
+    -----
+
+    -   Conforming implementations should not form the pseudo-inverse of ``x1`` explicitly. For matrices having full column rank, a QR decomposition suffices and is considerably less expensive than a singular value decomposition; for rank-deficient matrices, a rank-revealing decomposition (e.g., a QR decomposition with column pivoting) may be used.
+    -   Unlike :func:`~array_api.linalg.solve`, ``x1`` is not required to be square or to have full rank.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def lu_factor(x: array, /) -> Tuple[array, array]:
+    r"""
+    Returns the LU decomposition with partial pivoting of a square matrix (or a stack of square matrices) ``x``, in a compact form suitable for :func:`~array_api.linalg.lu_solve`.
+
+    If ``x`` is real-valued, let :math:`\mathbb{K}` be the set of real numbers :math:`\mathbb{R}`, and, if ``x`` is complex-valued, let :math:`\mathbb{K}` be the set of complex numbers :math:`\mathbb{C}`.
+
+    The **LU decomposition with partial pivoting** of a square matrix :math:`x \in\ \mathbb{K}^{n \times n}` is defined as
+
+    .. math::
+       x = PLU
+
+    where :math:`P` is a permutation matrix, :math:`L \in\ \mathbb{K}^{n \times n}` is a lower triangular matrix with unit diagonal, and :math:`U \in\ \mathbb{K}^{n \times n}` is an upper triangular matrix.
+
+    When ``x`` is a stack of matrices, the function must compute the LU decomposition for each matrix in the stack.
+
+    .. note::
+       Whether an array library explicitly checks whether an input array is invertible is implementation-defined. For singular matrices, the decomposition exists; however, :math:`U` has at least one zero diagonal element, and solving linear systems using the decomposition is not well-defined.
+
+    .. warning::
+       The LU decomposition with partial pivoting is not unique (e.g., when two candidate pivots have the same absolute value). Accordingly, different libraries or inputs on different devices may produce different valid decompositions.
+
+    Parameters
+    ----------
+    x: array
+        input array having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Should have a floating-point data type.
+
+    Returns
+    -------
+    out: Tuple[array, array]
+        a namedtuple ``(LU, pivots)`` whose
+
+        -   first element must have the field name ``LU`` and must be an array having the same shape as ``x`` and containing, for each matrix, :math:`U` in its upper triangle (including the diagonal) and :math:`L` in its strictly lower triangle (the unit diagonal of :math:`L` is not stored). The array must have a floating-point data type determined by :ref:`type-promotion`.
+        -   second element must have the field name ``pivots`` and must be an array having shape ``(..., M)`` and containing the row interchanges applied to each matrix. When computing the decomposition, row ``i`` must have been interchanged with row ``pivots[..., i]``, for ``i`` from ``0`` to ``M-1`` in that order, where ``i <= pivots[..., i] < M``. The array must have the default array index data type.
+
+    Notes
+    -----
+
+    -   Conforming implementations should choose as the pivot of each column an element having the largest absolute value among the candidate elements, as in LAPACK's ``getrf``.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def lu_solve(factors: Tuple[array, array], x2: array, /) -> array:
+    r"""
+    Returns the solution of a square system of linear equations given the LU decomposition of its coefficient matrix.
+
+    Let ``factors`` be the LU decomposition of a matrix :math:`A = PLU` (see :func:`~array_api.linalg.lu_factor`) and ``x2`` equal :math:`B`. If the promoted data type of ``factors`` and ``x2`` is real-valued, let :math:`\mathbb{K}` be the set of real numbers :math:`\mathbb{R}`, and, if the promoted data type of ``factors`` and ``x2`` is complex-valued, let :math:`\mathbb{K}` be the set of complex numbers :math:`\mathbb{C}`.
+
+    This function computes the solution :math:`X \in\ \mathbb{K}^{m \times k}` of the **linear system** associated to :math:`A \in\ \mathbb{K}^{m \times m}` and :math:`B \in\ \mathbb{K}^{m \times k}` and defined as
+
+    .. math::
+       AX = B
+
+    Accordingly, the LU decomposition of :math:`A`, which requires :math:`O(m^3)` operations, can be computed once and reused to solve any number of systems, each requiring :math:`O(m^2 k)` operations.
+
+    When ``factors`` and/or ``x2`` is a stack of matrices, the function must compute a solution for each matrix in the stack.
+
+    Parameters
+    ----------
+    factors: Tuple[array, array]
+        a namedtuple ``(LU, pivots)``, as returned by :func:`~array_api.linalg.lu_factor`. ``LU`` should have a floating-point data type, and ``pivots`` must have an integer data type.
+    x2: array
+        ordinate (or "dependent variable") array ``B``. If ``x2`` has shape ``(M,)``, ``x2`` is equivalent to an array having shape ``(..., M, 1)``. If ``x2`` has shape ``(..., M, K)``, each column ``k`` defines a set of ordinate values for which to compute a solution, and ``shape(x2)[:-2]`` must be compatible with ``shape(LU)[:-2]`` (see :ref:`broadcasting`). Should have a floating-point data type.
+
+    Returns
+    -------
+    out: array
+        an array containing the solution to the system ``AX = B`` for each square matrix. If ``x2`` has shape ``(M,)``, the returned array must have shape equal to ``shape(LU)[:-2] + shape(x2)[-1:]``. Otherwise, if ``x2`` has shape ``(..., M, K)``, the returned array must have shape equal to ``(..., M, K)``, where ``...`` refers to the result of broadcasting ``shape(LU)[:-2]`` and ``shape(x2)[:-2]``. The returned array must have a floating-point data type determined by :ref:`type-promotion`.
+
+    Notes
+    -----
+
+    -   The result must be equal to the result of :func:`~array_api.linalg.solve` applied to :math:`A`, up to rounding.
+
+    .. versionadded:: 2026.12
     """
 
 
-def matmul(x1: array, x2: array, /) -> array:
+def matmul(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    transpose_a: bool = False,
+    transpose_b: bool = False,
+    adjoint_a: bool = False,
+    adjoint_b: bool = False,
+) -> array:
     """Alias for :func:`~array_api.matmul`."""
 
 
@@ -520,6 +776,60 @@ def matrix_transpose(x: array, /) -> array:
     """Alias for :func:`~array_api.matrix_transpose`."""
 
 
+def multi_dot(arrays: Sequence[array], /) -> array:
+    r"""
+    Computes the matrix product of two or more arrays, evaluating the products in the order which requires the fewest scalar multiplications.
+
+    Let ``arrays`` equal :math:`(A_1, A_2, \ldots, A_n)`. This function computes the matrix product
+
+    .. math::
+       A_1 A_2 \cdots A_n
+
+    While the matrix product is associative (i.e., the result is mathematically independent of how the product is parenthesized), the cost of evaluating the product is not. For example, if :math:`A` has shape ``(N, N)``, :math:`B` has shape ``(N, N)``, and :math:`v` has shape ``(N, 1)``, evaluating :math:`(AB)v` requires on the order of :math:`N^3` scalar multiplications, while evaluating :math:`A(Bv)` requires on the order of :math:`N^2` scalar multiplications.
+
+    Parameters
+    ----------
+    arrays: Sequence[array]
+        sequence of two or more input arrays. Should have numeric data types.
+
+        -   The first array must be either a one-dimensional array or a two-dimensional array. If the first array is a one-dimensional array having shape ``(K,)``, the array must be treated as a two-dimensional array having shape ``(1, K)``.
+        -   The last array must be either a one-dimensional array or a two-dimensional array. If the last array is a one-dimensional array having shape ``(K,)``, the array must be treated as a two-dimensional array having shape ``(K, 1)``.
+        -   Every other array must be a two-dimensional array.
+        -   For each pair of consecutive arrays (after vector-to-matrix promotion), the size of the last dimension of the first array must equal the size of the first dimension of the second array.
+
+    Returns
+    -------
+    out: array
+        an array containing the matrix product. Let ``M`` be the size of the first dimension of the first array (after vector-to-matrix promotion) and ``N`` be the size of the last dimension of the last array (after vector-to-matrix promotion).
+
+        -   If both the first array and the last array are one-dimensional arrays, the returned array must be a zero-dimensional array.
+        -   If only the first array is a one-dimensional array, the returned array must have shape ``(N,)``.
+        -   If only the last array is a one-dimensional array, the returned array must have shape ``(M,)``.
+        -   Otherwise, the returned array must have shape ``(M, N)``.
+
+        The returned array must have a data type determined by :ref:`type-promotion`.
+
+    Raises
+    ------
+    Exception
+        an exception should be raised in the following circumstances:
+
+        -   if ``arrays`` contains fewer than two arrays.
+        -   if the first array or the last array is not a one-dimensional array or a two-dimensional array.
+        -   if any other array is not a two-dimensional array.
+        -   if the innermost dimensions of any two consecutive arrays (after vector-to-matrix promotion) are not compatible for matrix multiplication.
+
+    Notes
+    -----
+
+    -   Conforming implementations should choose the order in which to evaluate the products such that the total number of scalar multiplications is minimized, where multiplying an array having shape ``(M, K)`` by an array having shape ``(K, N)`` is assumed to require ``M*K*N`` scalar multiplications. An optimal order can be determined using dynamic programming in :math:`O(n^3)` operations, which is negligible compared to the cost of the products themselves.
+    -   As the order in which the products are evaluated is implementation-defined, the result may differ from the result of evaluating the products from left to right (e.g., via :func:`~array_api.matmul`) due to floating-point rounding.
+    -   When ``arrays`` contains exactly two arrays, the result must be equivalent to :func:`~array_api.matmul`.
+
+    .. versionadded:: 2026.12
+    """
+
+
 def outer(x1: array, x2: array, /) -> array:
     """
     Returns the outer product of two vectors ``x1`` and ``x2``.
@@ -649,7 +959,20 @@ def qr(
     """
 
 
-def slogdet(x: array, /) -> Tuple[array, array]:
+def slogdet(
+    x: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> Tuple[array, array]:
     r"""
     Returns the sign and the natural logarithm of the absolute value of the determinant of a square matrix (or a stack of square matrices) ``x``.
 
@@ -685,6 +1008,18 @@ def slogdet(x: array, /) -> Tuple[array, array]:
     ----------
     x: array
         input array having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Should have a floating-point data type.
+    assume_a: Literal["general", "symmetric", "hermitian", "positive definite", "diagonal", "lower triangular", "upper triangular"]
+        structure of the matrices in ``x``, which conforming implementations may use to choose a less expensive algorithm. Must be one of the following:
+
+        -   ``"general"``: no structure is assumed.
+        -   ``"symmetric"``: each matrix is assumed to be equal to its transpose.
+        -   ``"hermitian"``: each matrix is assumed to be equal to its conjugate transpose. For real-valued matrices, ``"hermitian"`` is equivalent to ``"symmetric"``.
+        -   ``"positive definite"``: each matrix is assumed to be a complex Hermitian or real symmetric positive-definite matrix (e.g., enabling a Cholesky decomposition, rather than an LU decomposition, to be used).
+        -   ``"diagonal"``: each matrix is assumed to be a diagonal matrix.
+        -   ``"lower triangular"``: each matrix is assumed to be a lower triangular matrix.
+        -   ``"upper triangular"``: each matrix is assumed to be an upper triangular matrix.
+
+        Default: ``"general"``.
 
     Returns
     -------
@@ -699,12 +1034,31 @@ def slogdet(x: array, /) -> Tuple[array, array]:
     Notes
     -----
 
+    -   If the matrices in ``x`` do not have the structure specified by ``assume_a``, behavior is unspecified and thus implementation-defined. In particular, conforming implementations may only access the elements which determine a matrix having the assumed structure (e.g., only one triangle of a symmetric matrix or only the diagonal of a diagonal matrix), and whether an array library explicitly checks whether ``x`` has the assumed structure is implementation-defined.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``assume_a`` keyword argument.
     """
 
 
-def solve(x1: array, x2: array, /) -> array:
+def solve(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> array:
     r"""
     Returns the solution of a square system of linear equations with a unique solution.
 
@@ -728,6 +1082,18 @@ def solve(x1: array, x2: array, /) -> array:
         coefficient array ``A`` having shape ``(..., M, M)`` and whose innermost two dimensions form square matrices. Must be of full rank (i.e., all rows or, equivalently, columns must be linearly independent). Should have a floating-point data type.
     x2: array
         ordinate (or "dependent variable") array ``B``. If ``x2`` has shape ``(M,)``, ``x2`` is equivalent to an array having shape ``(..., M, 1)``. If ``x2`` has shape ``(..., M, K)``, each column ``k`` defines a set of ordinate values for which to compute a solution, and ``shape(x2)[:-2]`` must be compatible with ``shape(x1)[:-2]`` (see :ref:`broadcasting`). Should have a floating-point data type.
+    assume_a: Literal["general", "symmetric", "hermitian", "positive definite", "diagonal", "lower triangular", "upper triangular"]
+        structure of the matrices in ``x1``, which conforming implementations may use to choose a less expensive algorithm. Must be one of the following:
+
+        -   ``"general"``: no structure is assumed.
+        -   ``"symmetric"``: each matrix is assumed to be equal to its transpose.
+        -   ``"hermitian"``: each matrix is assumed to be equal to its conjugate transpose. For real-valued matrices, ``"hermitian"`` is equivalent to ``"symmetric"``.
+        -   ``"positive definite"``: each matrix is assumed to be a complex Hermitian or real symmetric positive-definite matrix (e.g., enabling a Cholesky decomposition, rather than an LU decomposition, to be used).
+        -   ``"diagonal"``: each matrix is assumed to be a diagonal matrix.
+        -   ``"lower triangular"``: each matrix is assumed to be a lower triangular matrix.
+        -   ``"upper triangular"``: each matrix is assumed to be an upper triangular matrix.
+
+        Default: ``"general"``.
 
     Returns
     -------
@@ -737,15 +1103,80 @@ def solve(x1: array, x2: array, /) -> array:
     Notes
     -----
 
+    -   If the matrices in ``x1`` do not have the structure specified by ``assume_a``, behavior is unspecified and thus implementation-defined. In particular, conforming implementations may only access the elements which determine a matrix having the assumed structure (e.g., only one triangle of a symmetric matrix or only the diagonal of a diagonal matrix), and whether an array library explicitly checks whether ``x1`` has the assumed structure is implementation-defined.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
 
     .. versionchanged:: 2024.12
        Clarified broadcasting semantics and the shape of the output array.
+
+    .. versionchanged:: 2026.12
+       Added the ``assume_a`` keyword argument.
     """
 
 
-def svd(x: array, /, *, full_matrices: bool = True) -> Tuple[array, array, array]:
+def solve_triangular(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    upper: bool = False,
+    left: bool = True,
+    unit_diagonal: bool = False,
+) -> array:
+    r"""
+    Returns the solution of a triangular system of linear equations.
+
+    Let ``x1`` equal :math:`A` and ``x2`` equal :math:`B`. If the promoted data type of ``x1`` and ``x2`` is real-valued, let :math:`\mathbb{K}` be the set of real numbers :math:`\mathbb{R}`, and, if the promoted data type of ``x1`` and ``x2`` is complex-valued, let :math:`\mathbb{K}` be the set of complex numbers :math:`\mathbb{C}`.
+
+    If ``left`` is ``True``, this function computes the solution :math:`X \in\ \mathbb{K}^{m \times k}` of the **linear system** associated to a triangular matrix :math:`A \in\ \mathbb{K}^{m \times m}` and :math:`B \in\ \mathbb{K}^{m \times k}` and defined as
+
+    .. math::
+       AX = B
+
+    Otherwise, if ``left`` is ``False``, this function computes the solution :math:`X \in\ \mathbb{K}^{k \times m}` of the linear system associated to :math:`B \in\ \mathbb{K}^{k \times m}` and defined as
+
+    .. math::
+       XA = B
+
+    This system of linear equations has a unique solution if and only if every diagonal element of :math:`A` is nonzero.
+
+    .. note::
+       Whether an array library explicitly checks whether ``x1`` is invertible is implementation-defined.
+
+    When ``x1`` and/or ``x2`` is a stack of matrices, the function must compute a solution for each matrix in the stack.
+
+    Parameters
+    ----------
+    x1: array
+        coefficient array ``A`` having shape ``(..., M, M)`` and whose innermost two dimensions form square triangular matrices. Only the triangle specified by ``upper`` must be accessed; the elements of the other triangle must be ignored. Should have a floating-point data type.
+    x2: array
+        ordinate (or "dependent variable") array ``B``. If ``x2`` has shape ``(M,)``, ``x2`` is equivalent to an array having shape ``(..., M, 1)`` if ``left`` is ``True`` and ``(..., 1, M)`` otherwise. If ``x2`` has shape ``(..., M, K)`` (``(..., K, M)`` if ``left`` is ``False``), ``shape(x2)[:-2]`` must be compatible with ``shape(x1)[:-2]`` (see :ref:`broadcasting`). Should have a floating-point data type.
+    upper: bool
+        If ``True``, ``x1`` must be treated as an upper triangular matrix. If ``False``, ``x1`` must be treated as a lower triangular matrix. Default: ``False``.
+    left: bool
+        If ``True``, the function must solve :math:`AX = B`. If ``False``, the function must solve :math:`XA = B`. Default: ``True``.
+    unit_diagonal: bool
+        If ``True``, the diagonal elements of ``x1`` must be assumed to be equal to one and must not be accessed. Default: ``False``.
+
+    Returns
+    -------
+    out: array
+        an array containing the solution to the system for each triangular matrix. If ``x2`` has shape ``(M,)``, the returned array must have shape equal to ``shape(x1)[:-2] + shape(x2)[-1:]``. Otherwise, the returned array must have shape equal to ``(..., M, K)`` (``(..., K, M)`` if ``left`` is ``False``), where ``...`` refers to the result of broadcasting ``shape(x1)[:-2]`` and ``shape(x2)[:-2]``. The returned array must have a floating-point data type determined by :ref:`type-promotion`.
+
+    Notes
+    -----
+
+    -   Conforming implementations should compute the solution by substitution, which requires :math:`O(m^2 k)` operations, rather than by a general solve (see :func:`~array_api.linalg.solve`), which requires :math:`O(m^3)` operations. Accordingly, a Cholesky factor (see :func:`~array_api.linalg.cholesky`) can be reused to solve systems in quadratic time.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def svd(
+    x: array, /, *, full_matrices: bool = True, k: Optional[int] = None
+) -> Tuple[array, array, array]:
     r"""
     Returns a singular value decomposition (SVD) of a matrix (or a stack of matrices) ``x``.
 
@@ -781,7 +1212,9 @@ def svd(x: array, /, *, full_matrices: bool = True) -> Tuple[array, array, array
     x: array
         input array having shape ``(..., M, N)`` and whose innermost two dimensions form matrices on which to perform singular value decomposition. Should have a floating-point data type.
     full_matrices: bool
-        If ``True``, compute full-sized ``U`` and ``Vh``, such that ``U`` has shape ``(..., M, M)`` and ``Vh`` has shape ``(..., N, N)``. If ``False``, compute on the leading ``K`` singular vectors, such that ``U`` has shape ``(..., M, K)`` and ``Vh`` has shape ``(..., K, N)`` and where ``K = min(M, N)``. Default: ``True``.
+        If ``True``, compute full-sized ``U`` and ``Vh``, such that ``U`` has shape ``(..., M, M)`` and ``Vh`` has shape ``(..., N, N)``. If ``False``, compute on the leading ``K`` singular vectors, such that ``U`` has shape ``(..., M, K)`` and ``Vh`` has shape ``(..., K, N)`` and where ``K = min(M, N)``. If ``k`` is provided, ``full_matrices`` must be ignored. Default: ``True``.
+    k: Optional[int]
+        number of singular values and the corresponding singular vectors to compute. If provided, must be an integer on the interval ``[1, K]``, where ``K = min(M, N)``, and only the ``k`` largest singular values and the corresponding singular vectors must be returned. If ``None``, all ``K`` singular values and the corresponding singular vectors must be returned. Default: ``None``.
 
     Returns
     -------
@@ -792,16 +1225,23 @@ def svd(x: array, /, *, full_matrices: bool = True) -> Tuple[array, array, array
         -   second element must have the field name ``S`` and must be an array with shape ``(..., K)`` that contains the vector(s) of singular values of length ``K``, where ``K = min(M, N)``. For each vector, the singular values must be sorted in descending order by magnitude, such that ``s[..., 0]`` is the largest value, ``s[..., 1]`` is the second largest value, et cetera. The first ``x.ndim-2`` dimensions must have the same shape as those of the input ``x``. Must have a real-valued floating-point data type having the same precision as ``x`` (e.g., if ``x`` is ``complex64``, ``S`` must have a ``float32`` data type).
         -   third element must have the field name ``Vh`` and must be an array whose shape depends on the value of ``full_matrices`` and contain orthonormal rows (i.e., the rows are the right singular vectors and the array is the adjoint). If ``full_matrices`` is ``True``, the array must have shape ``(..., N, N)``. If ``full_matrices`` is ``False``, the array must have shape ``(..., K, N)`` where ``K = min(M, N)``. The first ``x.ndim-2`` dimensions must have the same shape as those of the input ``x``. Must have the same data type as ``x``.
 
+        If ``k`` is provided, ``U``, ``S``, and ``Vh`` must instead have shapes ``(..., M, k)``, ``(..., k)``, and ``(..., k, N)``, respectively, and must contain the ``k`` largest singular values and the corresponding singular vectors.
+
     Notes
     -----
 
+    -   When ``k`` is provided, conforming implementations may use methods which do not compute the full decomposition (e.g., Lanczos bidiagonalization or randomized methods with sufficient power iterations) and which require fewer than :math:`O(MN \operatorname{min}(M, N))` operations when ``k`` is small. However, each returned singular value must have the accuracy of a full singular value decomposition (i.e., must differ from the corresponding exact singular value by at most a modest multiple of :math:`\epsilon \|x\|_2`, where :math:`\epsilon` is the machine epsilon of the data type of ``x``). Each returned triplet :math:`(u, s, v)` must have residuals :math:`\|xv - su\|_2` and :math:`\|x^H u - sv\|_2` of at most a modest multiple of :math:`\epsilon \|x\|_2`, and the returned singular vectors must be orthonormal to working accuracy.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``k`` keyword argument.
     """
 
 
-def svdvals(x: array, /) -> array:
-    """
+def svdvals(x: array, /, *, k: Optional[int] = None) -> array:
+    r"""
     Returns the singular values of a matrix (or a stack of matrices) ``x``.
 
     When ``x`` is a stack of matrices, the function must compute the singular values for each matrix in the stack.
@@ -810,17 +1250,24 @@ def svdvals(x: array, /) -> array:
     ----------
     x: array
         input array having shape ``(..., M, N)`` and whose innermost two dimensions form matrices on which to perform singular value decomposition. Should have a floating-point data type.
+    k: Optional[int]
+        number of singular values to compute. If provided, must be an integer on the interval ``[1, K]``, where ``K = min(M, N)``, and only the ``k`` largest singular values must be returned. If ``None``, all ``K`` singular values must be returned. Default: ``None``.
 
     Returns
     -------
     out: array
-        an array with shape ``(..., K)`` that contains the vector(s) of singular values of length ``K``, where ``K = min(M, N)``. For each vector, the singular values must be sorted in descending order by magnitude, such that ``s[..., 0]`` is the largest value, ``s[..., 1]`` is the second largest value, et cetera. The first ``x.ndim-2`` dimensions must have the same shape as those of the input ``x``. The returned array must have a real-valued floating-point data type having the same precision as ``x`` (e.g., if ``x`` is ``complex64``, the returned array must have a ``float32`` data type).
+        an array with shape ``(..., K)`` that contains the vector(s) of singular values of length ``K``, where ``K = min(M, N)`` (or ``K = k`` if ``k`` is provided). For each vector, the singular values must be sorted in descending order by magnitude, such that ``s[..., 0]`` is the largest value, ``s[..., 1]`` is the second largest value, et cetera. The first ``x.ndim-2`` dimensions must have the same shape as those of the input ``x``. The returned array must have a real-valued floating-point data type having the same precision as ``x`` (e.g., if ``x`` is ``complex64``, the returned array must have a ``float32`` data type).
 
     Notes
     -----
 
+    -   When ``k`` is provided, conforming implementations may use methods which do not compute the full decomposition (e.g., Lanczos bidiagonalization or randomized methods with sufficient power iterations) and which require fewer than :math:`O(MN \operatorname{min}(M, N))` operations when ``k`` is small. However, each returned singular value must have the accuracy of a full singular value decomposition (i.e., must differ from the corresponding exact singular value by at most a modest multiple of :math:`\epsilon \|x\|_2`, where :math:`\epsilon` is the machine epsilon of the data type of ``x``).
+
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``k`` keyword argument.
     """
 
 
@@ -1,10 +1,80 @@
-__all__ = ["matmul", "matrix_transpose", "tensordot", "vecdot"]
+__all__ = ["einsum", "matmul", "matrix_transpose", "tensordot", "vecdot"]
 
 
 from ._types import Tuple, Union, Sequence, array
 
 
-def matmul(x1: array, x2: array, /) -> array:
+def einsum(
+    subscripts: str,
+    /,
+    *operands: array,
+    optimize: Union[bool, str, Sequence[Tuple[int, ...]]] = True,
+) -> array:
+    """
+    Evaluates a tensor contraction of one or more arrays described by subscripts in Einstein summation notation.
+
+    Parameters
+    ----------
+    subscripts: str
+        subscripts describing the contraction. The subscripts **must** consist of a comma-separated list of operand subscripts, one for each array in ``operands``, optionally followed by ``->`` and the output subscripts.
+
+        -   Each subscript **must** consist of labels, where a label is a single ASCII letter (i.e., ``a-z`` or ``A-Z``) naming one dimension of the respective array. Each operand subscript **must** have as many labels as the respective array has dimensions, unless the subscript contains an ellipsis (i.e., ``...``), which stands for any number of leading, trailing, or intermediate dimensions.
+        -   Dimensions sharing a label **must** have the same size, with the exception of dimensions of size ``1`` which are labeled by an ellipsis and which **must** be broadcast (see :ref:`broadcasting`).
+        -   If a label occurs more than once in the same operand subscript, the function **must** take the diagonal along the respective dimensions.
+        -   If the output subscripts are provided (explicit mode), each output label **must** occur in at least one operand subscript and **must not** occur more than once in the output subscripts. Labels which are absent from the output subscripts **must** be summed over.
+        -   If the output subscripts are omitted (implicit mode), the output subscripts **must** consist of the dimensions labeled by an ellipsis, if any, followed by the labels which occur exactly once in ``subscripts`` in alphabetical order (with uppercase letters sorted before lowercase letters).
+
+        Whitespace **must** be ignored.
+
+    operands: array
+        input arrays. **Should** have numeric data types. The number of operands **must** equal the number of operand subscripts.
+    optimize: Union[bool, str, Sequence[Tuple[int, ...]]]
+        contraction order hint. The following values **must** be supported:
+
+        -   ``True``: the implementation **may** evaluate the contraction in any order (e.g., by contracting pairs of operands in the order which minimizes an estimate of the number of floating-point operations or of the size of the largest intermediate array).
+        -   ``False``: the implementation **should** not spend time searching for a contraction order (e.g., because the contraction is small or only involves one or two operands).
+        -   ``"greedy"``: the implementation **should** choose the contraction order by repeatedly contracting the pair of operands having the cheapest contraction.
+        -   ``"optimal"``: the implementation **should** choose the contraction order which minimizes an estimate of the number of floating-point operations, even if doing so is expensive for many operands.
+        -   a sequence of tuples: an explicit contraction path. Each tuple **must** contain the positions of the operands to contract in the current list of operands. The contracted operands **must** be removed from that list and the result of their contraction **must** be appended to its end. After the path has been applied, exactly one operand **must** remain. If a contraction path is invalid, the function **must** raise an exception.
+
+        The value of ``optimize`` **must not** affect the values of the result, except for differences in rounding due to the order of floating-point operations. Default: ``True``.
+
+    Returns
+    -------
+    out: array
+        an array containing the contraction. The returned array **must** have one dimension for each label in the output subscripts (and for each dimension labeled by an ellipsis), in that order. The returned array **must** have a data type determined by :ref:`type-promotion`.
+
+    Raises
+    ------
+    Exception
+        an exception **should** be raised in the following circumstances:
+
+        -   if ``subscripts`` is not valid.
+        -   if the number of operand subscripts does not equal the number of operands, or if an operand subscript does not match the number of dimensions of the respective array.
+        -   if dimensions sharing a label have different sizes which are not compatible for broadcasting.
+
+    Notes
+    -----
+
+    -   For example, ``einsum("ij,jk->ik", x1, x2)`` is equivalent to ``matmul(x1, x2)``, ``einsum("ij->ji", x)`` is equivalent to ``matrix_transpose(x)``, ``einsum("ii->i", x)`` returns the diagonal of ``x``, and ``einsum("...j,...j->...", x1, x2)`` is equivalent to ``vecdot(x1, x2)`` for real-valued arrays.
+    -   Implementations **should** evaluate contractions of more than two operands as a sequence of pairwise contractions in order to avoid materializing intermediate arrays whose sizes grow with the number of labels. Implementations **may** dispatch pairwise contractions to :func:`~array_api.matmul` or :func:`~array_api.tensordot`.
+    -   If an operand has a complex floating-point data type, the function **must not** complex-conjugate any operand.
+    -   If a label is summed over and the respective dimensions have size ``0``, the sum **must** be ``0``.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def matmul(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    transpose_a: bool = False,
+    transpose_b: bool = False,
+    adjoint_a: bool = False,
+    adjoint_b: bool = False,
+) -> array:
     """
     Computes the matrix product.
 
@@ -24,6 +94,15 @@ def matmul(x1: array, x2: array, /) -> array:
         -   If ``x2`` has more than one dimension (including after vector-to-matrix promotion), ``shape(x2)[:-2]`` **must** be compatible with ``shape(x1)[:-2]`` (after vector-to-matrix promotion) (see :ref:`broadcasting`).
         -   If ``x2`` has shape ``(..., K, N)``, the innermost two dimensions form matrices on which to perform matrix multiplication.
 
+    transpose_a: bool
+        If ``True``, ``x1`` **must** be transposed prior to computing the matrix product (i.e., the innermost two dimensions of ``x1`` **must** be swapped, as if by :func:`~array_api.matrix_transpose`). If ``x1`` is a one-dimensional array, ``transpose_a`` **must** have no effect. **Must not** be ``True`` when ``adjoint_a`` is ``True``. Default: ``False``.
+    transpose_b: bool
+        If ``True``, ``x2`` **must** be transposed prior to computing the matrix product (i.e., the innermost two dimensions of ``x2`` **must** be swapped, as if by :func:`~array_api.matrix_transpose`). If ``x2`` is a one-dimensional array, ``transpose_b`` **must** have no effect. **Must not** be ``True`` when ``adjoint_b`` is ``True``. Default: ``False``.
+    adjoint_a: bool
+        If ``True``, ``x1`` **must** be conjugate transposed prior to computing the matrix product (i.e., ``x1`` **must** be complex-conjugated and the innermost two dimensions of ``x1`` **must** be swapped). If ``x1`` is a one-dimensional array, ``x1`` **must** only be complex-conjugated. If ``x1`` has a real-valued data type, ``adjoint_a`` **must** be equivalent to ``transpose_a``. Default: ``False``.
+    adjoint_b: bool
+        If ``True``, ``x2`` **must** be conjugate transposed prior to computing the matrix product (i.e., ``x2`` **must** be complex-conjugated and the innermost two dimensions of ``x2`` **must** be swapped). If ``x2`` is a one-dimensional array, ``x2`` **must** only be complex-conjugated. If ``x2`` has a real-valued data type, ``adjoint_b`` **must** be equivalent to ``transpose_b``. Default: ``False``.
+
     Returns
     -------
     out: array
@@ -49,16 +128,24 @@ def matmul(x1: array, x2: array, /) -> array:
         -   if ``x1`` is a one-dimensional array having shape ``(K,)``, ``x2`` is an array having shape ``(..., L, N)``, and ``K != L``.
         -   if ``x1`` is an array having shape ``(..., M, K)``, ``x2`` is a one-dimensional array having shape ``(L,)``, and ``K != L``.
         -   if ``x1`` is an array having shape ``(..., M, K)``, ``x2`` is an array having shape ``(..., L, N)``, and ``K != L``.
+        -   if both ``transpose_a`` and ``adjoint_a`` are ``True`` or both ``transpose_b`` and ``adjoint_b`` are ``True``.
 
     Notes
     -----
 
-    -   The ``matmul`` function **must** implement the same semantics as the built-in ``@`` operator (see `PEP 465 <https://www.python.org/dev/peps/pep-0465>`_).
+    -   When ``transpose_a``, ``transpose_b``, ``adjoint_a``, and ``adjoint_b`` are ``False``, the ``matmul`` function **must** implement the same semantics as the built-in ``@`` operator (see `PEP 465 <https://www.python.org/dev/peps/pep-0465>`_).
+
+    -   The shapes of ``x1`` and ``x2`` described above refer to the arrays after applying ``transpose_a`` or ``adjoint_a`` and ``transpose_b`` or ``adjoint_b``, respectively. For example, ``matmul(x1, x2, transpose_a=True)`` **must** be equivalent to ``matmul(matrix_transpose(x1), x2)``, and ``matmul(x1, x2, adjoint_b=True)`` **must** be equivalent to ``matmul(x1, conj(matrix_transpose(x2)))``.
 
-    -   If either ``x1`` or ``x2`` has a complex floating-point data type, the function **must not** complex-conjugate or transpose either argument. If conjugation and/or transposition is desired, a user can explicitly perform these operations prior to computing the matrix product.
+    -   If either ``x1`` or ``x2`` has a complex floating-point data type, the function **must not** complex-conjugate or transpose either argument unless requested via ``transpose_a``, ``transpose_b``, ``adjoint_a``, or ``adjoint_b``.
+
+    -   Conforming implementations **should** apply ``transpose_a``, ``transpose_b``, ``adjoint_a``, and ``adjoint_b`` without materializing transposed or complex-conjugated copies of ``x1`` and ``x2`` (e.g., by passing the corresponding transposition flags to an underlying BLAS routine). Accordingly, users **should** prefer ``matmul(x1, x2, adjoint_a=True)`` over ``matmul(conj(matrix_transpose(x1)), x2)``.
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``transpose_a``, ``transpose_b``, ``adjoint_a``, and ``adjoint_b`` keyword arguments.
     """
 
 
@@ -4,7 +4,14 @@ __all__ = ["argmax", "argmin", "count_nonzero", "nonzero", "searchsorted", "wher
 from ._types import Optional, Tuple, Literal, Union, array
 
 
-def argmax(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+def argmax(
+    x: array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+) -> array:
     """
     Returns the indices of the maximum values along a specified axis.
 
@@ -18,6 +25,8 @@ def argmax(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -
         axis along which to search. If ``None``, the function **must** return the index of the maximum value of the flattened array. If not ``None``, a valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
     keepdims: bool
         if ``True``, the reduced axes **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be broadcast-compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes **must not** be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, the handling of ``NaN`` values is unspecified and thus implementation-defined (e.g., a conforming implementation **may** return the index of the first ``NaN`` value). If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the returned index is unspecified and thus implementation-defined. Default: ``"propagate"``.
 
     Returns
     -------
@@ -28,10 +37,20 @@ def argmax(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -
     -----
 
     -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-dependent (see :ref:`complex-number-ordering`).
+
+    .. versionchanged:: 2026.12
+       Added the ``nan_policy`` keyword argument.
     """
 
 
-def argmin(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+def argmin(
+    x: array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+) -> array:
     """
     Returns the indices of the minimum values along a specified axis.
 
@@ -45,6 +64,8 @@ def argmin(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -
         axis along which to search. If ``None``, the function **must** return the index of the minimum value of the flattened array. If not ``None``, a valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
     keepdims: bool
         if ``True``, the reduced axes **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be broadcast-compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes **must not** be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, the handling of ``NaN`` values is unspecified and thus implementation-defined (e.g., a conforming implementation **may** return the index of the first ``NaN`` value). If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the returned index is unspecified and thus implementation-defined. Default: ``"propagate"``.
 
     Returns
     -------
@@ -55,6 +76,9 @@ def argmin(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -
     -----
 
     -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-dependent (see :ref:`complex-number-ordering`).
+
+    .. versionchanged:: 2026.12
+       Added the ``nan_policy`` keyword argument.
     """
 
 
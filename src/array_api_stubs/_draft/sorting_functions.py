@@ -1,7 +1,37 @@
-__all__ = ["argsort", "sort"]
+__all__ = ["argpartition", "argsort", "partition", "sort", "top_k"]
 
 
-from ._types import array
+from ._types import Tuple, array
+
+
+def argpartition(x: array, kth: int, /, *, axis: int = -1) -> array:
+    """
+    Returns the indices that partially sort an array ``x`` along a specified axis, such that the element at index ``kth`` is in its sorted position.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type. **Must** have at least one dimension.
+    kth: int
+        index of the element along ``axis`` which **must** be in its sorted position. A valid ``kth`` **must** be an integer on the interval ``[-M, M)``, where ``M`` is the size of ``x`` along ``axis``. If ``kth`` is a negative integer, the function **must** determine the index by counting backward from the end of the axis (where ``-1`` refers to the last element). If provided an invalid ``kth``, the function **must** raise an exception.
+    axis: int
+        axis along which to partition. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``-1``.
+
+    Returns
+    -------
+    out: array
+        an array of indices. The returned array **must** have the same shape as ``x``. The returned array **must** have the default array index data type. Let ``y`` be ``take_along_axis(x, out, axis=axis)``. Then, along ``axis``, ``y[kth]`` **must** equal the element at index ``kth`` of ``sort(x, axis=axis)``, every element before ``y[kth]`` **must** be less than or equal to ``y[kth]``, and every element after ``y[kth]`` **must** be greater than or equal to ``y[kth]``.
+
+    Notes
+    -----
+
+    -   The order of the indices before and after index ``kth`` is unspecified and thus implementation-dependent.
+    -   Conforming implementations **should** use a selection algorithm having expected linear time complexity in the size of ``x`` along ``axis`` (e.g., introselect), rather than sorting ``x``.
+    -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-dependent (see :ref:`complex-number-ordering`).
+    -   The order of NaNs and signed zeros is unspecified and thus implementation-dependent, as for :func:`~array_api.sort`.
+
+    .. versionadded:: 2026.12
+    """
 
 
 def argsort(
@@ -33,6 +63,36 @@ def argsort(
     """
 
 
+def partition(x: array, kth: int, /, *, axis: int = -1) -> array:
+    """
+    Returns a partially sorted copy of an input array ``x``, such that the element at index ``kth`` along a specified axis is in its sorted position.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type. **Must** have at least one dimension.
+    kth: int
+        index of the element along ``axis`` which **must** be in its sorted position. A valid ``kth`` **must** be an integer on the interval ``[-M, M)``, where ``M`` is the size of ``x`` along ``axis``. If ``kth`` is a negative integer, the function **must** determine the index by counting backward from the end of the axis (where ``-1`` refers to the last element). If provided an invalid ``kth``, the function **must** raise an exception.
+    axis: int
+        axis along which to partition. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``-1``.
+
+    Returns
+    -------
+    out: array
+        a partially sorted array. The returned array **must** have the same data type and shape as ``x``. Along ``axis``, the element at index ``kth`` **must** equal the element at index ``kth`` of ``sort(x, axis=axis)``, every element before index ``kth`` **must** be less than or equal to that element, and every element after index ``kth`` **must** be greater than or equal to that element.
+
+    Notes
+    -----
+
+    -   The order of the elements before and after index ``kth`` is unspecified and thus implementation-dependent.
+    -   Conforming implementations **should** use a selection algorithm having expected linear time complexity in the size of ``x`` along ``axis`` (e.g., introselect), rather than sorting ``x``.
+    -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-dependent (see :ref:`complex-number-ordering`).
+    -   The order of NaNs and signed zeros is unspecified and thus implementation-dependent, as for :func:`~array_api.sort`.
+
+    .. versionadded:: 2026.12
+    """
+
+
 def sort(
     x: array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
 ) -> array:
@@ -60,3 +120,50 @@ def sort(
 
     -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-dependent (see :ref:`complex-number-ordering`).
     """
+
+
+def top_k(
+    x: array,
+    k: int,
+    /,
+    *,
+    axis: int = -1,
+    largest: bool = True,
+    sorted: bool = True,
+) -> Tuple[array, array]:
+    """
+    Returns the ``k`` largest (or smallest) elements of an input array ``x`` along a specified axis, together with their indices.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type. **Must** have at least one dimension.
+    k: int
+        number of elements to return. **Must** be an integer on the interval ``[0, M]``, where ``M`` is the size of ``x`` along ``axis``. If provided an invalid ``k``, the function **must** raise an exception.
+    axis: int
+        axis along which to select elements. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``-1``.
+    largest: bool
+        if ``True``, the function **must** return the ``k`` largest elements. If ``False``, the function **must** return the ``k`` smallest elements. Default: ``True``.
+    sorted: bool
+        if ``True``, the returned elements **must** be sorted in descending order when ``largest`` is ``True`` and in ascending order when ``largest`` is ``False``. If ``False``, the order of the returned elements is unspecified and thus implementation-dependent. Default: ``True``.
+
+    Returns
+    -------
+    out: Tuple[array, array]
+        a namedtuple ``(values, indices)`` whose
+
+        -   first element **must** have the field name ``values`` and **must** be an array containing the selected elements. The array **must** have the same data type as ``x``.
+        -   second element **must** have the field name ``indices`` and **must** be an array containing the indices of the selected elements along ``axis`` (i.e., ``values`` **must** equal ``take_along_axis(x, indices, axis=axis)``). The array **must** have the default array index data type.
+
+        Each array **must** have the same shape as ``x``, except for the dimension ``axis``, which **must** have size ``k``. Accordingly, the shapes of the returned arrays do not depend on the values of ``x``.
+
+    Notes
+    -----
+
+    -   Conforming implementations **should** have expected time complexity linear in the size of ``x`` along ``axis`` for a fixed ``k`` (e.g., by selecting elements using introselect or a heap of size ``k``), plus the cost of sorting ``k`` elements if ``sorted`` is ``True``.
+    -   If several elements compare as equal, which of those elements are returned is unspecified and thus implementation-dependent; however, conforming implementations **should** prefer elements having smaller indices.
+    -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-dependent (see :ref:`complex-number-ordering`).
+    -   The order of NaNs and signed zeros is unspecified and thus implementation-dependent, as for :func:`~array_api.sort`.
+
+    .. versionadded:: 2026.12
+    """
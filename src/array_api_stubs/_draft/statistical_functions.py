@@ -1,17 +1,74 @@
 __all__ = [
+    "bincount",
     "cumulative_sum",
     "cumulative_prod",
+    "histogram",
+    "log_softmax",
+    "logsumexp",
     "max",
     "mean",
+    "mean_var",
+    "merge_moments",
     "min",
+    "minmax",
+    "moments",
+    "moments_var",
     "prod",
+    "segment_max",
+    "segment_mean",
+    "segment_min",
+    "segment_sum",
+    "softmax",
     "std",
     "sum",
     "var",
 ]
 
 
-from ._types import Optional, Tuple, Union, array, dtype
+from ._types import Literal, Optional, Tuple, Union, array, dtype
+
+
+def bincount(
+    x: array,
+    /,
+    *,
+    weights: Optional[array] = None,
+    minlength: int = 0,
+    length: Optional[int] = None,
+) -> array:
+    """
+    Counts the number of occurrences of each value in a one-dimensional array of non-negative integers.
+
+    .. admonition:: Data-dependent output shape
+        :class: important
+
+        When ``length`` is ``None``, the shape of the output array for this function depends on the data values in ``x``; hence, array libraries which build computation graphs (e.g., JAX, Dask, etc.) can find this function difficult to implement without knowing the values in ``x``. Accordingly, such libraries **may** choose to require ``length``; however, conforming implementations **must** support providing ``length``. See :ref:`data-dependent-output-shapes` section for more details.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Must** be a one-dimensional array having an integer data type. **Should** contain only non-negative values.
+    weights: Optional[array]
+        weights. If provided, **must** have the same shape as ``x`` and **should** have a numeric data type, and each bin **must** contain the sum of the weights of the elements of ``x`` equal to the bin index (see :func:`~array_api.sum`). If ``None``, each bin **must** contain the number of elements of ``x`` equal to the bin index. Default: ``None``.
+    minlength: int
+        minimum number of bins. **Must** be a non-negative integer. Default: ``0``.
+    length: Optional[int]
+        number of bins. If provided, **must** be a non-negative integer greater than or equal to ``minlength``, the returned array **must** have exactly ``length`` bins, and elements of ``x`` greater than or equal to ``length`` **must** be ignored. If ``None``, the number of bins **must** be the greater of ``minlength`` and one more than the maximum value of ``x`` (or ``0`` if ``x`` is empty). Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        a one-dimensional array containing the counts (or sums of weights) of the bins, where the element at index ``i`` corresponds to the value ``i``. If ``weights`` is ``None``, the returned array **must** have the default array index data type; otherwise, the returned array **must** have the same data type as ``weights``.
+
+    Notes
+    -----
+
+    -   Conforming implementations **should** compute the result in time linear in the number of elements of ``x``, without sorting ``x``.
+    -   The order in which weights are summed is unspecified and thus implementation-defined; accordingly, for floating-point weights, results **may** differ by rounding.
+    -   If ``x`` contains negative values, behavior is unspecified and thus implementation-defined.
+
+    .. versionadded:: 2026.12
+    """
 
 
 def cumulative_prod(
@@ -21,6 +78,7 @@ def cumulative_prod(
     axis: Optional[int] = None,
     dtype: Optional[dtype] = None,
     include_initial: bool = False,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the cumulative product of elements in the input array ``x``.
@@ -44,6 +102,8 @@ def cumulative_prod(
 
     include_initial: bool
         boolean indicating whether to include the initial value as the first value in the output. By convention, the initial value **must** be the multiplicative identity (i.e., one). Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -65,6 +125,9 @@ def cumulative_prod(
     For both real-valued and complex floating-point operands, special cases **must** be handled as if the operation is implemented by successive application of :func:`~array_api.multiply`.
 
     .. versionadded:: 2024.12
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
     """
 
 
@@ -75,6 +138,7 @@ def cumulative_sum(
     axis: Optional[int] = None,
     dtype: Optional[dtype] = None,
     include_initial: bool = False,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the cumulative sum of elements in the input array ``x``.
@@ -98,6 +162,8 @@ def cumulative_sum(
 
     include_initial: bool
         boolean indicating whether to include the initial value as the first value in the output. By convention, the initial value **must** be the additive identity (i.e., zero). Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -122,6 +188,137 @@ def cumulative_sum(
 
     .. versionchanged:: 2024.12
        Behavior when providing a zero-dimensional array is explicitly left unspecified.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` keyword argument.
+    """
+
+
+def histogram(
+    x: array,
+    /,
+    bins: Union[int, array] = 10,
+    *,
+    range: Optional[Tuple[Union[int, float], Union[int, float]]] = None,
+    weights: Optional[array] = None,
+) -> Tuple[array, array]:
+    """
+    Computes the histogram of the input array ``x``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type. The histogram **must** be computed over the flattened array.
+    bins: Union[int, array]
+        bins of the histogram. If an integer, ``bins`` **must** be positive and **must** specify the number of equal-width bins spanning ``range``. If an array, ``bins`` **must** be a one-dimensional array containing at least two monotonically increasing bin edges, in which case ``range`` **must** be ignored. Default: ``10``.
+    range: Optional[Tuple[Union[int, float], Union[int, float]]]
+        lower and upper edges of the bins when ``bins`` is an integer. If provided, the lower edge **must** be less than or equal to the upper edge. If ``None``, the edges **must** be the minimum and maximum values of the elements of ``x`` which are not ``NaN`` (or ``0`` and ``1`` if there are no such elements). If the lower and upper edges are equal, the edges **must** be extended by ``0.5`` in each direction. Default: ``None``.
+    weights: Optional[array]
+        weights. If provided, **must** have the same shape as ``x`` and **should** have a real-valued data type, and each bin **must** contain the sum of the weights of the elements of ``x`` falling in the bin (see :func:`~array_api.sum`). If ``None``, each bin **must** contain the number of elements of ``x`` falling in the bin. Default: ``None``.
+
+    Returns
+    -------
+    out: Tuple[array, array]
+        a namedtuple ``(counts, bin_edges)`` whose
+
+        -   first element **must** have the field name ``counts`` and **must** be a one-dimensional array containing the counts (or sums of weights) of the bins. If ``weights`` is ``None``, the array **must** have the default array index data type; otherwise, the array **must** have the same data type as ``weights``.
+        -   second element **must** have the field name ``bin_edges`` and **must** be a one-dimensional array containing the bin edges. The array **must** have one more element than ``counts``. If ``bins`` is an array, the array **must** equal ``bins``; otherwise, the array **must** contain ``bins + 1`` equally spaced edges (see :func:`~array_api.linspace`) and **must** have the same data type as ``x`` if ``x`` has a real-valued floating-point data type, and the default real-valued floating-point data type otherwise.
+
+    Notes
+    -----
+
+    -   Every bin except the last bin **must** be half-open. Accordingly, an element ``x_i`` **must** fall in bin ``k`` if ``bin_edges[k] <= x_i < bin_edges[k+1]``, or, for the last bin, if ``bin_edges[k] <= x_i <= bin_edges[k+1]``.
+    -   Elements of ``x`` which are ``NaN`` or which lie outside of the bin edges **must** be excluded from the histogram.
+    -   When ``bins`` is an integer, the shape of the returned arrays **must** only depend on ``bins``, and not on the data values in ``x``. Conforming implementations **should** compute the histogram in time linear in the number of elements of ``x``, without sorting ``x``.
+    -   If ``range`` is ``None`` and ``x`` contains infinite values, behavior is unspecified and thus implementation-defined.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def log_softmax(x: array, /, *, axis: int = -1, out: Optional[array] = None) -> array:
+    """
+    Calculates the logarithm of the softmax function of the input array ``x`` along a specified axis.
+
+    For each element ``x_i`` in a one-dimensional slice of ``x`` along ``axis``, the result is ``x_i - logsumexp(x)``, where ``logsumexp(x)`` is the logarithm of the sum of exponentials of the elements in the slice (see :func:`~array_api.logsumexp`).
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued floating-point data type.
+    axis: int
+        axis along which to compute the logarithm of the softmax function. Each one-dimensional slice of ``x`` along ``axis`` **must** be normalized independently. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``-1``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the logarithm of the softmax function of each slice. The returned array **must** have the same shape and data type as ``x``.
+
+    Notes
+    -----
+
+    -   Conforming implementations **must** compute the result without overflow for large finite ``x_i`` and without taking the logarithm of a result of :func:`~array_api.softmax` which underflowed (i.e., ``log(softmax(x))`` is not a conforming implementation).
+
+    **Special Cases**
+
+    For real-valued floating-point operands,
+
+    - If any element in a slice is ``NaN``, the result is ``NaN`` for every element in the slice.
+    - If any element in a slice is ``+infinity``, the result is ``NaN`` for every element in the slice.
+    - If every element in a slice is ``-infinity``, the result is ``NaN`` for every element in the slice.
+    - In the remaining cases, if ``x_i`` is ``-infinity``, the result is ``-infinity``.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def logsumexp(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    """
+    Calculates the logarithm of the sum of exponentials of the elements of the input array ``x``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued floating-point data type.
+    axis: Optional[Union[int, Tuple[int, ...]]]
+        axis or axes along which to compute the logarithm of the sum of exponentials. By default, the result **must** be computed over the entire array. If a tuple of integers, the result **must** be computed over multiple axes. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
+    keepdims: bool
+        if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        if the logarithm of the sum of exponentials is computed over the entire array, a zero-dimensional array containing the result; otherwise, a non-zero-dimensional array containing the results. The returned array **must** have the same data type as ``x``.
+
+    Notes
+    -----
+
+    -   The result is an implementation-dependent approximation to ``log(sum(exp(x)))``. Conforming implementations **must not** overflow or underflow when evaluating intermediate results for finite ``x_i`` (e.g., by computing ``m + log(sum(exp(x - m)))``, where ``m`` is the maximum value, or by a single pass which rescales a running sum whenever the running maximum increases).
+    -   For two elements, the result is equal to the result of :func:`~array_api.logaddexp`.
+
+    **Special Cases**
+
+    Let ``M`` equal the number of elements over which to compute the result.
+
+    For real-valued floating-point operands,
+
+    - If ``M`` is ``0``, the result is ``-infinity`` (i.e., the logarithm of the empty sum).
+    - If any ``x_i`` is ``NaN``, the result is ``NaN``.
+    - If any ``x_i`` is ``+infinity`` and no ``x_i`` is ``NaN``, the result is ``+infinity``.
+    - If every ``x_i`` is ``-infinity``, the result is ``-infinity``.
+
+    .. versionadded:: 2026.12
     """
 
 
@@ -131,6 +328,9 @@ def max(
     *,
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the maximum value of the input array ``x``.
@@ -143,6 +343,12 @@ def max(
         axis or axes along which to compute maximum values. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. By default, the maximum value **must** be computed over the entire array. If a tuple of integers, maximum values **must** be computed over multiple axes. Default: ``None``.
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the maximum value **must** be ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. If no element is selected, the maximum value is implementation-defined as for a zero-size reduction (see Notes). If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -166,6 +372,9 @@ def max(
 
     .. versionchanged:: 2023.12
        Clarified that the order of signed zeros is implementation-defined.
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
     """
 
 
@@ -175,6 +384,9 @@ def mean(
     *,
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the arithmetic mean of the input array ``x``.
@@ -187,6 +399,12 @@ def mean(
         axis or axes along which to compute arithmetic means. By default, the mean **must** be computed over the entire array. If a tuple of integers, arithmetic means **must** be computed over multiple axes. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the arithmetic mean **must** be ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if no element is selected, the arithmetic mean **must** be ``NaN``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -216,6 +434,100 @@ def mean(
 
     .. versionchanged:: 2024.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
+    """
+
+
+def mean_var(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[Tuple[array, array]] = None,
+) -> Tuple[array, array]:
+    """
+    Calculates both the arithmetic mean and the variance of the input array ``x``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued floating-point data type.
+    axis: Optional[Union[int, Tuple[int, ...]]]
+        axis or axes along which the mean and variance **must** be computed. By default, the mean and variance **must** be computed over the entire array. If a tuple of integers, the mean and variance **must** be computed over multiple axes. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
+    correction: Union[int, float]
+        degrees of freedom adjustment of the variance, having the same meaning as for :func:`~array_api.var`. **Must** be greater than or equal to ``0``. Default: ``0``.
+    keepdims: bool
+        if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, ``N`` **must** be the number of elements which are not ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, ``N`` **must** be the number of selected elements. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[Tuple[array, array]]
+        pair of arrays ``(mean, var)`` into which the results **must** be written (see :ref:`out-keyword-argument`). If provided, each array **must** have the shape and data type of the respective result, and the function **must** return a namedtuple whose elements are the arrays in ``out``. If ``None``, the results **must** be written to newly allocated arrays. Default: ``None``.
+
+    Returns
+    -------
+    out: Tuple[array, array]
+        a namedtuple ``(mean, var)`` whose
+
+        -   first element **must** have the field name ``mean`` and **must** be an array containing the arithmetic means (see :func:`~array_api.mean`).
+        -   second element **must** have the field name ``var`` and **must** be an array containing the variances (see :func:`~array_api.var`).
+
+        Each array **must** have the same data type as ``x`` and **must** have the shape of the result of :func:`~array_api.mean` for the same ``axis`` and ``keepdims``.
+
+    Notes
+    -----
+
+    -   The returned arrays **must** be equal to the results of :func:`~array_api.mean` and :func:`~array_api.var` for the same arguments, up to rounding. Conforming implementations **should** compute both statistics in a single pass over ``x`` (e.g., using Welford's algorithm) while avoiding catastrophic cancellation, rather than first computing the mean and then the variance.
+
+    **Special Cases**
+
+    Let ``N`` equal the number of elements over which to compute the mean and variance.
+
+    -   If ``N`` is ``0``, ``mean`` **must** be ``NaN``.
+    -   If ``N - correction`` is less than or equal to ``0``, ``var`` **must** be ``NaN``.
+    -   If ``x_i`` is ``NaN``, ``mean`` and ``var`` **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionadded:: 2026.12
+    """
+
+
+def merge_moments(
+    moments1: Tuple[array, array, array], moments2: Tuple[array, array, array], /
+) -> Tuple[array, array, array]:
+    """
+    Merges the partial moments of two disjoint sets of elements into the partial moments of their union.
+
+    Parameters
+    ----------
+    moments1: Tuple[array, array, array]
+        partial moments ``(count, mean, m2)`` of the first set of elements, as returned by :func:`~array_api.moments` or by this function.
+    moments2: Tuple[array, array, array]
+        partial moments ``(count, mean, m2)`` of the second set of elements. The arrays in ``moments2`` **must** be compatible with the arrays in ``moments1`` (see :ref:`broadcasting`). The arrays ``mean`` and ``m2`` **must** have the same data type as the respective arrays in ``moments1``.
+
+    Returns
+    -------
+    out: Tuple[array, array, array]
+        a namedtuple ``(count, mean, m2)`` containing the partial moments of the union of both sets of elements, as described for :func:`~array_api.moments`. Each array **must** have the shape determined by :ref:`broadcasting` the respective arrays in ``moments1`` and ``moments2``. Each array **must** have the same data type as the respective array in ``moments1``.
+
+    Notes
+    -----
+
+    -   Let ``n_a``, ``mean_a``, and ``m2_a`` be the partial moments of the first set, and let ``n_b``, ``mean_b``, and ``m2_b`` be the partial moments of the second set. Conforming implementations **should** merge partial moments according to the pairwise update by Chan, Golub, and LeVeque (i.e., with ``n = n_a + n_b`` and ``delta = mean_b - mean_a``, ``count = n``, ``mean = mean_a + delta * n_b / n``, and ``m2 = m2_a + m2_b + delta**2 * n_a * n_b / n``), which, unlike accumulating sums of squares, does not suffer from catastrophic cancellation.
+    -   Merging is commutative and associative up to differences in rounding. Accordingly, partial moments of chunks **may** be merged in any order (e.g., as a tree reduction over chunks computed in parallel).
+
+    **Special Cases**
+
+    -   If ``n_a`` is ``0``, the partial moments **must** be equal to the partial moments of the second set.
+    -   If ``n_b`` is ``0``, the partial moments **must** be equal to the partial moments of the first set.
+
+    .. versionadded:: 2026.12
     """
 
 
@@ -225,6 +537,9 @@ def min(
     *,
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the minimum value of the input array ``x``.
@@ -237,6 +552,12 @@ def min(
         axis or axes along which to compute minimum values. By default, the minimum value **must** be computed over the entire array. If a tuple of integers, minimum values **must** be computed over multiple axes. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the minimum value **must** be ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. If no element is selected, the minimum value is implementation-defined as for a zero-size reduction (see Notes). If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -260,6 +581,150 @@ def min(
 
     .. versionchanged:: 2023.12
        Clarified that the order of signed zeros is implementation-defined.
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
+    """
+
+
+def minmax(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[Tuple[array, array]] = None,
+) -> Tuple[array, array]:
+    """
+    Calculates both the minimum value and the maximum value of the input array ``x``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type.
+    axis: Optional[Union[int, Tuple[int, ...]]]
+        axis or axes along which minimum and maximum values **must** be computed. By default, minimum and maximum values **must** be computed over the entire array. If a tuple of integers, minimum and maximum values **must** be computed over multiple axes. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
+    keepdims: bool
+        if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, both the minimum value and the maximum value **must** be ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. If no element is selected, the returned values are implementation-defined as for a zero-size reduction (see Notes). If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[Tuple[array, array]]
+        pair of arrays ``(min, max)`` into which the results **must** be written (see :ref:`out-keyword-argument`). If provided, each array **must** have the shape and data type of the respective result, and the function **must** return a namedtuple whose elements are the arrays in ``out``. If ``None``, the results **must** be written to newly allocated arrays. Default: ``None``.
+
+    Returns
+    -------
+    out: Tuple[array, array]
+        a namedtuple ``(min, max)`` whose
+
+        -   first element **must** have the field name ``min`` and **must** be an array containing the minimum values (see :func:`~array_api.min`).
+        -   second element **must** have the field name ``max`` and **must** be an array containing the maximum values (see :func:`~array_api.max`).
+
+        Each array **must** have the same data type as ``x`` and **must** have the shape of the result of :func:`~array_api.min` for the same ``axis`` and ``keepdims``.
+
+    Notes
+    -----
+
+    -   The returned arrays **must** be equal to the results of :func:`~array_api.min` and :func:`~array_api.max` for the same arguments. Conforming implementations **should** compute both values in a single pass over ``x``.
+    -   When the number of elements over which to compute the minimum and maximum values is zero, the returned values are implementation-defined, as for :func:`~array_api.min` and :func:`~array_api.max`.
+    -   The order of signed zeros is unspecified and thus implementation-defined.
+    -   For backward compatibility, conforming implementations **may** support complex numbers; however, inequality comparison of complex numbers is unspecified and thus implementation-defined (see :ref:`complex-number-ordering`).
+
+    **Special Cases**
+
+    For floating-point operands,
+
+    -   If ``x_i`` is ``NaN``, both the minimum value and the maximum value **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionadded:: 2026.12
+    """
+
+
+def moments(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> Tuple[array, array, array]:
+    """
+    Calculates the partial moments (i.e., the number of elements, the arithmetic mean, and the sum of squared deviations from the mean) of the input array ``x``.
+
+    Partial moments of disjoint chunks of a dataset can be merged using :func:`~array_api.merge_moments`, and the variance and standard deviation of the dataset can be computed from the merged partial moments using :func:`~array_api.moments_var`. Accordingly, statistics over datasets which do not fit into memory, or which are distributed over devices, can be computed one chunk at a time.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued floating-point data type.
+    axis: Optional[Union[int, Tuple[int, ...]]]
+        axis or axes along which partial moments **must** be computed. By default, the partial moments **must** be computed over the entire array. If a tuple of integers, partial moments **must** be computed over multiple axes. A valid axis **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``None``.
+    keepdims: bool
+        if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+
+    Returns
+    -------
+    out: Tuple[array, array, array]
+        a namedtuple ``(count, mean, m2)`` whose
+
+        -   first element **must** have the field name ``count`` and **must** be an array containing the number of elements over which the partial moments were computed. The array **must** have the default array index data type.
+        -   second element **must** have the field name ``mean`` and **must** be an array containing the arithmetic means (see :func:`~array_api.mean`). The array **must** have the same data type as ``x``.
+        -   third element **must** have the field name ``m2`` and **must** be an array containing the sums of squared deviations of the elements from their arithmetic mean. The array **must** have the same data type as ``x``.
+
+        Each array **must** have the shape of the result of :func:`~array_api.mean` for the same ``axis`` and ``keepdims``.
+
+    Notes
+    -----
+
+    -   Conforming implementations **should** compute ``m2`` without forming differences of large sums (e.g., using a two-pass algorithm or Welford's algorithm) in order to avoid catastrophic cancellation.
+
+    **Special Cases**
+
+    Let ``M`` equal the number of elements over which to compute the partial moments.
+
+    -   If ``M`` is ``0``, ``count`` **must** be ``0``, ``mean`` **must** be ``NaN``, and ``m2`` **must** be ``0``.
+    -   If ``x_i`` is ``NaN``, ``mean`` and ``m2`` **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionadded:: 2026.12
+    """
+
+
+def moments_var(
+    moments: Tuple[array, array, array],
+    /,
+    *,
+    correction: Union[int, float] = 0.0,
+) -> array:
+    """
+    Calculates the variance from partial moments.
+
+    Parameters
+    ----------
+    moments: Tuple[array, array, array]
+        partial moments ``(count, mean, m2)``, as returned by :func:`~array_api.moments` or :func:`~array_api.merge_moments`.
+    correction: Union[int, float]
+        degrees of freedom adjustment, as described for :func:`~array_api.var`. **Must** be a nonnegative real number. Default: ``0``.
+
+    Returns
+    -------
+    out: array
+        an array containing the variances (i.e., ``m2 / (count - correction)``). The returned array **must** have the shape determined by :ref:`broadcasting` ``count`` and ``m2`` and **must** have the same data type as ``m2``.
+
+    Notes
+    -----
+
+    -   If ``moments`` are the partial moments of the elements of an array ``x`` (possibly merged from the partial moments of disjoint chunks of ``x``), the result **must** be equal to the result of :func:`~array_api.var` for ``x`` and the same ``correction``, up to differences in rounding. Accordingly, the standard deviation (see :func:`~array_api.std`) is the square root of the result (see :func:`~array_api.sqrt`).
+
+    **Special Cases**
+
+    Let ``N`` equal ``count``.
+
+    -   If ``N - correction`` is less than or equal to ``0``, the variance **must** be ``NaN``.
+    -   If ``m2`` is ``NaN``, the variance **must** be ``NaN``.
+
+    .. versionadded:: 2026.12
     """
 
 
@@ -270,6 +735,9 @@ def prod(
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     dtype: Optional[dtype] = None,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the product of input array ``x`` elements.
@@ -291,6 +759,12 @@ def prod(
 
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the product **must** be ``1``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if no element is selected, the product **must** be ``1``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -313,6 +787,271 @@ def prod(
 
     .. versionchanged:: 2023.12
        Required the function to return a floating-point array having the same data type as the input array when provided a floating-point array.
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
+    """
+
+
+def segment_max(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    """
+    Calculates the maximum value of each segment of the input array ``x`` along a specified axis.
+
+    A segment is the set of elements of ``x`` along ``axis`` having the same segment index in ``segment_ids``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type. **Must** have at least one dimension.
+    segment_ids: array
+        one-dimensional array containing the segment index of each element of ``x`` along ``axis``. **Must** have an integer data type. **Must** have ``shape(x)[axis]`` elements. Elements of ``x`` whose segment index is not on the interval ``[0, num_segments)`` **must** be ignored.
+    num_segments: int
+        number of segments. **Must** be a nonnegative integer. The size of the returned array along ``axis`` **must** equal ``num_segments``, regardless of the values in ``segment_ids``.
+    axis: int
+        axis along which to compute the maximum values. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``0``.
+    indices_are_sorted: bool
+        if ``True``, the caller guarantees that ``segment_ids`` is sorted in ascending order, and conforming implementations **may** rely on this guarantee (e.g., in order to reduce contiguous runs of elements). If ``True`` and ``segment_ids`` is not sorted, behavior is unspecified and thus implementation-defined. Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the maximum values. The returned array **must** have the same shape as ``x``, except for the dimension ``axis``, which **must** have size ``num_segments``. The element at index ``j`` along ``axis`` **must** be the maximum value of the elements of ``x`` along ``axis`` whose segment index is ``j``. The returned array **must** have the same data type as ``x``.
+
+    Notes
+    -----
+
+    -   Because the shape of the returned array only depends on ``shape(x)``, ``axis``, and ``num_segments``, the shape is known before the values of ``segment_ids`` are known (e.g., when tracing a program), unlike the output of :func:`~array_api.unique_inverse`.
+    -   The order in which the elements of each segment are combined is unspecified and thus implementation-defined.
+    -   The order of signed zeros is unspecified and thus implementation-defined. When choosing between ``-0`` or ``+0`` as a maximum value, specification-compliant libraries **may** choose to return either value.
+
+    **Special Cases**
+
+    Let ``M`` equal the number of elements in a segment.
+
+    -   If ``M`` is ``0`` and ``x`` has a real-valued floating-point data type, the maximum value **must** be ``-infinity``.
+    -   If ``M`` is ``0`` and ``x`` has an integer data type, the maximum value **must** be the smallest value representable by the data type of ``x``.
+
+    For floating-point operands,
+
+    -   If ``x_i`` is ``NaN``, the maximum value of the segment containing ``x_i`` **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionadded:: 2026.12
+    """
+
+
+def segment_mean(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    """
+    Calculates the arithmetic mean of each segment of the input array ``x`` along a specified axis.
+
+    A segment is the set of elements of ``x`` along ``axis`` having the same segment index in ``segment_ids``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a floating-point data type. **Must** have at least one dimension.
+    segment_ids: array
+        one-dimensional array containing the segment index of each element of ``x`` along ``axis``. **Must** have an integer data type. **Must** have ``shape(x)[axis]`` elements. Elements of ``x`` whose segment index is not on the interval ``[0, num_segments)`` **must** be ignored.
+    num_segments: int
+        number of segments. **Must** be a nonnegative integer. The size of the returned array along ``axis`` **must** equal ``num_segments``, regardless of the values in ``segment_ids``.
+    axis: int
+        axis along which to compute the arithmetic means. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``0``.
+    indices_are_sorted: bool
+        if ``True``, the caller guarantees that ``segment_ids`` is sorted in ascending order, and conforming implementations **may** rely on this guarantee (e.g., in order to reduce contiguous runs of elements). If ``True`` and ``segment_ids`` is not sorted, behavior is unspecified and thus implementation-defined. Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the arithmetic means. The returned array **must** have the same shape as ``x``, except for the dimension ``axis``, which **must** have size ``num_segments``. The element at index ``j`` along ``axis`` **must** be the arithmetic mean of the elements of ``x`` along ``axis`` whose segment index is ``j``. The returned array **must** have the same data type as ``x``.
+
+    Notes
+    -----
+
+    -   Because the shape of the returned array only depends on ``shape(x)``, ``axis``, and ``num_segments``, the shape is known before the values of ``segment_ids`` are known (e.g., when tracing a program), unlike the output of :func:`~array_api.unique_inverse`.
+    -   The order in which the elements of each segment are combined is unspecified and thus implementation-defined.
+    -   While this specification recommends that this function only accept input arrays having a floating-point data type, specification-compliant array libraries **may** choose to accept input arrays having an integer data type. While mixed data type promotion is implementation-defined, if the input array ``x`` has an integer data type, the returned array **must** have the default real-valued floating-point data type.
+
+    **Special Cases**
+
+    Let ``M`` equal the number of elements in a segment.
+
+    -   If ``M`` is ``0``, the arithmetic mean **must** be ``NaN`` (or ``NaN + NaN j`` for complex floating-point operands).
+
+    For both real-valued and complex floating-point operands, special cases **must** be handled as if the operation is implemented by successive application of :func:`~array_api.add` followed by :func:`~array_api.divide`.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def segment_min(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    """
+    Calculates the minimum value of each segment of the input array ``x`` along a specified axis.
+
+    A segment is the set of elements of ``x`` along ``axis`` having the same segment index in ``segment_ids``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued data type. **Must** have at least one dimension.
+    segment_ids: array
+        one-dimensional array containing the segment index of each element of ``x`` along ``axis``. **Must** have an integer data type. **Must** have ``shape(x)[axis]`` elements. Elements of ``x`` whose segment index is not on the interval ``[0, num_segments)`` **must** be ignored.
+    num_segments: int
+        number of segments. **Must** be a nonnegative integer. The size of the returned array along ``axis`` **must** equal ``num_segments``, regardless of the values in ``segment_ids``.
+    axis: int
+        axis along which to compute the minimum values. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``0``.
+    indices_are_sorted: bool
+        if ``True``, the caller guarantees that ``segment_ids`` is sorted in ascending order, and conforming implementations **may** rely on this guarantee (e.g., in order to reduce contiguous runs of elements). If ``True`` and ``segment_ids`` is not sorted, behavior is unspecified and thus implementation-defined. Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the minimum values. The returned array **must** have the same shape as ``x``, except for the dimension ``axis``, which **must** have size ``num_segments``. The element at index ``j`` along ``axis`` **must** be the minimum value of the elements of ``x`` along ``axis`` whose segment index is ``j``. The returned array **must** have the same data type as ``x``.
+
+    Notes
+    -----
+
+    -   Because the shape of the returned array only depends on ``shape(x)``, ``axis``, and ``num_segments``, the shape is known before the values of ``segment_ids`` are known (e.g., when tracing a program), unlike the output of :func:`~array_api.unique_inverse`.
+    -   The order in which the elements of each segment are combined is unspecified and thus implementation-defined.
+    -   The order of signed zeros is unspecified and thus implementation-defined. When choosing between ``-0`` or ``+0`` as a minimum value, specification-compliant libraries **may** choose to return either value.
+
+    **Special Cases**
+
+    Let ``M`` equal the number of elements in a segment.
+
+    -   If ``M`` is ``0`` and ``x`` has a real-valued floating-point data type, the minimum value **must** be ``+infinity``.
+    -   If ``M`` is ``0`` and ``x`` has an integer data type, the minimum value **must** be the largest value representable by the data type of ``x``.
+
+    For floating-point operands,
+
+    -   If ``x_i`` is ``NaN``, the minimum value of the segment containing ``x_i`` **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionadded:: 2026.12
+    """
+
+
+def segment_sum(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    dtype: Optional[dtype] = None,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    """
+    Calculates the sum of each segment of the input array ``x`` along a specified axis.
+
+    A segment is the set of elements of ``x`` along ``axis`` having the same segment index in ``segment_ids``.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a numeric data type. **Must** have at least one dimension.
+    segment_ids: array
+        one-dimensional array containing the segment index of each element of ``x`` along ``axis``. **Must** have an integer data type. **Must** have ``shape(x)[axis]`` elements. Elements of ``x`` whose segment index is not on the interval ``[0, num_segments)`` **must** be ignored.
+    num_segments: int
+        number of segments. **Must** be a nonnegative integer. The size of the returned array along ``axis`` **must** equal ``num_segments``, regardless of the values in ``segment_ids``.
+    axis: int
+        axis along which to compute the sums. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``0``.
+    dtype: Optional[dtype]
+        data type of the returned array. If ``None``, the data type **must** be determined as for the ``dtype`` keyword argument of :func:`~array_api.sum`. If the data type (either specified or resolved) differs from the data type of ``x``, the input array **should** be cast to the specified data type before computing the sums. Default: ``None``.
+    indices_are_sorted: bool
+        if ``True``, the caller guarantees that ``segment_ids`` is sorted in ascending order, and conforming implementations **may** rely on this guarantee (e.g., in order to reduce contiguous runs of elements). If ``True`` and ``segment_ids`` is not sorted, behavior is unspecified and thus implementation-defined. Default: ``False``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the sums. The returned array **must** have the same shape as ``x``, except for the dimension ``axis``, which **must** have size ``num_segments``. The element at index ``j`` along ``axis`` **must** be the sum of the elements of ``x`` along ``axis`` whose segment index is ``j``. The returned array **must** have a data type as described by the ``dtype`` parameter above.
+
+    Notes
+    -----
+
+    -   Because the shape of the returned array only depends on ``shape(x)``, ``axis``, and ``num_segments``, the shape is known before the values of ``segment_ids`` are known (e.g., when tracing a program), unlike the output of :func:`~array_api.unique_inverse`.
+    -   The order in which the elements of each segment are combined is unspecified and thus implementation-defined.
+
+    **Special Cases**
+
+    Let ``M`` equal the number of elements in a segment.
+
+    -   If ``M`` is ``0``, the sum **must** be ``0`` (i.e., the empty sum).
+
+    For both real-valued and complex floating-point operands, special cases **must** be handled as if the operation is implemented by successive application of :func:`~array_api.add`.
+
+    .. versionadded:: 2026.12
+    """
+
+
+def softmax(x: array, /, *, axis: int = -1, out: Optional[array] = None) -> array:
+    """
+    Calculates the softmax function of the input array ``x`` along a specified axis.
+
+    For each element ``x_i`` in a one-dimensional slice of ``x`` along ``axis``, the result is ``exp(x_i) / sum(exp(x))``, where ``sum(exp(x))`` is the sum of exponentials of the elements in the slice.
+
+    Parameters
+    ----------
+    x: array
+        input array. **Should** have a real-valued floating-point data type.
+    axis: int
+        axis along which to compute the softmax function. Each one-dimensional slice of ``x`` along ``axis`` **must** be normalized independently. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an axis is specified as a negative integer, the function **must** determine the axis along which to perform the operation by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid axis, the function **must** raise an exception. Default: ``-1``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array containing the softmax function of each slice. The returned array **must** have the same shape and data type as ``x``. Each element of the returned array **must** be on the interval ``[0, 1]``, and the elements of each slice **should** sum to approximately ``1``.
+
+    Notes
+    -----
+
+    -   Conforming implementations **must** compute the result without overflow for large finite ``x_i`` (e.g., by computing ``exp(x_i - logsumexp(x))``, see :func:`~array_api.logsumexp`).
+
+    **Special Cases**
+
+    For real-valued floating-point operands,
+
+    - If any element in a slice is ``NaN``, the result is ``NaN`` for every element in the slice.
+    - If any element in a slice is ``+infinity``, the result is ``NaN`` for every element in the slice.
+    - If every element in a slice is ``-infinity``, the result is ``NaN`` for every element in the slice.
+    - In the remaining cases, if ``x_i`` is ``-infinity``, the result is ``+0``.
+
+    .. versionadded:: 2026.12
     """
 
 
@@ -323,6 +1062,9 @@ def std(
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     correction: Union[int, float] = 0.0,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the standard deviation of the input array ``x``.
@@ -337,6 +1079,12 @@ def std(
         degrees of freedom adjustment. Setting this parameter to a value other than ``0`` has the effect of adjusting the divisor during the calculation of the standard deviation according to ``M-c`` where ``M`` corresponds to the total number of elements over which the standard deviation is computed and ``c`` corresponds to the provided degrees of freedom adjustment. When computing the standard deviation of a population, setting this parameter to ``0`` is the standard choice (i.e., the provided array contains data constituting an entire population). When computing the corrected sample standard deviation, setting this parameter to ``1`` is the standard choice (i.e., the provided array contains data sampled from a larger population; this is commonly referred to as Bessel's correction). Default: ``0``.
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, ``M`` **must** be the number of elements which are not ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if the number of selected elements minus ``correction`` is less than or equal to ``0``, the standard deviation **must** be ``NaN``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -354,6 +1102,9 @@ def std(
 
     -   If ``M - correction`` is less than or equal to ``0``, the standard deviation **must** be ``NaN``.
     -   If ``x_i`` is ``NaN``, the standard deviation **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
     """
 
 
@@ -364,6 +1115,9 @@ def sum(
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     dtype: Optional[dtype] = None,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the sum of the input array ``x``.
@@ -385,6 +1139,12 @@ def sum(
 
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, if every element is ``NaN``, the sum **must** be ``0``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if no element is selected, the sum **must** be ``0``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -407,6 +1167,9 @@ def sum(
 
     .. versionchanged:: 2023.12
        Required the function to return a floating-point array having the same data type as the input array when provided a floating-point array.
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
     """
 
 
@@ -417,6 +1180,9 @@ def var(
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     correction: Union[int, float] = 0.0,
     keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Calculates the variance of the input array ``x``.
@@ -431,6 +1197,12 @@ def var(
         degrees of freedom adjustment. Setting this parameter to a value other than ``0`` has the effect of adjusting the divisor during the calculation of the variance according to ``M-c`` where ``M`` corresponds to the total number of elements over which the variance is computed and ``c`` corresponds to the provided degrees of freedom adjustment. When computing the variance of a population, setting this parameter to ``0`` is the standard choice (i.e., the provided array contains data constituting an entire population). When computing the unbiased sample variance, setting this parameter to ``1`` is the standard choice (i.e., the provided array contains data sampled from a larger population; this is commonly referred to as Bessel's correction). Default: ``0``.
     keepdims: bool
         if ``True``, the reduced axes (dimensions) **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes (dimensions) **must** not be included in the result. Default: ``False``.
+    nan_policy: Literal["propagate", "omit"]
+        how ``NaN`` values **must** be handled. If ``"propagate"``, ``NaN`` values **must** be handled as described in the special cases below. If ``"omit"``, elements which are ``NaN`` (or, for complex floating-point operands, elements having a ``NaN`` real or imaginary component) **must** be excluded from the computation, as if they were not present in ``x``. In particular, ``M`` **must** be the number of elements which are not ``NaN``. Default: ``"propagate"``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if the number of selected elements minus ``correction`` is less than or equal to ``0``, the variance **must** be ``NaN``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -448,4 +1220,7 @@ def var(
 
     -   If ``M - correction`` is less than or equal to ``0``, the variance **must** be ``NaN``.
     -   If ``x_i`` is ``NaN``, the variance **must** be ``NaN`` (i.e., ``NaN`` values propagate).
+
+    .. versionchanged:: 2026.12
+       Added the ``out``, ``nan_policy``, and ``where`` keyword arguments.
     """
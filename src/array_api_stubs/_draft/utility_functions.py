@@ -10,6 +10,8 @@ def all(
     *,
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     keepdims: bool = False,
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Tests whether all input array elements evaluate to ``True`` along a specified axis.
@@ -22,6 +24,10 @@ def all(
         axis or axes along which to perform a logical AND reduction. By default, a logical AND reduction **must** be performed over the entire array. If a tuple of integers, logical AND reductions **must** be performed over multiple axes. A valid ``axis`` **must** be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an ``axis`` is specified as a negative integer, the function **must** determine the axis along which to perform a reduction by counting backward from the last axis (where ``-1`` refers to the last axis). If provided an invalid ``axis``, the function **must** raise an exception. Default: ``None``.
     keepdims: bool
         If ``True``, the reduced axes **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be broadcast-compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes **must not** be included in the result. Default: ``False``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if no element is selected, the test result **must** be ``True``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -37,6 +43,9 @@ def all(
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` and ``where`` keyword arguments.
     """
 
 
@@ -46,6 +55,8 @@ def any(
     *,
     axis: Optional[Union[int, Tuple[int, ...]]] = None,
     keepdims: bool = False,
+    where: Optional[array] = None,
+    out: Optional[array] = None,
 ) -> array:
     """
     Tests whether any input array element evaluates to ``True`` along a specified axis.
@@ -58,6 +69,10 @@ def any(
         axis or axes along which to perform a logical OR reduction. By default, a logical OR reduction **must** be performed over the entire array. If a tuple of integers, logical OR reductions **must** be performed over multiple axes. A valid ``axis`` must be an integer on the interval ``[-N, N)``, where ``N`` is the number of axes in ``x``. If an ``axis`` is specified as a negative integer, the function **must** determine the axis along which to perform a reduction by counting backward from the last dimension (where ``-1`` refers to the last axis). If provided an invalid ``axis``, the function **must** raise an exception. Default: ``None``.
     keepdims: bool
         If ``True``, the reduced axes **must** be included in the result as singleton dimensions, and, accordingly, the result **must** be broadcast-compatible with the input array (see :ref:`broadcasting`). Otherwise, if ``False``, the reduced axes **must not** be included in the result. Default: ``False``.
+    where: Optional[array]
+        boolean array indicating which elements of ``x`` **must** be included in the computation. **Must** be broadcast-compatible with ``x`` (see :ref:`broadcasting`), and broadcasting ``where`` against ``x`` **must not** change the shape of ``x``. Elements for which ``where`` is ``False`` **must** be excluded from the computation, as if they were not present in ``x``. In particular, if no element is selected, the test result **must** be ``False``. If ``None``, every element of ``x`` **must** be included. Default: ``None``.
+    out: Optional[array]
+        array into which the result **must** be written (see :ref:`out-keyword-argument`). If provided, ``out`` **must** have the shape and data type of the result, and the function **must** return ``out``. If ``None``, the result **must** be written to a newly allocated array. Default: ``None``.
 
     Returns
     -------
@@ -73,6 +88,9 @@ def any(
 
     .. versionchanged:: 2022.12
        Added complex data type support.
+
+    .. versionchanged:: 2026.12
+       Added the ``out`` and ``where`` keyword arguments.
     """
 
 
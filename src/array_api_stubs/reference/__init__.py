@@ -0,0 +1,85 @@
+"""
+Reference implementation of the array API standard, backed by NumPy.
+
+The namespace implements every function of the draft specification and is
+strict where the specification leaves behavior undefined or implementation-
+defined: data types must follow the type promotion table (e.g., adding ``int8``
+and ``uint64`` arrays raises a ``TypeError`` instead of producing ``float64``),
+functions only accept the data types they are specified for, Python scalars
+are only combined with arrays of a compatible kind, and element-wise functions
+follow the special cases of the specification. Computations are delegated to
+vectorized NumPy kernels, hence the namespace is suitable for benchmarking and
+for checking code written against the standard::
+
+    from array_api_stubs import reference as xp
+
+    x = xp.linspace(0, 1, 5)
+    y = xp.sum(xp.sin(x))
+
+Requires NumPy 2 or later.
+"""
+from __future__ import annotations
+
+# The version the draft specification will be released as.
+__array_api_version__ = "2026.12"
+
+from . import fft, linalg
+from ._array_object import Array
+from ._constants import *
+from ._constants import __all__ as _constants_all
+from ._creation_functions import *
+from ._creation_functions import __all__ as _creation_all
+from ._data_type_functions import *
+from ._data_type_functions import __all__ as _data_type_all
+from ._dtypes import (
+    bool,
+    complex64,
+    complex128,
+    float32,
+    float64,
+    int8,
+    int16,
+    int32,
+    int64,
+    uint8,
+    uint16,
+    uint32,
+    uint64,
+)
+from ._dtypes import __all__ as _dtypes_all
+from ._elementwise_functions import *
+from ._elementwise_functions import __all__ as _elementwise_all
+from ._indexing_functions import *
+from ._indexing_functions import __all__ as _indexing_all
+from ._info import __array_namespace_info__
+from ._linear_algebra_functions import *
+from ._linear_algebra_functions import __all__ as _linear_algebra_all
+from ._manipulation_functions import *
+from ._manipulation_functions import __all__ as _manipulation_all
+from ._searching_functions import *
+from ._searching_functions import __all__ as _searching_all
+from ._set_functions import *
+from ._set_functions import __all__ as _set_all
+from ._sorting_functions import *
+from ._sorting_functions import __all__ as _sorting_all
+from ._statistical_functions import *
+from ._statistical_functions import __all__ as _statistical_all
+from ._utility_functions import *
+from ._utility_functions import __all__ as _utility_all
+
+__all__ = (
+    ["__array_api_version__", "__array_namespace_info__", "fft", "linalg"]
+    + _constants_all
+    + _creation_all
+    + _data_type_all
+    + [name for name in _dtypes_all if name != "DType"]
+    + _elementwise_all
+    + _indexing_all
+    + _linear_algebra_all
+    + _manipulation_all
+    + _searching_all
+    + _set_all
+    + _sorting_all
+    + _statistical_all
+    + _utility_all
+)
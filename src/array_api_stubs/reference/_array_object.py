@@ -0,0 +1,506 @@
+"""
+Array object of the reference implementation.
+"""
+from __future__ import annotations
+
+import operator
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._dtypes import DType
+
+__all__ = ["Array", "Device", "CPU_DEVICE"]
+
+
+class Device:
+    """Device on which arrays reside. The reference implementation only has a CPU."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Device({self.name!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Device) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash(("Device", self.name))
+
+
+CPU_DEVICE = Device("cpu")
+
+
+def check_device(device: Any) -> None:
+    if device is not None and device != CPU_DEVICE:
+        raise ValueError(f"unsupported device {device!r}")
+
+
+def scalar_to_array(scalar: Union[bool, int, float, complex], dtype: DType) -> Array:
+    """
+    Converts a Python scalar to a zero-dimensional array to be combined with an
+    array having data type ``dtype``.
+
+    Parameters
+    ----------
+    scalar: Union[bool, int, float, complex]
+        Python scalar.
+    dtype: DType
+        data type of the array operand.
+
+    Returns
+    -------
+    out: Array
+        zero-dimensional array having data type ``dtype``, or the complex data
+        type of the same precision for a ``complex`` scalar and a real-valued
+        floating-point ``dtype``.
+    """
+    if isinstance(scalar, np.generic) or not isinstance(scalar, (int, float, complex)):
+        raise TypeError(f"expected an array or a Python scalar, got {type(scalar)}")
+    if isinstance(scalar, bool):
+        ok = dtype == _dtypes.bool
+    elif isinstance(scalar, int):
+        ok = dtype != _dtypes.bool
+        if dtype in _dtypes.KINDS["integral"]:
+            info = np.iinfo(dtype._np_dtype)
+            if not info.min <= scalar <= info.max:
+                raise OverflowError(f"{scalar} is out of bounds for {dtype.name}")
+    elif isinstance(scalar, float):
+        ok = _dtypes.isdtype(dtype, ("real floating", "complex floating"))
+    else:
+        ok = _dtypes.isdtype(dtype, ("real floating", "complex floating"))
+        dtype = _dtypes.COMPLEX.get(dtype, dtype)
+    if not ok:
+        raise TypeError(
+            f"Python {type(scalar).__name__} scalars cannot be combined with "
+            f"arrays having data type {dtype.name}"
+        )
+    # Floats beyond the range of ``dtype`` round to infinity, as for arrays.
+    with np.errstate(over="ignore"):
+        return Array._new(np.array(scalar, dtype=dtype._np_dtype))
+
+
+def _validate_index(key: Any, shape: Tuple[int, ...]) -> Any:
+    # Returns the NumPy equivalent of ``key`` after checking that only indexing
+    # semantics defined by the specification are used.
+    if not isinstance(key, tuple):
+        key = (key,)
+    arrays = [k for k in key if isinstance(k, Array)]
+    if any(a.dtype == _dtypes.bool for a in arrays):
+        if len(key) != 1:
+            raise IndexError("a boolean array index must be the sole index")
+        mask = key[0]
+        if mask.ndim > len(shape):
+            raise IndexError(
+                f"boolean index with {mask.ndim} dimensions for an array having "
+                f"{len(shape)} dimensions"
+            )
+        for n, m in zip(shape, mask.shape):
+            if m not in (n, 0):
+                raise IndexError(
+                    f"boolean index of shape {mask.shape} does not match {shape}"
+                )
+        return mask._array
+    if any(a.ndim > 0 for a in arrays):
+        if len(key) != len(shape) or not all(
+            isinstance(k, Array) or _is_integer(k) for k in key
+        ):
+            raise IndexError(
+                "integer array indices must be combined with one integer or "
+                "integer array index for each dimension"
+            )
+    out = []
+    ellipsis = False
+    for k in key:
+        if k is Ellipsis:
+            if ellipsis:
+                raise IndexError("an index can only have a single ellipsis")
+            ellipsis = True
+            out.append(k)
+        elif k is None:
+            out.append(k)
+        elif isinstance(k, Array):
+            if k.dtype not in _dtypes.KINDS["integral"]:
+                raise IndexError(f"array indices must be integer arrays, got {k.dtype}")
+            out.append(k._array if k.ndim else int(k._array))
+        elif isinstance(k, slice):
+            for attr in (k.start, k.stop, k.step):
+                if attr is not None and not _is_integer(attr):
+                    raise IndexError(f"slice bounds must be integers, got {k}")
+            out.append(k)
+        elif _is_integer(k):
+            out.append(operator.index(k))
+        else:
+            raise IndexError(f"unsupported index {k!r}")
+    n = sum(k is not None and k is not Ellipsis for k in out)
+    if n > len(shape):
+        raise IndexError(
+            f"too many indices ({n}) for an array having {len(shape)} dimensions"
+        )
+    # Check integer indices explicitly, as NumPy wraps them for negative steps.
+    axis = 0
+    for k in out:
+        if k is Ellipsis:
+            axis += len(shape) - n
+        elif k is not None:
+            if isinstance(k, int) and not -shape[axis] <= k < shape[axis]:
+                raise IndexError(
+                    f"index {k} is out of bounds for axis {axis} with size {shape[axis]}"
+                )
+            axis += 1
+    return tuple(out)
+
+
+def _is_integer(k: Any) -> bool:
+    return isinstance(k, int) and not isinstance(k, (bool, np.generic))
+
+
+class Array:
+    """
+    n-dimensional array of the reference implementation.
+
+    Arrays are created by the creation functions (e.g., ``asarray``), and wrap a
+    NumPy array which is not part of the public interface.
+    """
+
+    _array: np.ndarray
+
+    # Make NumPy defer to the reflected operators of this class, which reject
+    # NumPy arrays, rather than treating arrays as opaque objects.
+    __array_ufunc__ = None
+
+    def __new__(cls, *args, **kwargs):
+        raise TypeError(
+            "arrays cannot be instantiated directly; use a creation function "
+            "such as asarray() instead"
+        )
+
+    @classmethod
+    def _new(cls, x: Any) -> Array:
+        if not isinstance(x, np.ndarray):
+            # NumPy returns scalars for zero-dimensional results.
+            x = np.asarray(x)
+        _dtypes.from_numpy(x.dtype)
+        obj = object.__new__(cls)
+        obj._array = x
+        return obj
+
+    def _operand(self, other: Any) -> Any:
+        # Returns ``other`` as an array, or ``NotImplemented`` for objects which
+        # are not operands of operators (e.g., lists or NumPy arrays).
+        if isinstance(other, Array):
+            return other
+        if isinstance(other, (bool, int, float, complex)) and not isinstance(
+            other, np.generic
+        ):
+            return scalar_to_array(other, self.dtype)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        data = np.array2string(self._array, separator=", ", prefix="Array(")
+        return f"Array({data}, dtype={self.dtype.name})"
+
+    # -- Attributes ----------------------------------------------------------
+
+    @property
+    def dtype(self) -> DType:
+        return _dtypes.from_numpy(self._array.dtype)
+
+    @property
+    def device(self) -> Device:
+        return CPU_DEVICE
+
+    @property
+    def mT(self) -> Array:
+        if self.ndim < 2:
+            raise ValueError("mT requires an array having at least two dimensions")
+        return Array._new(np.swapaxes(self._array, -1, -2))
+
+    @property
+    def ndim(self) -> int:
+        return self._array.ndim
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._array.shape
+
+    @property
+    def size(self) -> int:
+        return self._array.size
+
+    @property
+    def T(self) -> Array:
+        if self.ndim != 2:
+            raise ValueError(
+                "T requires a two-dimensional array; use permute_dims() or mT instead"
+            )
+        return Array._new(self._array.T)
+
+    # -- Conversion ------------------------------------------------------------
+
+    def _scalar(self, name: str, kinds: Optional[tuple] = None) -> Any:
+        if self.ndim != 0:
+            raise TypeError(f"{name}() requires a zero-dimensional array")
+        if kinds is not None and not _dtypes.isdtype(self.dtype, kinds):
+            raise TypeError(f"{name}() is not supported for {self.dtype.name} arrays")
+        return self._array[()]
+
+    def __bool__(self) -> bool:
+        return bool(self._scalar("bool"))
+
+    def __complex__(self) -> complex:
+        return complex(self._scalar("complex"))
+
+    def __float__(self) -> float:
+        return float(self._scalar("float", ("bool", "integral", "real floating")))
+
+    def __index__(self) -> int:
+        return int(self._scalar("index", "integral"))
+
+    def __int__(self) -> int:
+        return int(self._scalar("int", ("bool", "integral", "real floating")))
+
+    def __iter__(self):
+        raise TypeError("arrays are not iterable; use unstack() instead")
+
+    # -- Namespace and interchange -----------------------------------------------
+
+    def __array_namespace__(self, /, *, api_version: Optional[str] = None) -> Any:
+        from . import __array_api_version__
+
+        if api_version is not None and api_version != __array_api_version__:
+            raise ValueError(f"unsupported API version {api_version!r}")
+        from .. import reference
+
+        return reference
+
+    def __dlpack__(
+        self,
+        /,
+        *,
+        stream: Optional[Any] = None,
+        max_version: Optional[Tuple[int, int]] = None,
+        dl_device: Optional[Tuple[Any, int]] = None,
+        copy: Optional[bool] = None,
+    ) -> Any:
+        if stream is not None:
+            raise ValueError("streams are not supported on the CPU device")
+        kwargs = {"max_version": max_version, "dl_device": dl_device, "copy": copy}
+        return self._array.__dlpack__(
+            **{k: v for k, v in kwargs.items() if v is not None}
+        )
+
+    def __dlpack_device__(self) -> Tuple[Any, int]:
+        return self._array.__dlpack_device__()
+
+    def to_device(self, device: Device, /, *, stream: Optional[Any] = None) -> Array:
+        if stream is not None:
+            raise ValueError("streams are not supported on the CPU device")
+        if device != CPU_DEVICE:
+            raise ValueError(f"unsupported device {device!r}")
+        return self
+
+    # -- Indexing ------------------------------------------------------------------
+
+    def __getitem__(self, key: Any, /) -> Array:
+        return Array._new(self._array[_validate_index(key, self.shape)])
+
+    def __setitem__(self, key: Any, value: Any, /) -> None:
+        value = self._operand(value)
+        if value is NotImplemented:
+            raise TypeError("values must be arrays or Python scalars")
+        if _dtypes.result_type(self.dtype, value.dtype) != self.dtype:
+            raise TypeError(
+                f"cannot assign {value.dtype.name} values to a {self.dtype.name} array"
+            )
+        self._array[_validate_index(key, self.shape)] = value._array
+
+    # -- Operators -----------------------------------------------------------------
+
+    def _binary(self, func: Any, other: Any, reflected: bool = False) -> Any:
+        other = self._operand(other)
+        if other is NotImplemented:
+            return other
+        return func(other, self) if reflected else func(self, other)
+
+    def _inplace(self, func: Any, other: Any) -> Array:
+        other = self._operand(other)
+        if other is NotImplemented:
+            return other
+        result = func(self, other)
+        if result.dtype != self.dtype:
+            raise TypeError(
+                f"in-place operation would change the data type of the array from "
+                f"{self.dtype.name} to {result.dtype.name}"
+            )
+        if result.shape != self.shape:
+            raise ValueError(
+                f"in-place operation would change the shape of the array from "
+                f"{self.shape} to {result.shape}"
+            )
+        self._array[...] = result._array
+        return self
+
+    def __abs__(self) -> Array:
+        return _ew.abs(self)
+
+    def __invert__(self) -> Array:
+        return _ew.bitwise_invert(self)
+
+    def __neg__(self) -> Array:
+        return _ew.negative(self)
+
+    def __pos__(self) -> Array:
+        return _ew.positive(self)
+
+    def __add__(self, other, /):
+        return self._binary(_ew.add, other)
+
+    def __radd__(self, other, /):
+        return self._binary(_ew.add, other, True)
+
+    def __iadd__(self, other, /):
+        return self._inplace(_ew.add, other)
+
+    def __sub__(self, other, /):
+        return self._binary(_ew.subtract, other)
+
+    def __rsub__(self, other, /):
+        return self._binary(_ew.subtract, other, True)
+
+    def __isub__(self, other, /):
+        return self._inplace(_ew.subtract, other)
+
+    def __mul__(self, other, /):
+        return self._binary(_ew.multiply, other)
+
+    def __rmul__(self, other, /):
+        return self._binary(_ew.multiply, other, True)
+
+    def __imul__(self, other, /):
+        return self._inplace(_ew.multiply, other)
+
+    def __truediv__(self, other, /):
+        return self._binary(_ew.divide, other)
+
+    def __rtruediv__(self, other, /):
+        return self._binary(_ew.divide, other, True)
+
+    def __itruediv__(self, other, /):
+        return self._inplace(_ew.divide, other)
+
+    def __floordiv__(self, other, /):
+        return self._binary(_ew.floor_divide, other)
+
+    def __rfloordiv__(self, other, /):
+        return self._binary(_ew.floor_divide, other, True)
+
+    def __ifloordiv__(self, other, /):
+        return self._inplace(_ew.floor_divide, other)
+
+    def __mod__(self, other, /):
+        return self._binary(_ew.remainder, other)
+
+    def __rmod__(self, other, /):
+        return self._binary(_ew.remainder, other, True)
+
+    def __imod__(self, other, /):
+        return self._inplace(_ew.remainder, other)
+
+    def __pow__(self, other, /):
+        return self._binary(_ew.pow, other)
+
+    def __rpow__(self, other, /):
+        return self._binary(_ew.pow, other, True)
+
+    def __ipow__(self, other, /):
+        return self._inplace(_ew.pow, other)
+
+    def __matmul__(self, other, /):
+        if not isinstance(other, Array):
+            return NotImplemented
+        return _la.matmul(self, other)
+
+    def __rmatmul__(self, other, /):
+        if not isinstance(other, Array):
+            return NotImplemented
+        return _la.matmul(other, self)
+
+    def __imatmul__(self, other, /):
+        if not isinstance(other, Array):
+            return NotImplemented
+        return self._inplace(_la.matmul, other)
+
+    def __and__(self, other, /):
+        return self._binary(_ew.bitwise_and, other)
+
+    def __rand__(self, other, /):
+        return self._binary(_ew.bitwise_and, other, True)
+
+    def __iand__(self, other, /):
+        return self._inplace(_ew.bitwise_and, other)
+
+    def __or__(self, other, /):
+        return self._binary(_ew.bitwise_or, other)
+
+    def __ror__(self, other, /):
+        return self._binary(_ew.bitwise_or, other, True)
+
+    def __ior__(self, other, /):
+        return self._inplace(_ew.bitwise_or, other)
+
+    def __xor__(self, other, /):
+        return self._binary(_ew.bitwise_xor, other)
+
+    def __rxor__(self, other, /):
+        return self._binary(_ew.bitwise_xor, other, True)
+
+    def __ixor__(self, other, /):
+        return self._inplace(_ew.bitwise_xor, other)
+
+    def __lshift__(self, other, /):
+        return self._binary(_ew.bitwise_left_shift, other)
+
+    def __rlshift__(self, other, /):
+        return self._binary(_ew.bitwise_left_shift, other, True)
+
+    def __ilshift__(self, other, /):
+        return self._inplace(_ew.bitwise_left_shift, other)
+
+    def __rshift__(self, other, /):
+        return self._binary(_ew.bitwise_right_shift, other)
+
+    def __rrshift__(self, other, /):
+        return self._binary(_ew.bitwise_right_shift, other, True)
+
+    def __irshift__(self, other, /):
+        return self._inplace(_ew.bitwise_right_shift, other)
+
+    def __eq__(self, other, /):
+        return self._binary(_ew.equal, other)
+
+    def __ne__(self, other, /):
+        return self._binary(_ew.not_equal, other)
+
+    def __lt__(self, other, /):
+        return self._binary(_ew.less, other)
+
+    def __le__(self, other, /):
+        return self._binary(_ew.less_equal, other)
+
+    def __gt__(self, other, /):
+        return self._binary(_ew.greater, other)
+
+    def __ge__(self, other, /):
+        return self._binary(_ew.greater_equal, other)
+
+    __hash__ = None
+
+
+# Imported last, as both modules import ``Array`` from this one.
+from . import _elementwise_functions as _ew  # noqa: E402
+from . import _linear_algebra_functions as _la  # noqa: E402
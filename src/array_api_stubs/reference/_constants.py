@@ -0,0 +1,12 @@
+"""
+Constants of the reference implementation.
+"""
+from __future__ import annotations
+
+__all__ = ["e", "inf", "nan", "newaxis", "pi"]
+
+e = 2.718281828459045
+inf = float("inf")
+nan = float("nan")
+newaxis = None
+pi = 3.141592653589793
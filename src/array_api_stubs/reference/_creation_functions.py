@@ -0,0 +1,257 @@
+"""
+Array creation functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array, Device, check_device, scalar_to_array
+from ._dtypes import DType
+
+__all__ = [
+    "arange",
+    "asarray",
+    "empty",
+    "empty_like",
+    "eye",
+    "from_dlpack",
+    "full",
+    "full_like",
+    "linspace",
+    "meshgrid",
+    "ones",
+    "ones_like",
+    "tril",
+    "triu",
+    "zeros",
+    "zeros_like",
+]
+
+Shape = Union[int, Tuple[int, ...]]
+
+
+def check_dtype_argument(dtype: Any) -> None:
+    if dtype is not None and not isinstance(dtype, DType):
+        raise TypeError(f"expected a data type of this namespace, got {dtype!r}")
+
+
+def _np_dtype(dtype: Optional[DType], default: Optional[DType] = None) -> Any:
+    check_dtype_argument(dtype)
+    dtype = dtype if dtype is not None else default
+    return None if dtype is None else dtype._np_dtype
+
+
+def _fill_dtype(fill_value: Any, dtype: Optional[DType]) -> DType:
+    # Returns the data type of an array filled with ``fill_value``.
+    if dtype is None:
+        if isinstance(fill_value, bool):
+            return _dtypes.bool
+        if isinstance(fill_value, int):
+            return _dtypes.DEFAULT_DTYPES["integral"]
+        if isinstance(fill_value, float):
+            return _dtypes.DEFAULT_DTYPES["real floating"]
+        if isinstance(fill_value, complex):
+            return _dtypes.DEFAULT_DTYPES["complex floating"]
+    check_dtype_argument(dtype)
+    if dtype is None or scalar_to_array(fill_value, dtype).dtype != dtype:
+        raise TypeError(f"fill value {fill_value!r} is not compatible with {dtype}")
+    return dtype
+
+
+def arange(
+    start: Union[int, float],
+    /,
+    stop: Optional[Union[int, float]] = None,
+    step: Union[int, float] = 1,
+    *,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+) -> Array:
+    check_device(device)
+    args = (start, step) if stop is None else (start, stop, step)
+    if dtype is None:
+        integral = all(isinstance(a, int) for a in args)
+        dtype = _dtypes.DEFAULT_DTYPES["integral" if integral else "real floating"]
+    elif not _dtypes.isdtype(dtype, ("integral", "real floating")):
+        raise TypeError(f"arange() requires a real-valued data type, got {dtype}")
+    stop_ = start if stop is None else stop
+    start_ = 0 if stop is None else start
+    return Array._new(np.arange(start_, stop_, step, dtype=_np_dtype(dtype)))
+
+
+def asarray(
+    obj: Any,
+    /,
+    *,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+    copy: Optional[bool] = None,
+) -> Array:
+    check_device(device)
+    check_dtype_argument(dtype)
+    if isinstance(obj, Array):
+        if dtype is not None and dtype != obj.dtype:
+            if copy is False:
+                raise ValueError("casting to a different data type requires a copy")
+            return Array._new(obj._array.astype(dtype._np_dtype))
+        return Array._new(obj._array.copy() if copy else obj._array)
+    if isinstance(obj, (bool, int, float, complex)) and not isinstance(obj, np.generic):
+        if copy is False:
+            raise ValueError("creating an array from a Python scalar requires a copy")
+        if dtype is not None:
+            dtype = _fill_dtype(obj, dtype)
+            with np.errstate(over="ignore"):
+                return Array._new(np.array(obj, dtype=dtype._np_dtype))
+    # Floats beyond the range of ``dtype`` round to infinity.
+    with np.errstate(over="ignore"):
+        if copy is False:
+            # Raises a ``ValueError`` if ``obj`` cannot be exposed without a copy.
+            x = np.asarray(obj, dtype=_np_dtype(dtype), copy=False)
+        else:
+            x = np.array(obj, dtype=_np_dtype(dtype), copy=bool(copy) or None)
+    if x.dtype.kind not in "biufc":
+        raise TypeError(f"{type(obj).__name__} objects cannot be converted to arrays")
+    return Array._new(x)
+
+
+def empty(
+    shape: Shape, *, dtype: Optional[DType] = None, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    default = _dtypes.DEFAULT_DTYPES["real floating"]
+    return Array._new(np.empty(shape, dtype=_np_dtype(dtype, default)))
+
+
+def empty_like(
+    x: Array, /, *, dtype: Optional[DType] = None, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    return Array._new(np.empty_like(x._array, dtype=_np_dtype(dtype, x.dtype)))
+
+
+def eye(
+    n_rows: int,
+    n_cols: Optional[int] = None,
+    /,
+    *,
+    k: int = 0,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+) -> Array:
+    check_device(device)
+    default = _dtypes.DEFAULT_DTYPES["real floating"]
+    return Array._new(np.eye(n_rows, n_cols, k=k, dtype=_np_dtype(dtype, default)))
+
+
+def from_dlpack(
+    x: object, /, *, device: Optional[Device] = None, copy: Optional[bool] = None
+) -> Array:
+    check_device(device)
+    if copy is None:
+        return Array._new(np.from_dlpack(x))
+    return Array._new(np.from_dlpack(x, copy=copy))
+
+
+def full(
+    shape: Shape,
+    fill_value: Union[bool, int, float, complex],
+    *,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+) -> Array:
+    check_device(device)
+    dtype = _fill_dtype(fill_value, dtype)
+    with np.errstate(over="ignore"):
+        return Array._new(np.full(shape, fill_value, dtype=dtype._np_dtype))
+
+
+def full_like(
+    x: Array,
+    /,
+    fill_value: Union[bool, int, float, complex],
+    *,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+) -> Array:
+    check_device(device)
+    dtype = _fill_dtype(fill_value, dtype if dtype is not None else x.dtype)
+    with np.errstate(over="ignore"):
+        return Array._new(np.full_like(x._array, fill_value, dtype=dtype._np_dtype))
+
+
+def linspace(
+    start: Union[int, float, complex],
+    stop: Union[int, float, complex],
+    /,
+    num: int,
+    *,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+    endpoint: bool = True,
+) -> Array:
+    check_device(device)
+    check_dtype_argument(dtype)
+    if dtype is None:
+        cplx = isinstance(start, complex) or isinstance(stop, complex)
+        dtype = _dtypes.DEFAULT_DTYPES["complex floating" if cplx else "real floating"]
+    elif not _dtypes.isdtype(dtype, ("real floating", "complex floating")):
+        raise TypeError(f"linspace() requires a floating-point data type, got {dtype}")
+    out = np.linspace(start, stop, num, endpoint=endpoint, dtype=dtype._np_dtype)
+    return Array._new(out)
+
+
+def meshgrid(*arrays: Array, indexing: str = "xy") -> Tuple[Array, ...]:
+    if indexing not in ("xy", "ij"):
+        raise ValueError(f"indexing must be 'xy' or 'ij', got {indexing!r}")
+    if len({a.dtype for a in arrays}) > 1:
+        raise TypeError("meshgrid() requires arrays having the same data type")
+    for a in arrays:
+        if a.ndim != 1:
+            raise ValueError("meshgrid() requires one-dimensional arrays")
+    grids = np.meshgrid(*[a._array for a in arrays], indexing=indexing)
+    return tuple(Array._new(g) for g in grids)
+
+
+def ones(
+    shape: Shape, *, dtype: Optional[DType] = None, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    default = _dtypes.DEFAULT_DTYPES["real floating"]
+    return Array._new(np.ones(shape, dtype=_np_dtype(dtype, default)))
+
+
+def ones_like(
+    x: Array, /, *, dtype: Optional[DType] = None, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    return Array._new(np.ones_like(x._array, dtype=_np_dtype(dtype, x.dtype)))
+
+
+def tril(x: Array, /, *, k: int = 0) -> Array:
+    if x.ndim < 2:
+        raise ValueError("tril() requires an array having at least two dimensions")
+    return Array._new(np.tril(x._array, k=k))
+
+
+def triu(x: Array, /, *, k: int = 0) -> Array:
+    if x.ndim < 2:
+        raise ValueError("triu() requires an array having at least two dimensions")
+    return Array._new(np.triu(x._array, k=k))
+
+
+def zeros(
+    shape: Shape, *, dtype: Optional[DType] = None, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    default = _dtypes.DEFAULT_DTYPES["real floating"]
+    return Array._new(np.zeros(shape, dtype=_np_dtype(dtype, default)))
+
+
+def zeros_like(
+    x: Array, /, *, dtype: Optional[DType] = None, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    return Array._new(np.zeros_like(x._array, dtype=_np_dtype(dtype, x.dtype)))
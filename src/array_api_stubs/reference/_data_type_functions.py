@@ -0,0 +1,102 @@
+"""
+Data type functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array, Device, check_device, scalar_to_array
+from ._dtypes import DType
+
+__all__ = ["astype", "can_cast", "finfo", "iinfo", "isdtype", "result_type"]
+
+
+class finfo_object(NamedTuple):
+    bits: int
+    eps: float
+    max: float
+    min: float
+    smallest_normal: float
+    dtype: DType
+
+
+class iinfo_object(NamedTuple):
+    bits: int
+    max: int
+    min: int
+    dtype: DType
+
+
+def _as_dtype(type: Union[DType, Array]) -> DType:
+    if isinstance(type, Array):
+        return type.dtype
+    if not isinstance(type, DType):
+        raise TypeError(f"expected an array or a data type, got {type!r}")
+    return type
+
+
+def astype(
+    x: Array, dtype: DType, /, *, copy: bool = True, device: Optional[Device] = None
+) -> Array:
+    check_device(device)
+    if not isinstance(dtype, DType):
+        raise TypeError(f"expected a data type of this namespace, got {dtype!r}")
+    if _dtypes.isdtype(x.dtype, "complex floating") and not _dtypes.isdtype(
+        dtype, "complex floating"
+    ):
+        raise TypeError("complex arrays cannot be cast to a real-valued data type")
+    if not copy and dtype == x.dtype:
+        return x
+    return Array._new(x._array.astype(dtype._np_dtype, copy=True))
+
+
+def can_cast(from_: Union[DType, Array], to: DType, /) -> bool:
+    from_ = _as_dtype(from_)
+    if not isinstance(to, DType):
+        raise TypeError(f"expected a data type of this namespace, got {to!r}")
+    return _dtypes.PROMOTION_TABLE.get((from_, to)) == to
+
+
+def finfo(type: Union[DType, Array], /) -> finfo_object:
+    dtype = _as_dtype(type)
+    if not _dtypes.isdtype(dtype, ("real floating", "complex floating")):
+        raise TypeError(f"finfo() requires a floating-point data type, got {dtype}")
+    real = _dtypes.REAL.get(dtype, dtype)
+    info = np.finfo(real._np_dtype)
+    return finfo_object(
+        bits=info.bits,
+        eps=float(info.eps),
+        max=float(info.max),
+        min=float(info.min),
+        smallest_normal=float(info.smallest_normal),
+        dtype=real,
+    )
+
+
+def iinfo(type: Union[DType, Array], /) -> iinfo_object:
+    dtype = _as_dtype(type)
+    if not _dtypes.isdtype(dtype, "integral"):
+        raise TypeError(f"iinfo() requires an integer data type, got {dtype}")
+    info = np.iinfo(dtype._np_dtype)
+    return iinfo_object(
+        bits=info.bits, max=int(info.max), min=int(info.min), dtype=dtype
+    )
+
+
+isdtype = _dtypes.isdtype
+
+
+def result_type(
+    *arrays_and_dtypes: Union[Array, int, float, complex, bool, DType]
+) -> DType:
+    dtypes = [_as_dtype(a) for a in arrays_and_dtypes if isinstance(a, (Array, DType))]
+    if not dtypes:
+        raise ValueError("result_type() requires at least one array or data type")
+    dtype = _dtypes.result_type(*dtypes)
+    for a in arrays_and_dtypes:
+        if not isinstance(a, (Array, DType)):
+            dtype = scalar_to_array(a, dtype).dtype
+    return dtype
@@ -0,0 +1,180 @@
+"""
+Data types of the reference implementation and the type promotion table.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+__all__ = [
+    "DType",
+    "bool",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+]
+
+_bool = bool
+
+
+class DType:
+    """
+    Data type of an array.
+
+    Data types only compare equal to data types of this implementation, such
+    that passing, e.g., a NumPy data type where a data type is expected raises.
+    """
+
+    __slots__ = ("_np_dtype",)
+
+    def __init__(self, np_dtype: np.dtype):
+        self._np_dtype = np.dtype(np_dtype)
+
+    @property
+    def name(self) -> str:
+        return self._np_dtype.name
+
+    def __repr__(self) -> str:
+        return f"array_api_stubs.reference.{self.name}"
+
+    def __eq__(self, other: object) -> _bool:
+        if not isinstance(other, DType):
+            return False
+        return self._np_dtype == other._np_dtype
+
+    def __hash__(self) -> int:
+        return hash(self._np_dtype)
+
+
+bool = DType(np.bool_)
+int8 = DType(np.int8)
+int16 = DType(np.int16)
+int32 = DType(np.int32)
+int64 = DType(np.int64)
+uint8 = DType(np.uint8)
+uint16 = DType(np.uint16)
+uint32 = DType(np.uint32)
+uint64 = DType(np.uint64)
+float32 = DType(np.float32)
+float64 = DType(np.float64)
+complex64 = DType(np.complex64)
+complex128 = DType(np.complex128)
+
+# Canonical names, in the order used by ``__array_namespace_info__().dtypes()``.
+DTYPES = {
+    dt.name: dt
+    for dt in (
+        bool,
+        int8,
+        int16,
+        int32,
+        int64,
+        uint8,
+        uint16,
+        uint32,
+        uint64,
+        float32,
+        float64,
+        complex64,
+        complex128,
+    )
+}
+_FROM_NUMPY = {dt._np_dtype: dt for dt in DTYPES.values()}
+
+KINDS = {
+    "bool": (bool,),
+    "signed integer": (int8, int16, int32, int64),
+    "unsigned integer": (uint8, uint16, uint32, uint64),
+    "integral": (int8, int16, int32, int64, uint8, uint16, uint32, uint64),
+    "real floating": (float32, float64),
+    "complex floating": (complex64, complex128),
+    "numeric": tuple(dt for dt in DTYPES.values() if dt != bool),
+}
+
+DEFAULT_DTYPES = {
+    "real floating": float64,
+    "complex floating": complex128,
+    "integral": int64,
+    "indexing": int64,
+}
+
+# Complex data type having the precision of a real-valued floating-point one.
+COMPLEX = {float32: complex64, float64: complex128}
+# Real-valued floating-point data type having the precision of a complex one.
+REAL = {complex64: float32, complex128: float64}
+
+
+def from_numpy(np_dtype: np.dtype) -> DType:
+    try:
+        return _FROM_NUMPY[np_dtype]
+    except KeyError:
+        raise TypeError(f"{np_dtype} is not an array API data type") from None
+
+
+def isdtype(dtype: DType, kind) -> _bool:
+    if not isinstance(dtype, DType):
+        raise TypeError(f"expected a data type, got {dtype!r}")
+    if isinstance(kind, tuple):
+        return any(isdtype(dtype, k) for k in kind)
+    if isinstance(kind, DType):
+        return dtype == kind
+    if isinstance(kind, str):
+        if kind not in KINDS:
+            raise ValueError(f"unknown data type kind {kind!r}")
+        return dtype in KINDS[kind]
+    raise TypeError(f"expected a data type, a kind or a tuple, got {kind!r}")
+
+
+def _promote(a: DType, b: DType):
+    # Returns the promoted data type of ``a`` and ``b``, or ``None`` if the
+    # specification does not define one (e.g., for integer and floating-point).
+    if a == b:
+        return a
+    ka, kb = a._np_dtype.kind, b._np_dtype.kind
+    bits_a, bits_b = a._np_dtype.itemsize, b._np_dtype.itemsize
+    if ka == kb and ka in "iufc":
+        return a if bits_a >= bits_b else b
+    if {ka, kb} == {"i", "u"}:
+        signed, unsigned = (a, b) if ka == "i" else (b, a)
+        if signed._np_dtype.itemsize > unsigned._np_dtype.itemsize:
+            return signed
+        if unsigned == uint64:
+            return None
+        return from_numpy(np.dtype(f"i{2 * unsigned._np_dtype.itemsize}"))
+    if {ka, kb} == {"f", "c"}:
+        real, cplx = (a, b) if ka == "f" else (b, a)
+        if cplx._np_dtype.itemsize >= 2 * real._np_dtype.itemsize:
+            return cplx
+        return COMPLEX[real]
+    return None
+
+
+PROMOTION_TABLE = {
+    (a, b): _promote(a, b)
+    for a in DTYPES.values()
+    for b in DTYPES.values()
+    if _promote(a, b) is not None
+}
+
+
+def result_type(*dtypes: DType) -> DType:
+    """Returns the result of promoting ``dtypes`` according to the promotion table."""
+    if not dtypes:
+        raise ValueError("at least one data type is required")
+    result = dtypes[0]
+    for dt in dtypes[1:]:
+        try:
+            result = PROMOTION_TABLE[result, dt]
+        except KeyError:
+            raise TypeError(
+                f"{result} and {dt} cannot be type promoted together"
+            ) from None
+    return result
@@ -0,0 +1,769 @@
+"""
+Element-wise functions of the reference implementation.
+"""
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Any, Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array, scalar_to_array
+
+__all__ = [
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "asin",
+    "asinh",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_left_shift",
+    "bitwise_invert",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "clip",
+    "conj",
+    "copysign",
+    "cos",
+    "cosh",
+    "divide",
+    "equal",
+    "exp",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "fma",
+    "greater",
+    "greater_equal",
+    "hypot",
+    "imag",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "less",
+    "less_equal",
+    "log",
+    "log1p",
+    "log2",
+    "log10",
+    "logaddexp",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "multiply",
+    "negative",
+    "nextafter",
+    "not_equal",
+    "positive",
+    "pow",
+    "real",
+    "reciprocal",
+    "remainder",
+    "round",
+    "sign",
+    "signbit",
+    "sin",
+    "sinh",
+    "square",
+    "sqrt",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+]
+
+Scalar = Union[bool, int, float, complex]
+
+# Data type kinds accepted by the functions of this module (see ``isdtype``).
+ALL = ("bool", "numeric")
+BOOL = "bool"
+INTEGER = "integral"
+INTEGER_OR_BOOL = ("integral", "bool")
+NUMERIC = "numeric"
+REAL = ("integral", "real floating")
+FLOATING = ("real floating", "complex floating")
+REAL_FLOATING = "real floating"
+COMPLEX_FLOATING = "complex floating"
+
+
+def check_dtype(name: str, x: Array, kinds: Any) -> None:
+    """Raises a ``TypeError`` if ``x`` is not an array having a data type in ``kinds``."""
+    if not isinstance(x, Array):
+        raise TypeError(f"{name}() expected an array, got {type(x).__name__}")
+    if not _dtypes.isdtype(x.dtype, kinds):
+        kinds = kinds if isinstance(kinds, str) else " or ".join(kinds)
+        raise TypeError(f"{name}() requires {kinds} arrays, got {x.dtype.name}")
+
+
+def operands(
+    name: str, x1: Union[Array, Scalar], x2: Union[Array, Scalar], kinds: Any
+) -> Tuple[Array, Array]:
+    """
+    Returns the operands of a binary function as arrays.
+
+    At least one operand must be an array. A Python scalar operand is converted
+    according to the rules for mixing arrays with Python scalars, and the data
+    types of both operands must be in ``kinds`` and be promotable.
+    """
+    if isinstance(x1, Array):
+        if not isinstance(x2, Array):
+            x2 = scalar_to_array(x2, x1.dtype)
+    elif isinstance(x2, Array):
+        x1 = scalar_to_array(x1, x2.dtype)
+    else:
+        raise TypeError(f"{name}() requires at least one array argument")
+    check_dtype(name, x1, kinds)
+    check_dtype(name, x2, kinds)
+    _dtypes.result_type(x1.dtype, x2.dtype)
+    return x1, x2
+
+
+def result_array(name: str, result: np.ndarray, out: Optional[Array]) -> Array:
+    """
+    Returns ``result`` as an array, writing it into ``out`` if provided.
+
+    ``out`` must have exactly the shape and the data type of ``result``. As
+    ``result`` is computed before ``out`` is written, ``out`` may share memory
+    with the inputs.
+    """
+    result = np.asarray(result)
+    if out is None:
+        return Array._new(result)
+    if not isinstance(out, Array):
+        raise TypeError(f"{name}() expected an array for out, got {type(out).__name__}")
+    if out.shape != result.shape:
+        raise ValueError(
+            f"{name}() requires out to have shape {result.shape}, got {out.shape}"
+        )
+    dtype = _dtypes.from_numpy(result.dtype)
+    if out.dtype != dtype:
+        raise TypeError(
+            f"{name}() requires out to have data type {dtype.name}, "
+            f"got {out.dtype.name}"
+        )
+    np.copyto(out._array, result, casting="no")
+    return out
+
+
+def where_mask(name: str, x: Array, where: Optional[Array]) -> Union[bool, np.ndarray]:
+    """
+    Returns the mask of the elements of ``x`` selected by a reduction.
+
+    ``where`` must be a boolean array which broadcasts to the shape of ``x``.
+    """
+    if where is None:
+        return True
+    check_dtype(name, where, BOOL)
+    try:
+        return np.broadcast_to(where._array, x.shape)
+    except ValueError:
+        raise ValueError(
+            f"{name}() requires where to broadcast to shape {x.shape}, "
+            f"got {where.shape}"
+        ) from None
+
+
+def _unary(
+    name: str, func: Callable, x: Array, kinds: Any, out: Optional[Array]
+) -> Array:
+    check_dtype(name, x, kinds)
+    with np.errstate(all="ignore"):
+        return result_array(name, func(x._array), out)
+
+
+def _binary(
+    name: str,
+    func: Callable,
+    x1: Union[Array, Scalar],
+    x2: Union[Array, Scalar],
+    kinds: Any,
+    out: Optional[Array],
+) -> Array:
+    x1, x2 = operands(name, x1, x2, kinds)
+    with np.errstate(all="ignore"):
+        return result_array(name, func(x1._array, x2._array), out)
+
+
+def _integral_or(func: Callable) -> Callable:
+    # Rounding functions are the identity for integers, whatever NumPy returns.
+    def wrapper(x: np.ndarray) -> np.ndarray:
+        return x.copy() if x.dtype.kind in "iu" else func(x)
+
+    return wrapper
+
+
+# Kernels below correct NumPy where it deviates from the special cases.
+
+
+def _expm1(x: np.ndarray) -> np.ndarray:
+    out = np.expm1(x)
+    if x.dtype.kind == "c":
+        # NumPy returns NaN for infinite components, which exp(x) - 1 handles.
+        mask = ~np.isfinite(x)
+        out[mask] = np.exp(x[mask]) - 1
+    return out
+
+
+def _floor_divide(x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+    out = np.floor_divide(x1, x2)
+    if out.dtype.kind == "f":
+        # An infinite quotient or a zero one having the sign of the quotient,
+        # where NumPy returns NaN and -1, respectively.
+        finite1, finite2 = np.isfinite(x1), np.isfinite(x2)
+        mask = (np.isinf(x1) & finite2 & (x2 != 0)) | (finite1 & np.isinf(x2))
+        mask = np.broadcast_to(mask, out.shape)
+        out[mask] = np.broadcast_to(np.divide(x1, x2), out.shape)[mask]
+    return out
+
+
+def _sign(x: np.ndarray) -> np.ndarray:
+    out = np.sign(x)
+    if x.dtype.kind == "c":
+        out[np.isnan(x.real) | np.isnan(x.imag)] = complex(np.nan, np.nan)
+    return out
+
+
+def _two_sum(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns ``a + b`` and its rounding error, both exactly.
+    s = a + b
+    t = s - a
+    return s, (a - (s - t)) + (b - t)
+
+
+def _two_product(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Dekker's algorithm for float64 operands, which is exact unless the
+    # operands or their product are close to the limits of the exponent range.
+    def split(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        c = 134217729.0 * x  # 2**27 + 1
+        hi = c - (c - x)
+        return hi, x - hi
+
+    p = a * b
+    (a_hi, a_lo), (b_hi, b_lo) = split(a), split(b)
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+def _add_odd(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Rounds ``a + b`` to odd, i.e., an inexact sum is replaced by the one of its
+    # two neighbours having an odd significand.
+    s, e = _two_sum(a, b)
+    even = (s.view(np.uint64) & 1) == 0
+    return np.where((e != 0) & even, np.nextafter(s, np.copysign(np.inf, e)), s)
+
+
+def _fma(x1: np.ndarray, x2: np.ndarray, x3: np.ndarray) -> np.ndarray:
+    # NumPy has no fused multiply-add, and ``x1 * x2 + x3`` rounds twice. The
+    # unfused result is only kept where either operation is exact, or an
+    # operand is not finite (which yields the special cases).
+    shape = np.broadcast_shapes(x1.shape, x2.shape, x3.shape)
+    x1, x2, x3 = (np.ravel(x) for x in np.broadcast_arrays(x1, x2, x3))
+    out = x1 * x2 + x3
+    # An infinite addend is the result whenever the exact product is finite.
+    product_finite = np.isfinite(x1) & np.isfinite(x2)
+    out = np.where(product_finite & np.isinf(x3), x3, out)
+    finite = product_finite & np.isfinite(x3)
+    if out.dtype == np.float32:
+        # The float64 product is exact, and rounding the sum to odd before
+        # rounding it to float32 prevents double rounding.
+        wide = _add_odd(x1.astype(np.float64) * x2, x3.astype(np.float64))
+        return np.where(finite, wide.astype(np.float32), out).reshape(shape)
+    # Boldo and Melquiond's emulation of a FMA using rounding to odd.
+    uh, ul = _two_product(x1, x2)
+    th, tl = _two_sum(x3, uh)
+    fused = th + _add_odd(tl, ul)
+    safe = (
+        finite
+        & (np.abs(x1) < 2.0**995)
+        & (np.abs(x2) < 2.0**995)
+        & (np.abs(x3) < 2.0**1020)
+        & (np.abs(uh) >= 2.0**-900)
+        & (np.abs(uh) < 2.0**1020)
+    )
+    out = np.where(safe, fused, out)
+    # Remaining finite cases near the limits of the exponent range are computed
+    # exactly, unless the product is exactly zero.
+    slow = finite & ~safe & (x1 != 0) & (x2 != 0)
+    for i in np.flatnonzero(slow):
+        exact = Fraction(x1[i]) * Fraction(x2[i]) + Fraction(x3[i])
+        try:
+            value = float(exact)
+        except OverflowError:
+            value = math.inf if exact > 0 else -math.inf
+        out[i] = value if value != 0 or exact == 0 else math.copysign(0.0, exact)
+    return out.reshape(shape)
+
+
+def abs(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("abs", np.abs, x, NUMERIC, out)
+
+
+def acos(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("acos", np.arccos, x, FLOATING, out)
+
+
+def acosh(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("acosh", np.arccosh, x, FLOATING, out)
+
+
+def add(
+    x1: Union[Array, Scalar],
+    x2: Union[Array, Scalar],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("add", np.add, x1, x2, NUMERIC, out)
+
+
+def asin(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("asin", np.arcsin, x, FLOATING, out)
+
+
+def asinh(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("asinh", np.arcsinh, x, FLOATING, out)
+
+
+def atan(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("atan", np.arctan, x, FLOATING, out)
+
+
+def atan2(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("atan2", np.arctan2, x1, x2, REAL_FLOATING, out)
+
+
+def atanh(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("atanh", np.arctanh, x, FLOATING, out)
+
+
+def bitwise_and(
+    x1: Union[Array, int, bool],
+    x2: Union[Array, int, bool],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("bitwise_and", np.bitwise_and, x1, x2, INTEGER_OR_BOOL, out)
+
+
+def bitwise_left_shift(
+    x1: Union[Array, int], x2: Union[Array, int], /, *, out: Optional[Array] = None
+) -> Array:
+    return _binary("bitwise_left_shift", np.left_shift, x1, x2, INTEGER, out)
+
+
+def bitwise_invert(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("bitwise_invert", np.invert, x, INTEGER_OR_BOOL, out)
+
+
+def bitwise_or(
+    x1: Union[Array, int, bool],
+    x2: Union[Array, int, bool],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("bitwise_or", np.bitwise_or, x1, x2, INTEGER_OR_BOOL, out)
+
+
+def bitwise_right_shift(
+    x1: Union[Array, int], x2: Union[Array, int], /, *, out: Optional[Array] = None
+) -> Array:
+    return _binary("bitwise_right_shift", np.right_shift, x1, x2, INTEGER, out)
+
+
+def bitwise_xor(
+    x1: Union[Array, int, bool],
+    x2: Union[Array, int, bool],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("bitwise_xor", np.bitwise_xor, x1, x2, INTEGER_OR_BOOL, out)
+
+
+def ceil(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("ceil", _integral_or(np.ceil), x, REAL, out)
+
+
+def clip(
+    x: Array,
+    /,
+    min: Optional[Union[int, float, Array]] = None,
+    max: Optional[Union[int, float, Array]] = None,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    check_dtype("clip", x, REAL)
+    if min is None and max is None:
+        return result_array("clip", x._array.copy(), out)
+    bounds = []
+    for bound in (min, max):
+        if bound is not None:
+            if not isinstance(bound, Array):
+                bound = scalar_to_array(bound, x.dtype)
+            check_dtype("clip", bound, REAL)
+            if _dtypes.result_type(x.dtype, bound.dtype) != x.dtype:
+                raise TypeError(
+                    f"clip() bounds of data type {bound.dtype.name} cannot be "
+                    f"promoted to {x.dtype.name}"
+                )
+            bound = bound._array
+        bounds.append(bound)
+    with np.errstate(all="ignore"):
+        result = np.clip(x._array, *bounds)
+    return result_array("clip", result.astype(x._array.dtype, copy=False), out)
+
+
+def conj(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("conj", np.conj, x, NUMERIC, out)
+
+
+def copysign(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("copysign", np.copysign, x1, x2, REAL_FLOATING, out)
+
+
+def cos(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("cos", np.cos, x, FLOATING, out)
+
+
+def cosh(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("cosh", np.cosh, x, FLOATING, out)
+
+
+def divide(
+    x1: Union[Array, int, float, complex],
+    x2: Union[Array, int, float, complex],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    # The result of dividing integers is implementation-defined, and rejected.
+    return _binary("divide", np.divide, x1, x2, FLOATING, out)
+
+
+def equal(
+    x1: Union[Array, Scalar],
+    x2: Union[Array, Scalar],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("equal", np.equal, x1, x2, ALL, out)
+
+
+def exp(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("exp", np.exp, x, FLOATING, out)
+
+
+def expm1(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("expm1", _expm1, x, FLOATING, out)
+
+
+def floor(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("floor", _integral_or(np.floor), x, REAL, out)
+
+
+def floor_divide(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("floor_divide", _floor_divide, x1, x2, REAL, out)
+
+
+def fma(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    x3: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    args = [x1, x2, x3]
+    like = next((x for x in args if isinstance(x, Array)), None)
+    if like is None:
+        raise TypeError("fma() requires at least one array argument")
+    for i, x in enumerate(args):
+        if not isinstance(x, Array):
+            args[i] = x = scalar_to_array(x, like.dtype)
+        check_dtype("fma", x, REAL_FLOATING)
+    dtype = _dtypes.result_type(*[x.dtype for x in args])._np_dtype
+    with np.errstate(all="ignore"):
+        result = _fma(*[x._array.astype(dtype, copy=False) for x in args])
+    return result_array("fma", result, out)
+
+
+def greater(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("greater", np.greater, x1, x2, REAL, out)
+
+
+def greater_equal(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("greater_equal", np.greater_equal, x1, x2, REAL, out)
+
+
+def hypot(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("hypot", np.hypot, x1, x2, REAL_FLOATING, out)
+
+
+def imag(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("imag", np.imag, x, COMPLEX_FLOATING, out)
+
+
+def isfinite(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("isfinite", np.isfinite, x, NUMERIC, out)
+
+
+def isinf(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("isinf", np.isinf, x, NUMERIC, out)
+
+
+def isnan(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("isnan", np.isnan, x, NUMERIC, out)
+
+
+def less(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("less", np.less, x1, x2, REAL, out)
+
+
+def less_equal(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("less_equal", np.less_equal, x1, x2, REAL, out)
+
+
+def log(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("log", np.log, x, FLOATING, out)
+
+
+def log1p(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("log1p", np.log1p, x, FLOATING, out)
+
+
+def log2(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("log2", np.log2, x, FLOATING, out)
+
+
+def log10(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("log10", np.log10, x, FLOATING, out)
+
+
+def logaddexp(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("logaddexp", np.logaddexp, x1, x2, REAL_FLOATING, out)
+
+
+def logical_and(
+    x1: Union[Array, bool], x2: Union[Array, bool], /, *, out: Optional[Array] = None
+) -> Array:
+    return _binary("logical_and", np.logical_and, x1, x2, BOOL, out)
+
+
+def logical_not(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("logical_not", np.logical_not, x, BOOL, out)
+
+
+def logical_or(
+    x1: Union[Array, bool], x2: Union[Array, bool], /, *, out: Optional[Array] = None
+) -> Array:
+    return _binary("logical_or", np.logical_or, x1, x2, BOOL, out)
+
+
+def logical_xor(
+    x1: Union[Array, bool], x2: Union[Array, bool], /, *, out: Optional[Array] = None
+) -> Array:
+    return _binary("logical_xor", np.logical_xor, x1, x2, BOOL, out)
+
+
+def maximum(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("maximum", np.maximum, x1, x2, REAL, out)
+
+
+def minimum(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("minimum", np.minimum, x1, x2, REAL, out)
+
+
+def multiply(
+    x1: Union[Array, int, float, complex],
+    x2: Union[Array, int, float, complex],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("multiply", np.multiply, x1, x2, NUMERIC, out)
+
+
+def negative(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("negative", np.negative, x, NUMERIC, out)
+
+
+def nextafter(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("nextafter", np.nextafter, x1, x2, REAL_FLOATING, out)
+
+
+def not_equal(
+    x1: Union[Array, Scalar],
+    x2: Union[Array, Scalar],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("not_equal", np.not_equal, x1, x2, ALL, out)
+
+
+def positive(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("positive", np.positive, x, NUMERIC, out)
+
+
+def pow(
+    x1: Union[Array, int, float, complex],
+    x2: Union[Array, int, float, complex],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("pow", np.power, x1, x2, NUMERIC, out)
+
+
+def real(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    # ``np.real`` returns its input for real-valued arrays, rather than a copy.
+    return _unary("real", lambda x: np.real(x).copy(), x, NUMERIC, out)
+
+
+def reciprocal(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("reciprocal", np.reciprocal, x, FLOATING, out)
+
+
+def remainder(
+    x1: Union[Array, int, float],
+    x2: Union[Array, int, float],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("remainder", np.remainder, x1, x2, REAL, out)
+
+
+def round(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("round", _integral_or(np.round), x, NUMERIC, out)
+
+
+def sign(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("sign", _sign, x, NUMERIC, out)
+
+
+def signbit(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("signbit", np.signbit, x, REAL_FLOATING, out)
+
+
+def sin(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("sin", np.sin, x, FLOATING, out)
+
+
+def sinh(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("sinh", np.sinh, x, FLOATING, out)
+
+
+def square(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("square", np.square, x, NUMERIC, out)
+
+
+def sqrt(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("sqrt", np.sqrt, x, FLOATING, out)
+
+
+def subtract(
+    x1: Union[Array, int, float, complex],
+    x2: Union[Array, int, float, complex],
+    /,
+    *,
+    out: Optional[Array] = None,
+) -> Array:
+    return _binary("subtract", np.subtract, x1, x2, NUMERIC, out)
+
+
+def tan(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("tan", np.tan, x, FLOATING, out)
+
+
+def tanh(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("tanh", np.tanh, x, FLOATING, out)
+
+
+def trunc(x: Array, /, *, out: Optional[Array] = None) -> Array:
+    return _unary("trunc", _integral_or(np.trunc), x, REAL, out)
@@ -0,0 +1,123 @@
+"""
+Indexing functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional, Union
+
+import numpy as np
+from numpy.lib.array_utils import normalize_axis_index
+
+from . import _dtypes
+from ._array_object import Array
+from ._elementwise_functions import ALL, INTEGER, NUMERIC, REAL, check_dtype
+
+__all__ = ["put", "put_along_axis", "take", "take_along_axis"]
+
+Reduction = Literal["replace", "add", "multiply", "max", "min"]
+Scalar = Union[bool, int, float, complex]
+
+# Unbuffered ``ufunc.at`` accumulates every value written to a repeated index.
+_REDUCTIONS = {
+    "replace": (None, ALL),
+    "add": (np.add, NUMERIC),
+    "multiply": (np.multiply, NUMERIC),
+    "max": (np.maximum, REAL),
+    "min": (np.minimum, REAL),
+}
+
+
+def _put(
+    name: str,
+    x: Array,
+    index: tuple,
+    values: Union[Scalar, Array],
+    reduction: Reduction,
+) -> Array:
+    # Returns a copy of ``x`` with ``values`` combined into ``x[index]``.
+    if reduction not in _REDUCTIONS:
+        raise ValueError(
+            f"{name}() requires reduction to be one of {', '.join(_REDUCTIONS)}, "
+            f"got {reduction!r}"
+        )
+    func, kinds = _REDUCTIONS[reduction]
+    check_dtype(name, x, kinds)
+    values = x._operand(values)
+    if values is NotImplemented:
+        raise TypeError(f"{name}() requires values to be an array or a Python scalar")
+    if _dtypes.result_type(x.dtype, values.dtype) != x.dtype:
+        raise TypeError(
+            f"{name}() cannot write {values.dtype.name} values "
+            f"to a {x.dtype.name} array"
+        )
+    result = x._array.copy()
+    target = result[index].shape
+    data = np.broadcast_to(values._array.astype(result.dtype, copy=False), target)
+    if func is None:
+        result[index] = data
+    else:
+        with np.errstate(invalid="ignore"):
+            func.at(result, index, data)
+    return Array._new(result)
+
+
+def put(
+    x: Array,
+    indices: Array,
+    values: Union[Scalar, Array],
+    /,
+    *,
+    axis: Optional[int] = None,
+    reduction: Reduction = "replace",
+) -> Array:
+    check_dtype("put", indices, INTEGER)
+    if indices.ndim != 1:
+        raise ValueError("put() requires one-dimensional indices")
+    if axis is None:
+        if x.ndim > 1:
+            raise ValueError("put() requires an axis for arrays having ndim > 1")
+        axis = 0
+    axis = normalize_axis_index(axis, x.ndim)
+    index = (slice(None),) * axis + (indices._array,)
+    return _put("put", x, index, values, reduction)
+
+
+def put_along_axis(
+    x: Array,
+    indices: Array,
+    values: Union[Scalar, Array],
+    /,
+    *,
+    axis: int = -1,
+    reduction: Reduction = "replace",
+) -> Array:
+    check_dtype("put_along_axis", indices, INTEGER)
+    if indices.ndim != x.ndim:
+        raise ValueError("indices must have the same number of dimensions as x")
+    axis = normalize_axis_index(axis, x.ndim)
+    # Selects ``indices`` along ``axis`` and every position along the other axes.
+    index = tuple(
+        indices._array
+        if i == axis
+        else np.arange(n).reshape((-1,) + (1,) * (x.ndim - i - 1))
+        for i, n in enumerate(x.shape)
+    )
+    return _put("put_along_axis", x, index, values, reduction)
+
+
+def take(x: Array, indices: Array, /, *, axis: Optional[int] = None) -> Array:
+    check_dtype("take", indices, INTEGER)
+    if indices.ndim != 1:
+        raise ValueError("take() requires one-dimensional indices")
+    if axis is None:
+        if x.ndim > 1:
+            raise ValueError("take() requires an axis for arrays having ndim > 1")
+        axis = 0
+    return Array._new(np.take(x._array, indices._array, axis=axis))
+
+
+def take_along_axis(x: Array, indices: Array, /, *, axis: int = -1) -> Array:
+    check_dtype("take_along_axis", indices, INTEGER)
+    if indices.ndim != x.ndim:
+        raise ValueError("indices must have the same number of dimensions as x")
+    return Array._new(np.take_along_axis(x._array, indices._array, axis=axis))
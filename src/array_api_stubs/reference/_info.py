@@ -0,0 +1,52 @@
+"""
+Inspection API of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple, Union
+
+from . import _dtypes
+from ._array_object import CPU_DEVICE, Device, check_device
+from ._dtypes import DType
+
+__all__ = ["__array_namespace_info__"]
+
+
+class Info:
+    """Namespace returned by ``__array_namespace_info__``."""
+
+    __module__ = "array_api_stubs.reference"
+
+    def capabilities(self) -> Dict[str, Union[bool, int, None]]:
+        return {
+            "boolean indexing": True,
+            "data-dependent shapes": True,
+            "max dimensions": 64,
+        }
+
+    def default_device(self) -> Device:
+        return CPU_DEVICE
+
+    def default_dtypes(self, *, device: Optional[Device] = None) -> Dict[str, DType]:
+        check_device(device)
+        return dict(_dtypes.DEFAULT_DTYPES)
+
+    def dtypes(
+        self,
+        *,
+        device: Optional[Device] = None,
+        kind: Optional[Union[str, Tuple[str, ...]]] = None,
+    ) -> Dict[str, DType]:
+        check_device(device)
+        if kind is None:
+            return dict(_dtypes.DTYPES)
+        return {
+            name: dt for name, dt in _dtypes.DTYPES.items() if _dtypes.isdtype(dt, kind)
+        }
+
+    def devices(self) -> Tuple[Device, ...]:
+        return (CPU_DEVICE,)
+
+
+def __array_namespace_info__() -> Info:
+    return Info()
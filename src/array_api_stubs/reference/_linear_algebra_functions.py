@@ -0,0 +1,118 @@
+"""
+Linear algebra functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array
+from ._elementwise_functions import NUMERIC, check_dtype
+
+__all__ = ["einsum", "matmul", "matrix_transpose", "tensordot", "vecdot"]
+
+
+def _promoted(name: str, x1: Array, x2: Array) -> Tuple[np.ndarray, np.ndarray]:
+    check_dtype(name, x1, NUMERIC)
+    check_dtype(name, x2, NUMERIC)
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)._np_dtype
+    return x1._array.astype(dtype, copy=False), x2._array.astype(dtype, copy=False)
+
+
+def einsum(
+    subscripts: str,
+    /,
+    *operands: Array,
+    optimize: Union[bool, str, Sequence[Tuple[int, ...]]] = True,
+) -> Array:
+    if not isinstance(subscripts, str):
+        raise TypeError("einsum() requires a string of subscripts")
+    if not operands:
+        raise ValueError("einsum() requires at least one operand")
+    for x in operands:
+        check_dtype("einsum", x, NUMERIC)
+    labels = subscripts.replace("...", "").replace(",", "").replace("->", "")
+    if not all(c.isascii() and (c.isalpha() or c.isspace()) for c in labels):
+        raise ValueError(f"einsum() subscripts {subscripts!r} are not valid")
+    if isinstance(optimize, bool):
+        optimize = "greedy" if optimize else False
+    elif isinstance(optimize, str):
+        if optimize not in ("greedy", "optimal"):
+            raise ValueError(f"einsum() got an unknown optimize value {optimize!r}")
+    else:
+        path = [tuple(step) for step in optimize]
+        remaining = len(operands)
+        for step in path:
+            if len(set(step)) != len(step) or not all(0 <= i < remaining for i in step):
+                raise ValueError(f"einsum() got an invalid contraction step {step}")
+            remaining -= len(step) - 1
+        if remaining != 1:
+            raise ValueError("einsum() contraction path must leave a single operand")
+        optimize = ["einsum_path", *path]
+    dtype = _dtypes.result_type(*[x.dtype for x in operands])._np_dtype
+    arrays = [x._array.astype(dtype, copy=False) for x in operands]
+    return Array._new(np.asarray(np.einsum(subscripts, *arrays, optimize=optimize)))
+
+
+def _transposed(
+    name: str, a: np.ndarray, transpose: bool, adjoint: bool, label: str
+) -> np.ndarray:
+    # Applies the ``transpose_*`` and ``adjoint_*`` flags of a matrix product.
+    if transpose and adjoint:
+        raise ValueError(
+            f"{name}() got both transpose_{label}=True and adjoint_{label}=True"
+        )
+    if adjoint:
+        a = a.conj()
+    if (transpose or adjoint) and a.ndim >= 2:
+        a = np.swapaxes(a, -1, -2)
+    return a
+
+
+def matmul(
+    x1: Array,
+    x2: Array,
+    /,
+    *,
+    transpose_a: bool = False,
+    transpose_b: bool = False,
+    adjoint_a: bool = False,
+    adjoint_b: bool = False,
+) -> Array:
+    if x1.ndim == 0 or x2.ndim == 0:
+        raise ValueError("matmul() is not defined for zero-dimensional arrays")
+    a, b = _promoted("matmul", x1, x2)
+    a = _transposed("matmul", a, transpose_a, adjoint_a, "a")
+    b = _transposed("matmul", b, transpose_b, adjoint_b, "b")
+    return Array._new(np.asarray(np.matmul(a, b)))
+
+
+def matrix_transpose(x: Array, /) -> Array:
+    if x.ndim < 2:
+        raise ValueError("matrix_transpose() requires at least two dimensions")
+    return Array._new(np.swapaxes(x._array, -1, -2))
+
+
+def tensordot(
+    x1: Array,
+    x2: Array,
+    /,
+    *,
+    axes: Union[int, Tuple[Sequence[int], Sequence[int]]] = 2,
+) -> Array:
+    a, b = _promoted("tensordot", x1, x2)
+    return Array._new(np.asarray(np.tensordot(a, b, axes=axes)))
+
+
+def vecdot(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
+    a, b = _promoted("vecdot", x1, x2)
+    ndim = max(a.ndim, b.ndim)
+    if not -ndim <= axis < ndim:
+        raise ValueError(f"axis {axis} is out of bounds for {ndim} dimensions")
+    # The axis refers to the broadcast shape, hence is counted from the end.
+    axis = axis - ndim if axis >= 0 else axis
+    if a.shape[axis] != b.shape[axis]:
+        raise ValueError("vecdot() requires axes of equal size")
+    return Array._new(np.asarray(np.vecdot(a, b, axis=axis)))
@@ -0,0 +1,128 @@
+"""
+Manipulation functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array
+
+__all__ = [
+    "broadcast_arrays",
+    "broadcast_shapes",
+    "broadcast_to",
+    "concat",
+    "expand_dims",
+    "flip",
+    "moveaxis",
+    "permute_dims",
+    "repeat",
+    "reshape",
+    "roll",
+    "squeeze",
+    "stack",
+    "tile",
+    "unstack",
+]
+
+
+def _result_arrays(arrays: Union[Tuple[Array, ...], List[Array]]) -> List[np.ndarray]:
+    # Returns the NumPy arrays of ``arrays`` cast to their promoted data type.
+    dtype = _dtypes.result_type(*[a.dtype for a in arrays])
+    return [a._array.astype(dtype._np_dtype, copy=False) for a in arrays]
+
+
+def broadcast_arrays(*arrays: Array) -> Tuple[Array, ...]:
+    return tuple(
+        Array._new(a) for a in np.broadcast_arrays(*[a._array for a in arrays])
+    )
+
+
+def broadcast_shapes(*shapes: Tuple[Optional[int], ...]) -> Tuple[Optional[int], ...]:
+    return np.broadcast_shapes(*shapes)
+
+
+def broadcast_to(x: Array, /, shape: Tuple[int, ...]) -> Array:
+    return Array._new(np.broadcast_to(x._array, shape))
+
+
+def concat(
+    arrays: Union[Tuple[Array, ...], List[Array]], /, *, axis: Optional[int] = 0
+) -> Array:
+    return Array._new(np.concatenate(_result_arrays(arrays), axis=axis))
+
+
+def expand_dims(x: Array, /, axis: Union[int, Tuple[int, ...]]) -> Array:
+    return Array._new(np.expand_dims(x._array, axis))
+
+
+def flip(x: Array, /, *, axis: Optional[Union[int, Tuple[int, ...]]] = None) -> Array:
+    return Array._new(np.flip(x._array, axis=axis))
+
+
+def moveaxis(
+    x: Array,
+    source: Union[int, Tuple[int, ...]],
+    destination: Union[int, Tuple[int, ...]],
+    /,
+) -> Array:
+    return Array._new(np.moveaxis(x._array, source, destination))
+
+
+def permute_dims(x: Array, /, axes: Tuple[int, ...]) -> Array:
+    return Array._new(np.transpose(x._array, axes))
+
+
+def repeat(
+    x: Array,
+    repeats: Union[int, Array],
+    /,
+    *,
+    axis: Optional[int] = None,
+) -> Array:
+    if isinstance(repeats, Array):
+        if not _dtypes.isdtype(repeats.dtype, "integral"):
+            raise TypeError(f"repeats must be an integer array, got {repeats.dtype}")
+        repeats = repeats._array
+    return Array._new(np.repeat(x._array, repeats, axis=axis))
+
+
+def reshape(
+    x: Array, /, shape: Tuple[int, ...], *, copy: Optional[bool] = None
+) -> Array:
+    return Array._new(np.reshape(x._array, shape, copy=copy))
+
+
+def roll(
+    x: Array,
+    /,
+    shift: Union[int, Tuple[int, ...]],
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+) -> Array:
+    return Array._new(np.roll(x._array, shift, axis=axis))
+
+
+def squeeze(x: Array, /, axis: Union[int, Tuple[int, ...]]) -> Array:
+    axes = axis if isinstance(axis, tuple) else (axis,)
+    for a in axes:
+        if x.shape[a] != 1:
+            raise ValueError(f"cannot squeeze axis {a} having size {x.shape[a]}")
+    return Array._new(np.squeeze(x._array, axis=axis))
+
+
+def stack(arrays: Union[Tuple[Array, ...], List[Array]], /, *, axis: int = 0) -> Array:
+    return Array._new(np.stack(_result_arrays(arrays), axis=axis))
+
+
+def tile(x: Array, repetitions: Tuple[int, ...], /) -> Array:
+    return Array._new(np.tile(x._array, repetitions))
+
+
+def unstack(x: Array, /, *, axis: int = 0) -> Tuple[Array, ...]:
+    if x.ndim == 0:
+        raise ValueError("unstack() requires an array having at least one dimension")
+    return tuple(Array._new(a) for a in np.moveaxis(x._array, axis, 0))
@@ -0,0 +1,114 @@
+"""
+Searching functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array, scalar_to_array
+from ._elementwise_functions import ALL, REAL, check_dtype, operands
+from ._statistical_functions import NanPolicy, omit_nan
+
+__all__ = ["argmax", "argmin", "count_nonzero", "nonzero", "searchsorted", "where"]
+
+_INDEX = _dtypes.DEFAULT_DTYPES["indexing"]._np_dtype
+
+
+def _arg_reduce(
+    func,
+    nan_func,
+    name: str,
+    x: Array,
+    axis: Optional[int],
+    keepdims: bool,
+    nan_policy: NanPolicy,
+):
+    check_dtype(name, x, REAL)
+    if x.size == 0:
+        raise ValueError(f"{name}() of an empty array is not defined")
+    a = x._array
+    if omit_nan(name, nan_policy):
+        # The index is unspecified for slices containing only NaN values, for
+        # which NumPy raises a ``ValueError``; such slices are filled with zeros
+        # so that their index is ``0``.
+        func = nan_func
+        a = np.where(np.all(np.isnan(a), axis=axis, keepdims=True), 0, a)
+    out = func(a, axis=axis, keepdims=keepdims)
+    return Array._new(np.asarray(out, dtype=_INDEX))
+
+
+def argmax(
+    x: Array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+) -> Array:
+    return _arg_reduce(np.argmax, np.nanargmax, "argmax", x, axis, keepdims, nan_policy)
+
+
+def argmin(
+    x: Array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+) -> Array:
+    return _arg_reduce(np.argmin, np.nanargmin, "argmin", x, axis, keepdims, nan_policy)
+
+
+def count_nonzero(
+    x: Array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> Array:
+    out = np.count_nonzero(x._array, axis=axis, keepdims=keepdims)
+    return Array._new(np.asarray(out, dtype=_INDEX))
+
+
+def nonzero(x: Array, /) -> Tuple[Array, ...]:
+    if x.ndim == 0:
+        raise ValueError("nonzero() is not defined for zero-dimensional arrays")
+    return tuple(Array._new(i.astype(_INDEX)) for i in np.nonzero(x._array))
+
+
+def searchsorted(
+    x1: Array,
+    x2: Union[Array, int, float],
+    /,
+    *,
+    side: Literal["left", "right"] = "left",
+    sorter: Optional[Array] = None,
+) -> Array:
+    if x1.ndim != 1:
+        raise ValueError("searchsorted() requires a one-dimensional array")
+    if not isinstance(x2, Array):
+        x2 = scalar_to_array(x2, x1.dtype)
+    check_dtype("searchsorted", x1, REAL)
+    check_dtype("searchsorted", x2, REAL)
+    _dtypes.result_type(x1.dtype, x2.dtype)
+    if sorter is not None:
+        check_dtype("searchsorted", sorter, "integral")
+        sorter = sorter._array
+    out = np.searchsorted(x1._array, x2._array, side=side, sorter=sorter)
+    return Array._new(np.asarray(out, dtype=_INDEX))
+
+
+def where(
+    condition: Array,
+    x1: Union[Array, int, float, complex, bool],
+    x2: Union[Array, int, float, complex, bool],
+    /,
+) -> Array:
+    check_dtype("where", condition, "bool")
+    x1, x2 = operands("where", x1, x2, ALL)
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)
+    out = np.where(condition._array, x1._array, x2._array)
+    return Array._new(out.astype(dtype._np_dtype, copy=False))
@@ -0,0 +1,77 @@
+"""
+Set functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array
+from ._elementwise_functions import INTEGER, operands
+
+__all__ = ["isin", "unique_all", "unique_counts", "unique_inverse", "unique_values"]
+
+_INDEX = _dtypes.DEFAULT_DTYPES["indexing"]._np_dtype
+
+
+class UniqueAllResult(NamedTuple):
+    values: Array
+    indices: Array
+    inverse_indices: Array
+    counts: Array
+
+
+class UniqueCountsResult(NamedTuple):
+    values: Array
+    counts: Array
+
+
+class UniqueInverseResult(NamedTuple):
+    values: Array
+    inverse_indices: Array
+
+
+def _unique(x: Array, **kwargs):
+    # NaN values are distinct from one another, as required by the specification.
+    return np.unique(x._array.ravel(), equal_nan=False, **kwargs)
+
+
+def isin(
+    x1: Union[Array, int],
+    x2: Union[Array, int],
+    /,
+    *,
+    invert: bool = False,
+) -> Array:
+    x1, x2 = operands("isin", x1, x2, INTEGER)
+    return Array._new(np.isin(x1._array, x2._array, invert=invert))
+
+
+def unique_all(x: Array, /) -> UniqueAllResult:
+    values, indices, inverse, counts = _unique(
+        x, return_index=True, return_inverse=True, return_counts=True
+    )
+    return UniqueAllResult(
+        Array._new(values),
+        Array._new(indices.astype(_INDEX)),
+        Array._new(inverse.reshape(x.shape).astype(_INDEX)),
+        Array._new(counts.astype(_INDEX)),
+    )
+
+
+def unique_counts(x: Array, /) -> UniqueCountsResult:
+    values, counts = _unique(x, return_counts=True)
+    return UniqueCountsResult(Array._new(values), Array._new(counts.astype(_INDEX)))
+
+
+def unique_inverse(x: Array, /) -> UniqueInverseResult:
+    values, inverse = _unique(x, return_inverse=True)
+    return UniqueInverseResult(
+        Array._new(values), Array._new(inverse.reshape(x.shape).astype(_INDEX))
+    )
+
+
+def unique_values(x: Array, /) -> Array:
+    return Array._new(_unique(x))
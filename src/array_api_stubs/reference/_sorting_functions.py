@@ -0,0 +1,117 @@
+"""
+Sorting functions of the reference implementation.
+"""
+from __future__ import annotations
+
+import operator
+from typing import NamedTuple
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array
+from ._elementwise_functions import REAL, check_dtype
+
+__all__ = ["argpartition", "argsort", "partition", "sort", "top_k"]
+
+_INDEX = _dtypes.DEFAULT_DTYPES["indexing"]._np_dtype
+
+
+class TopKResult(NamedTuple):
+    values: Array
+    indices: Array
+
+
+def _axis_size(name: str, x: Array, axis: int) -> int:
+    check_dtype(name, x, REAL)
+    if x.ndim == 0:
+        raise ValueError(f"{name}() requires an array having at least one dimension")
+    if not -x.ndim <= axis < x.ndim:
+        raise ValueError(f"axis {axis} is out of bounds for {x.ndim} dimensions")
+    return x.shape[axis]
+
+
+def _kth(name: str, x: Array, kth: int, axis: int) -> int:
+    n = _axis_size(name, x, axis)
+    kth = operator.index(kth)
+    if not -n <= kth < n:
+        raise ValueError(f"kth {kth} is out of bounds for an axis of size {n}")
+    return kth % n
+
+
+def argpartition(x: Array, kth: int, /, *, axis: int = -1) -> Array:
+    kth = _kth("argpartition", x, kth, axis)
+    return Array._new(np.argpartition(x._array, kth, axis=axis).astype(_INDEX))
+
+
+def argsort(
+    x: Array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
+) -> Array:
+    check_dtype("argsort", x, REAL)
+    kind = "stable" if stable else None
+    if not descending:
+        out = np.argsort(x._array, axis=axis, kind=kind)
+    else:
+        # Sorting the reversed array keeps equal elements in their original
+        # order once the indices are mapped back.
+        flipped = np.flip(x._array, axis=axis)
+        out = np.flip(np.argsort(flipped, axis=axis, kind=kind), axis=axis)
+        out = x.shape[axis] - 1 - out
+    return Array._new(out.astype(_INDEX))
+
+
+def partition(x: Array, kth: int, /, *, axis: int = -1) -> Array:
+    kth = _kth("partition", x, kth, axis)
+    return Array._new(np.partition(x._array, kth, axis=axis))
+
+
+def sort(
+    x: Array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
+) -> Array:
+    check_dtype("sort", x, REAL)
+    out = np.sort(x._array, axis=axis, kind="stable" if stable else None)
+    if descending:
+        out = np.flip(out, axis=axis)
+    return Array._new(out)
+
+
+def top_k(
+    x: Array,
+    k: int,
+    /,
+    *,
+    axis: int = -1,
+    largest: bool = True,
+    sorted: bool = True,
+) -> TopKResult:
+    n = _axis_size("top_k", x, axis)
+    k = operator.index(k)
+    if not 0 <= k <= n:
+        raise ValueError(f"k {k} is out of bounds for an axis of size {n}")
+    a = np.moveaxis(x._array, axis, -1)
+    if k == 0:
+        indices = np.empty(a.shape[:-1] + (0,), dtype=_INDEX)
+    else:
+        # Selects the k-th value, as NumPy orders NaNs after all other values.
+        kth = n - k if largest else k - 1
+        value = np.partition(a, kth, axis=-1)[..., kth, None]
+        nan, value_nan = np.isnan(a), np.isnan(value)
+        if largest:
+            better = (a > value) | (nan & ~value_nan)
+        else:
+            better = (a < value) | (~nan & value_nan)
+        # Among elements equal to the k-th value, the selection prefers those
+        # having smaller indices.
+        tied = (a == value) | (nan & value_nan)
+        needed = k - np.sum(better, axis=-1, keepdims=True)
+        mask = better | (tied & (np.cumsum(tied, axis=-1) <= needed))
+        # Each slice selects exactly k elements, listed in index order.
+        indices = np.nonzero(mask)[-1].reshape(a.shape[:-1] + (k,)).astype(_INDEX)
+    values = np.take_along_axis(a, indices, axis=-1)
+    if sorted:
+        # A stable sort of the k selected elements keeps ties in index order.
+        order = argsort(Array._new(values), descending=largest)._array
+        indices = np.take_along_axis(indices, order, axis=-1)
+        values = np.take_along_axis(values, order, axis=-1)
+    values, indices = np.moveaxis(values, -1, axis), np.moveaxis(indices, -1, axis)
+    return TopKResult(Array._new(values), Array._new(indices))
@@ -0,0 +1,724 @@
+"""
+Statistical functions of the reference implementation.
+"""
+from __future__ import annotations
+
+import builtins
+import contextlib
+import math
+import operator
+import warnings
+from typing import Iterator, Literal, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib.array_utils import normalize_axis_tuple
+
+from . import _dtypes
+from ._array_object import Array
+from ._dtypes import DType
+from ._elementwise_functions import (
+    FLOATING,
+    INTEGER,
+    NUMERIC,
+    REAL,
+    REAL_FLOATING,
+    check_dtype,
+    result_array,
+    where_mask,
+)
+
+__all__ = [
+    "bincount",
+    "cumulative_sum",
+    "cumulative_prod",
+    "histogram",
+    "log_softmax",
+    "logsumexp",
+    "max",
+    "mean",
+    "mean_var",
+    "merge_moments",
+    "min",
+    "minmax",
+    "moments",
+    "moments_var",
+    "prod",
+    "segment_max",
+    "segment_mean",
+    "segment_min",
+    "segment_sum",
+    "softmax",
+    "std",
+    "sum",
+    "var",
+]
+
+Axis = Optional[Union[int, Tuple[int, ...]]]
+NanPolicy = Literal["propagate", "omit"]
+
+_INDEX = _dtypes.DEFAULT_DTYPES["indexing"]._np_dtype
+
+
+class HistogramResult(NamedTuple):
+    counts: Array
+    bin_edges: Array
+
+
+class MeanVarResult(NamedTuple):
+    mean: Array
+    var: Array
+
+
+class MinMaxResult(NamedTuple):
+    min: Array
+    max: Array
+
+
+class MomentsResult(NamedTuple):
+    count: Array
+    mean: Array
+    m2: Array
+
+
+@contextlib.contextmanager
+def _quiet() -> Iterator[None]:
+    # NumPy warns about empty reductions, whose results the specification defines.
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        yield
+
+
+def omit_nan(name: str, nan_policy: NanPolicy) -> bool:
+    """Returns whether ``NaN`` values must be omitted according to ``nan_policy``."""
+    if nan_policy not in ("propagate", "omit"):
+        raise ValueError(
+            f"{name}() requires nan_policy to be 'propagate' or 'omit', "
+            f"got {nan_policy!r}"
+        )
+    return nan_policy == "omit"
+
+
+def _selection(
+    name: str, x: Array, where: Optional[Array], nan_policy: NanPolicy
+) -> Union[bool, np.ndarray]:
+    # Returns the mask of the elements of ``x`` to include in a reduction.
+    mask = where_mask(name, x, where)
+    if omit_nan(name, nan_policy) and _dtypes.isdtype(x.dtype, FLOATING):
+        mask = mask & ~np.isnan(x._array)
+    return mask
+
+
+def _count(x: Array, mask: Union[bool, np.ndarray], axis, keepdims: bool):
+    # Returns the number of elements selected by ``mask`` in each reduced slice.
+    return np.sum(np.broadcast_to(mask, x.shape), axis=axis, keepdims=keepdims)
+
+
+def _moment(
+    func,
+    name: str,
+    x: Array,
+    axis,
+    correction,
+    keepdims: bool,
+    nan_policy: NanPolicy,
+    where: Optional[Array],
+    out: Optional[Array],
+) -> Array:
+    check_dtype(name, x, REAL_FLOATING)
+    mask = _selection(name, x, where, nan_policy)
+    with _quiet():
+        result = np.asarray(
+            func(x._array, axis=axis, ddof=correction, keepdims=keepdims, where=mask),
+            dtype=x.dtype._np_dtype,
+        )
+    # NumPy clamps the divisor at zero, whereas the result must then be NaN.
+    if mask is True:
+        m = x.size // result.size if result.size else 0
+    else:
+        m = _count(x, mask, axis, keepdims)
+    result = np.where(m - correction <= 0, np.nan, result).astype(result.dtype)
+    return result_array(name, result, out)
+
+
+def _extremum(
+    func,
+    name: str,
+    x: Array,
+    axis,
+    keepdims: bool,
+    nan_policy: NanPolicy,
+    where: Optional[Array],
+    out: Optional[Array],
+) -> Array:
+    check_dtype(name, x, REAL)
+    mask = _selection(name, x, where, nan_policy)
+    if mask is True:
+        return result_array(name, func(x._array, axis=axis, keepdims=keepdims), out)
+    if np.any(_count(x, where_mask(name, x, where), axis, keepdims) == 0):
+        raise ValueError(f"{name}() of an empty selection is not defined")
+    result = func(
+        x._array,
+        axis=axis,
+        keepdims=keepdims,
+        where=mask,
+        initial=_bound(x, func is np.max),
+    )
+    if _dtypes.isdtype(x.dtype, REAL_FLOATING):
+        # Slices whose selected elements are all omitted ``NaN`` values.
+        empty = _count(x, mask, axis, keepdims) == 0
+        result = np.where(empty, np.nan, result).astype(result.dtype)
+    return result_array(name, result, out)
+
+
+def _result_pair(
+    name: str, out: Optional[Tuple[Array, Array]]
+) -> Tuple[Optional[Array], Optional[Array]]:
+    # Unpacks the ``out`` argument of a reduction returning a pair of arrays.
+    if out is None:
+        return None, None
+    if not isinstance(out, tuple) or len(out) != 2:
+        raise TypeError(f"{name}() expected a pair of arrays for out")
+    return out
+
+
+def _unpack_moments(
+    name: str, moments: Tuple[Array, Array, Array]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    count, mean, m2 = moments
+    check_dtype(name, count, INTEGER)
+    check_dtype(name, mean, REAL_FLOATING)
+    if m2.dtype != mean.dtype:
+        raise TypeError(f"{name}() requires mean and m2 having the same data type")
+    return count._array, mean._array, m2._array
+
+
+def _logsumexp(a: np.ndarray, axis, keepdims: bool) -> np.ndarray:
+    # Shifting by a finite maximum prevents overflow, whereas non-finite maxima
+    # (including that of an empty array) yield the special cases unshifted.
+    m = np.max(a, axis=axis, keepdims=True, initial=-np.inf)
+    m = np.where(np.isfinite(m), m, 0).astype(a.dtype)
+    with _quiet():
+        result = np.log(np.sum(np.exp(a - m), axis=axis, keepdims=True)) + m
+    return result if keepdims else np.squeeze(result, axis=axis)
+
+
+def _normalized(name: str, x: Array, axis: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns ``x`` and the logarithm of the sum of exponentials of its slices.
+    check_dtype(name, x, REAL_FLOATING)
+    if not -x.ndim <= axis < x.ndim:
+        raise ValueError(f"axis {axis} is out of bounds for {x.ndim} dimensions")
+    return x._array, _logsumexp(x._array, axis, keepdims=True)
+
+
+def accumulation_dtype(name: str, x: Array, dtype: Optional[DType]) -> DType:
+    """
+    Returns the data type of the sums or products of the elements of ``x``.
+
+    Integer data types having a smaller range of values than the default integer
+    data type are upcast to the default integer data type of the same signedness.
+    """
+    check_dtype(name, x, NUMERIC)
+    if dtype is not None:
+        if not isinstance(dtype, DType):
+            raise TypeError(f"expected a data type of this namespace, got {dtype!r}")
+        return dtype
+    default = _dtypes.DEFAULT_DTYPES["integral"]
+    if x.dtype in _dtypes.KINDS["signed integer"]:
+        return default
+    if x.dtype in _dtypes.KINDS["unsigned integer"]:
+        return _dtypes.from_numpy(np.dtype(f"u{default._np_dtype.itemsize}"))
+    return x.dtype
+
+
+def _cumulative(
+    func,
+    name: str,
+    x: Array,
+    axis: Optional[int],
+    dtype,
+    include_initial: bool,
+    out: Optional[Array],
+) -> Array:
+    dtype = accumulation_dtype(name, x, dtype)
+    if axis is None:
+        if x.ndim > 1:
+            raise ValueError(f"{name}() requires an axis for arrays having ndim > 1")
+        axis = 0
+    if x.ndim == 0:
+        raise ValueError(f"{name}() requires an array having at least one dimension")
+    result = func(x._array, axis=axis, dtype=dtype._np_dtype)
+    if include_initial:
+        shape = list(result.shape)
+        shape[axis] = 1
+        initial = np.full(shape, 0 if func is np.cumsum else 1, dtype=result.dtype)
+        result = np.concatenate([initial, result], axis=axis)
+    return result_array(name, result, out)
+
+
+def _segment(
+    func,
+    name: str,
+    x: Array,
+    segment_ids: Array,
+    num_segments: int,
+    axis: int,
+    dtype: DType,
+    initial,
+) -> np.ndarray:
+    # Returns ``func.reduce`` over each segment, as an array whose first axis
+    # indexes the segments.
+    check_dtype(name, segment_ids, INTEGER)
+    if x.ndim == 0:
+        raise ValueError(f"{name}() requires an array having at least one dimension")
+    if not -x.ndim <= axis < x.ndim:
+        raise ValueError(f"axis {axis} is out of bounds for {x.ndim} dimensions")
+    if segment_ids.shape != (x.shape[axis],):
+        raise ValueError(
+            f"{name}() requires segment_ids to have shape {(x.shape[axis],)}, "
+            f"got {segment_ids.shape}"
+        )
+    num_segments = operator.index(num_segments)
+    if num_segments < 0:
+        raise ValueError(f"{name}() requires a nonnegative number of segments")
+    data = np.moveaxis(x._array, axis, 0).astype(dtype._np_dtype, copy=False)
+    ids = segment_ids._array
+    keep = (ids >= 0) & (ids < num_segments)
+    result = np.full((num_segments, *data.shape[1:]), initial, dtype=data.dtype)
+    with np.errstate(invalid="ignore"):
+        func.at(result, ids[keep], data[keep])
+    return result
+
+
+def _bound(x: Array, upper: bool):
+    # Returns the identity of ``maximum`` or ``minimum`` for the data type of ``x``.
+    if _dtypes.isdtype(x.dtype, "real floating"):
+        return -np.inf if upper else np.inf
+    info = np.iinfo(x.dtype._np_dtype)
+    return info.min if upper else info.max
+
+
+def bincount(
+    x: Array,
+    /,
+    *,
+    weights: Optional[Array] = None,
+    minlength: int = 0,
+    length: Optional[int] = None,
+) -> Array:
+    check_dtype("bincount", x, INTEGER)
+    if x.ndim != 1:
+        raise ValueError("bincount() requires a one-dimensional array")
+    a = x._array
+    if a.size and a.min() < 0:
+        raise ValueError("bincount() requires non-negative values")
+    if minlength < 0 or (length is not None and length < minlength):
+        raise ValueError("bincount() requires 0 <= minlength <= length")
+    if length is None:
+        length = builtins.max(minlength, int(a.max()) + 1 if a.size else 0)
+    keep = a < length
+    if weights is None:
+        return Array._new(np.bincount(a[keep], minlength=length).astype(_INDEX))
+    check_dtype("bincount", weights, NUMERIC)
+    if weights.shape != x.shape:
+        raise ValueError("bincount() requires weights having the same shape as x")
+    # ``np.bincount`` casts weights to float64, which ``add.at`` avoids.
+    result = np.zeros(length, dtype=weights.dtype._np_dtype)
+    np.add.at(result, a[keep], weights._array[keep])
+    return Array._new(result)
+
+
+def cumulative_prod(
+    x: Array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    dtype: Optional[DType] = None,
+    include_initial: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    return _cumulative(
+        np.cumprod, "cumulative_prod", x, axis, dtype, include_initial, out
+    )
+
+
+def cumulative_sum(
+    x: Array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    dtype: Optional[DType] = None,
+    include_initial: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    return _cumulative(
+        np.cumsum, "cumulative_sum", x, axis, dtype, include_initial, out
+    )
+
+
+def histogram(
+    x: Array,
+    /,
+    bins: Union[int, Array] = 10,
+    *,
+    range: Optional[Tuple[Union[int, float], Union[int, float]]] = None,
+    weights: Optional[Array] = None,
+) -> HistogramResult:
+    check_dtype("histogram", x, REAL)
+    a = x._array.ravel()
+    if _dtypes.isdtype(x.dtype, REAL_FLOATING):
+        dtype = x.dtype._np_dtype
+    else:
+        dtype = _dtypes.DEFAULT_DTYPES["real floating"]._np_dtype
+    if isinstance(bins, Array):
+        check_dtype("histogram", bins, REAL)
+        if bins.ndim != 1 or bins.size < 2:
+            raise ValueError("histogram() requires at least two bin edges")
+        edges = bins._array
+        if np.any(edges[1:] < edges[:-1]):
+            raise ValueError("histogram() requires monotonically increasing bin edges")
+    else:
+        num = operator.index(bins)
+        if num < 1:
+            raise ValueError(
+                f"histogram() requires a positive number of bins, got {num}"
+            )
+        if range is None:
+            finite = a[~np.isnan(a)]
+            range = (finite.min(), finite.max()) if finite.size else (0, 1)
+        lo, hi = range
+        if lo > hi:
+            raise ValueError("histogram() requires range[0] <= range[1]")
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        edges = np.linspace(lo, hi, num + 1, dtype=dtype)
+    if weights is not None:
+        check_dtype("histogram", weights, REAL)
+        if weights.shape != x.shape:
+            raise ValueError("histogram() requires weights having the same shape as x")
+    # NaN values compare false with every edge and thus fall in no bin.
+    keep = (a >= edges[0]) & (a <= edges[-1])
+    index = np.searchsorted(edges, a[keep], side="right") - 1
+    index = np.minimum(index, edges.size - 2)
+    if weights is None:
+        counts = np.bincount(index, minlength=edges.size - 1).astype(_INDEX)
+    else:
+        counts = np.zeros(edges.size - 1, dtype=weights.dtype._np_dtype)
+        np.add.at(counts, index, weights._array.ravel()[keep])
+    return HistogramResult(Array._new(counts), Array._new(edges.copy()))
+
+
+def log_softmax(x: Array, /, *, axis: int = -1, out: Optional[Array] = None) -> Array:
+    a, lse = _normalized("log_softmax", x, axis)
+    # Slices containing NaN or +infinity, or only -infinity, are NaN.
+    with _quiet():
+        result = np.where(np.isfinite(lse), a - lse, np.nan).astype(a.dtype)
+    return result_array("log_softmax", result, out)
+
+
+def logsumexp(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    check_dtype("logsumexp", x, REAL_FLOATING)
+    axes = normalize_axis_tuple(range(x.ndim) if axis is None else axis, x.ndim)
+    return result_array("logsumexp", _logsumexp(x._array, axes, keepdims), out)
+
+
+def max(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    return _extremum(np.max, "max", x, axis, keepdims, nan_policy, where, out)
+
+
+def mean(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    check_dtype("mean", x, FLOATING)
+    mask = _selection("mean", x, where, nan_policy)
+    with _quiet():
+        result = np.mean(x._array, axis=axis, keepdims=keepdims, where=mask)
+    return result_array("mean", np.asarray(result, dtype=x.dtype._np_dtype), out)
+
+
+def mean_var(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Tuple[Array, Array]] = None,
+) -> MeanVarResult:
+    check_dtype("mean_var", x, REAL_FLOATING)
+    mask = _selection("mean_var", x, where, nan_policy)
+    out_mean, out_var = _result_pair("mean_var", out)
+    axes = normalize_axis_tuple(range(x.ndim) if axis is None else axis, x.ndim)
+    divisor = _count(x, mask, axes, keepdims) - correction
+    with _quiet():
+        mean = np.mean(x._array, axis=axes, keepdims=True, where=mask)
+        # The variance reuses the mean rather than computing it a second time.
+        m2 = np.sum((x._array - mean) ** 2, axis=axes, keepdims=keepdims, where=mask)
+        var = np.where(divisor <= 0, np.nan, m2 / divisor)
+    if not keepdims:
+        mean = np.squeeze(mean, axis=axes)
+    dtype = x.dtype._np_dtype
+    return MeanVarResult(
+        result_array("mean_var", np.asarray(mean, dtype=dtype), out_mean),
+        result_array("mean_var", np.asarray(var, dtype=dtype), out_var),
+    )
+
+
+def merge_moments(
+    moments1: Tuple[Array, Array, Array], moments2: Tuple[Array, Array, Array], /
+) -> MomentsResult:
+    (n_a, mean_a, m2_a), (n_b, mean_b, m2_b) = (
+        _unpack_moments("merge_moments", moments1),
+        _unpack_moments("merge_moments", moments2),
+    )
+    if mean_a.dtype != mean_b.dtype:
+        raise TypeError("merge_moments() requires moments having the same data type")
+    with _quiet():
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        f_a, f_b, f = (c.astype(mean_a.dtype) for c in (n_a, n_b, n))
+        mean = mean_a + delta * (f_b / f)
+        m2 = m2_a + m2_b + delta**2 * (f_a * f_b / f)
+    # The moments of an empty set, whose mean is NaN, are the identity.
+    mean = np.where(n_a == 0, mean_b, np.where(n_b == 0, mean_a, mean))
+    m2 = np.where(n_a == 0, m2_b, np.where(n_b == 0, m2_a, m2))
+    n = np.broadcast_to(n, mean.shape).copy()
+    return MomentsResult(Array._new(n), Array._new(mean), Array._new(m2))
+
+
+def min(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    return _extremum(np.min, "min", x, axis, keepdims, nan_policy, where, out)
+
+
+def minmax(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Tuple[Array, Array]] = None,
+) -> MinMaxResult:
+    out_min, out_max = _result_pair("minmax", out)
+    args = (x, axis, keepdims, nan_policy, where)
+    return MinMaxResult(
+        _extremum(np.min, "minmax", *args, out_min),
+        _extremum(np.max, "minmax", *args, out_max),
+    )
+
+
+def moments(x: Array, /, *, axis: Axis = None, keepdims: bool = False) -> MomentsResult:
+    check_dtype("moments", x, REAL_FLOATING)
+    axes = normalize_axis_tuple(range(x.ndim) if axis is None else axis, x.ndim)
+    with _quiet():
+        mean = np.mean(x._array, axis=axes, keepdims=True)
+        # Two passes, as sums of squares suffer from catastrophic cancellation.
+        m2 = np.sum((x._array - mean) ** 2, axis=axes, keepdims=keepdims)
+    if not keepdims:
+        mean = np.squeeze(mean, axis=axes)
+    count = np.full(m2.shape, math.prod(x.shape[i] for i in axes), dtype=_INDEX)
+    return MomentsResult(Array._new(count), Array._new(mean), Array._new(m2))
+
+
+def moments_var(
+    moments: Tuple[Array, Array, Array], /, *, correction: Union[int, float] = 0.0
+) -> Array:
+    count, _, m2 = _unpack_moments("moments_var", moments)
+    with _quiet():
+        divisor = count - correction
+        result = np.asarray(m2 / divisor, dtype=m2.dtype)
+    # The result must be NaN rather than infinite or negative.
+    return Array._new(np.where(divisor <= 0, np.nan, result).astype(m2.dtype))
+
+
+def prod(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    dtype: Optional[DType] = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    dtype = accumulation_dtype("prod", x, dtype)
+    mask = _selection("prod", x, where, nan_policy)
+    result = np.prod(
+        x._array, axis=axis, dtype=dtype._np_dtype, keepdims=keepdims, where=mask
+    )
+    return result_array("prod", result, out)
+
+
+def segment_max(
+    x: Array,
+    segment_ids: Array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    check_dtype("segment_max", x, REAL)
+    result = _segment(
+        np.maximum,
+        "segment_max",
+        x,
+        segment_ids,
+        num_segments,
+        axis,
+        x.dtype,
+        _bound(x, upper=True),
+    )
+    return result_array("segment_max", np.moveaxis(result, 0, axis), out)
+
+
+def segment_mean(
+    x: Array,
+    segment_ids: Array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    check_dtype("segment_mean", x, FLOATING)
+    args = (segment_ids, num_segments, axis, x.dtype, 0)
+    total = _segment(np.add, "segment_mean", x, *args)
+    ids = segment_ids._array
+    counts = np.bincount(ids[(ids >= 0) & (ids < num_segments)], minlength=num_segments)
+    counts = counts.reshape((-1,) + (1,) * (total.ndim - 1))
+    with _quiet():
+        result = (total / counts).astype(total.dtype, copy=False)
+    return result_array("segment_mean", np.moveaxis(result, 0, axis), out)
+
+
+def segment_min(
+    x: Array,
+    segment_ids: Array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    check_dtype("segment_min", x, REAL)
+    result = _segment(
+        np.minimum,
+        "segment_min",
+        x,
+        segment_ids,
+        num_segments,
+        axis,
+        x.dtype,
+        _bound(x, upper=False),
+    )
+    return result_array("segment_min", np.moveaxis(result, 0, axis), out)
+
+
+def segment_sum(
+    x: Array,
+    segment_ids: Array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    dtype: Optional[DType] = None,
+    indices_are_sorted: bool = False,
+    out: Optional[Array] = None,
+) -> Array:
+    dtype = accumulation_dtype("segment_sum", x, dtype)
+    args = (segment_ids, num_segments, axis, dtype, 0)
+    result = _segment(np.add, "segment_sum", x, *args)
+    return result_array("segment_sum", np.moveaxis(result, 0, axis), out)
+
+
+def softmax(x: Array, /, *, axis: int = -1, out: Optional[Array] = None) -> Array:
+    a, lse = _normalized("softmax", x, axis)
+    with _quiet():
+        result = np.where(np.isfinite(lse), np.exp(a - lse), np.nan).astype(a.dtype)
+    return result_array("softmax", result, out)
+
+
+def std(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    return _moment(np.std, "std", x, axis, correction, keepdims, nan_policy, where, out)
+
+
+def sum(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    dtype: Optional[DType] = None,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    dtype = accumulation_dtype("sum", x, dtype)
+    mask = _selection("sum", x, where, nan_policy)
+    result = np.sum(
+        x._array, axis=axis, dtype=dtype._np_dtype, keepdims=keepdims, where=mask
+    )
+    return result_array("sum", result, out)
+
+
+def var(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: NanPolicy = "propagate",
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    return _moment(np.var, "var", x, axis, correction, keepdims, nan_policy, where, out)
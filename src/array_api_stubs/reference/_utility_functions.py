@@ -0,0 +1,62 @@
+"""
+Utility functions of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from ._array_object import Array
+from ._elementwise_functions import NUMERIC, check_dtype, result_array, where_mask
+
+__all__ = ["all", "any", "diff"]
+
+Axis = Optional[Union[int, Tuple[int, ...]]]
+
+
+def all(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    mask = where_mask("all", x, where)
+    result = np.all(x._array, axis=axis, keepdims=keepdims, where=mask)
+    return result_array("all", result, out)
+
+
+def any(
+    x: Array,
+    /,
+    *,
+    axis: Axis = None,
+    keepdims: bool = False,
+    where: Optional[Array] = None,
+    out: Optional[Array] = None,
+) -> Array:
+    mask = where_mask("any", x, where)
+    result = np.any(x._array, axis=axis, keepdims=keepdims, where=mask)
+    return result_array("any", result, out)
+
+
+def diff(
+    x: Array,
+    /,
+    *,
+    axis: int = -1,
+    n: int = 1,
+    prepend: Optional[Array] = None,
+    append: Optional[Array] = None,
+) -> Array:
+    check_dtype("diff", x, NUMERIC)
+    kwargs = {}
+    for key, value in (("prepend", prepend), ("append", append)):
+        if value is not None:
+            if value.dtype != x.dtype:
+                raise TypeError(f"{key} must have the same data type as x")
+            kwargs[key] = value._array
+    return Array._new(np.diff(x._array, n=n, axis=axis, **kwargs))
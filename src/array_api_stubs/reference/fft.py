@@ -0,0 +1,194 @@
+"""
+Fast Fourier transform extension of the reference implementation.
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional, Sequence, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array, Device, check_device
+from ._dtypes import DType
+from ._elementwise_functions import (
+    COMPLEX_FLOATING,
+    FLOATING,
+    REAL_FLOATING,
+    check_dtype,
+)
+
+__all__ = [
+    "fft",
+    "ifft",
+    "fftn",
+    "ifftn",
+    "rfft",
+    "irfft",
+    "rfftn",
+    "irfftn",
+    "hfft",
+    "ihfft",
+    "fftfreq",
+    "rfftfreq",
+    "fftshift",
+    "ifftshift",
+]
+
+Norm = Literal["backward", "ortho", "forward"]
+
+
+def _transform(func, x: Array, kinds, **kwargs) -> Array:
+    check_dtype(func.__name__, x, kinds)
+    if kwargs.get("norm") not in ("backward", "ortho", "forward"):
+        raise ValueError("norm must be 'backward', 'ortho' or 'forward'")
+    out = func(x._array, **kwargs)
+    # NumPy computes in double precision, the result keeps the input precision.
+    if out.dtype.kind == "c":
+        dtype = _dtypes.COMPLEX.get(x.dtype, x.dtype)
+    else:
+        dtype = _dtypes.REAL.get(x.dtype, x.dtype)
+    return Array._new(out.astype(dtype._np_dtype, copy=False))
+
+
+def _shape_and_axes(x: Array, s: Optional[Sequence[int]], axes):
+    # ``-1`` in ``s`` selects the size of the corresponding input axis, and the
+    # last ``len(s)`` axes are transformed if only ``s`` is given.
+    if axes is None and s is not None:
+        axes = tuple(range(-len(s), 0))
+    if s is not None:
+        s = tuple(x.shape[a] if n == -1 else n for n, a in zip(s, axes))
+    return s, axes
+
+
+def fft(
+    x: Array, /, *, n: Optional[int] = None, axis: int = -1, norm: Norm = "backward"
+) -> Array:
+    return _transform(np.fft.fft, x, COMPLEX_FLOATING, n=n, axis=axis, norm=norm)
+
+
+def ifft(
+    x: Array, /, *, n: Optional[int] = None, axis: int = -1, norm: Norm = "backward"
+) -> Array:
+    return _transform(np.fft.ifft, x, COMPLEX_FLOATING, n=n, axis=axis, norm=norm)
+
+
+def fftn(
+    x: Array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Norm = "backward",
+) -> Array:
+    s, axes = _shape_and_axes(x, s, axes)
+    return _transform(np.fft.fftn, x, COMPLEX_FLOATING, s=s, axes=axes, norm=norm)
+
+
+def ifftn(
+    x: Array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Norm = "backward",
+) -> Array:
+    s, axes = _shape_and_axes(x, s, axes)
+    return _transform(np.fft.ifftn, x, COMPLEX_FLOATING, s=s, axes=axes, norm=norm)
+
+
+def rfft(
+    x: Array, /, *, n: Optional[int] = None, axis: int = -1, norm: Norm = "backward"
+) -> Array:
+    return _transform(np.fft.rfft, x, REAL_FLOATING, n=n, axis=axis, norm=norm)
+
+
+def irfft(
+    x: Array, /, *, n: Optional[int] = None, axis: int = -1, norm: Norm = "backward"
+) -> Array:
+    return _transform(np.fft.irfft, x, COMPLEX_FLOATING, n=n, axis=axis, norm=norm)
+
+
+def rfftn(
+    x: Array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Norm = "backward",
+) -> Array:
+    s, axes = _shape_and_axes(x, s, axes)
+    return _transform(np.fft.rfftn, x, REAL_FLOATING, s=s, axes=axes, norm=norm)
+
+
+def irfftn(
+    x: Array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Norm = "backward",
+) -> Array:
+    if s is not None:
+        # The size of the last transformed axis refers to the output.
+        last = axes[-1] if axes is not None else -1
+        if s[-1] == -1:
+            s = (*s[:-1], 2 * (x.shape[last] - 1))
+    s, axes = _shape_and_axes(x, s, axes)
+    return _transform(np.fft.irfftn, x, COMPLEX_FLOATING, s=s, axes=axes, norm=norm)
+
+
+def hfft(
+    x: Array, /, *, n: Optional[int] = None, axis: int = -1, norm: Norm = "backward"
+) -> Array:
+    return _transform(np.fft.hfft, x, COMPLEX_FLOATING, n=n, axis=axis, norm=norm)
+
+
+def ihfft(
+    x: Array, /, *, n: Optional[int] = None, axis: int = -1, norm: Norm = "backward"
+) -> Array:
+    return _transform(np.fft.ihfft, x, REAL_FLOATING, n=n, axis=axis, norm=norm)
+
+
+def _frequencies(
+    func, n: int, d: float, dtype: Optional[DType], device: Optional[Device]
+) -> Array:
+    check_device(device)
+    if dtype is None:
+        dtype = _dtypes.DEFAULT_DTYPES["real floating"]
+    elif not _dtypes.isdtype(dtype, REAL_FLOATING):
+        raise TypeError(f"expected a real-valued floating-point data type, got {dtype}")
+    return Array._new(func(n, d=d).astype(dtype._np_dtype))
+
+
+def fftfreq(
+    n: int,
+    /,
+    *,
+    d: float = 1.0,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+) -> Array:
+    return _frequencies(np.fft.fftfreq, n, d, dtype, device)
+
+
+def rfftfreq(
+    n: int,
+    /,
+    *,
+    d: float = 1.0,
+    dtype: Optional[DType] = None,
+    device: Optional[Device] = None,
+) -> Array:
+    return _frequencies(np.fft.rfftfreq, n, d, dtype, device)
+
+
+def fftshift(x: Array, /, *, axes: Optional[Union[int, Sequence[int]]] = None) -> Array:
+    check_dtype("fftshift", x, FLOATING)
+    return Array._new(np.fft.fftshift(x._array, axes=axes))
+
+
+def ifftshift(
+    x: Array, /, *, axes: Optional[Union[int, Sequence[int]]] = None
+) -> Array:
+    check_dtype("ifftshift", x, FLOATING)
+    return Array._new(np.fft.ifftshift(x._array, axes=axes))
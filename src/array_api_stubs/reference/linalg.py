@@ -0,0 +1,522 @@
+"""
+Linear algebra extension of the reference implementation.
+"""
+from __future__ import annotations
+
+import operator
+from typing import List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from . import _dtypes
+from ._array_object import Array
+from ._dtypes import DType
+from ._elementwise_functions import FLOATING, INTEGER, NUMERIC, check_dtype
+from ._linear_algebra_functions import matmul, matrix_transpose, tensordot, vecdot
+from ._statistical_functions import accumulation_dtype
+
+__all__ = [
+    "cho_solve",
+    "cholesky",
+    "cross",
+    "det",
+    "diagonal",
+    "eig",
+    "eigh",
+    "eigvals",
+    "eigvalsh",
+    "inv",
+    "lstsq",
+    "lu_factor",
+    "lu_solve",
+    "matmul",
+    "matrix_norm",
+    "matrix_power",
+    "matrix_rank",
+    "matrix_transpose",
+    "multi_dot",
+    "outer",
+    "pinv",
+    "qr",
+    "slogdet",
+    "solve",
+    "solve_triangular",
+    "svd",
+    "svdvals",
+    "tensordot",
+    "trace",
+    "vecdot",
+    "vector_norm",
+]
+
+Structure = Literal[
+    "general",
+    "symmetric",
+    "hermitian",
+    "positive definite",
+    "diagonal",
+    "lower triangular",
+    "upper triangular",
+]
+
+
+class EigResult(NamedTuple):
+    eigenvalues: Array
+    eigenvectors: Array
+
+
+class EighResult(NamedTuple):
+    eigenvalues: Array
+    eigenvectors: Array
+
+
+class LUFactorResult(NamedTuple):
+    LU: Array
+    pivots: Array
+
+
+class QRResult(NamedTuple):
+    Q: Array
+    R: Array
+
+
+class SlogdetResult(NamedTuple):
+    sign: Array
+    logabsdet: Array
+
+
+class SVDResult(NamedTuple):
+    U: Array
+    S: Array
+    Vh: Array
+
+
+def _matrices(name: str, x: Array, kinds=FLOATING) -> np.ndarray:
+    check_dtype(name, x, kinds)
+    if x.ndim < 2:
+        raise ValueError(f"{name}() requires an array having at least two dimensions")
+    return x._array
+
+
+def _square(name: str, x: Array) -> np.ndarray:
+    a = _matrices(name, x)
+    if a.shape[-1] != a.shape[-2]:
+        raise ValueError(f"{name}() requires square matrices, got shape {a.shape}")
+    return a
+
+
+def _real(x: Array, out: np.ndarray) -> Array:
+    # Returns ``out`` with the real-valued data type of the precision of ``x``.
+    dtype = _dtypes.REAL.get(x.dtype, x.dtype)
+    return Array._new(np.asarray(out, dtype=dtype._np_dtype))
+
+
+def _complex(x: Array, out: np.ndarray) -> Array:
+    dtype = _dtypes.COMPLEX.get(x.dtype, x.dtype)
+    return Array._new(np.asarray(out, dtype=dtype._np_dtype))
+
+
+def _swap_rows(a: np.ndarray, k: int, p: np.ndarray) -> None:
+    # Interchanges row ``k`` with row ``p`` of each matrix of a stack, in place.
+    index = np.expand_dims(p, (-1, -2))
+    row = a[..., k, :].copy()
+    a[..., k, :] = np.take_along_axis(a, index, axis=-2)[..., 0, :]
+    np.put_along_axis(a, index, row[..., None, :], axis=-2)
+
+
+def _subset(name: str, n: int, subset_by_index: Optional[Tuple[int, int]]) -> slice:
+    # Returns the slice of the ascending eigenvalues selected by ``subset_by_index``.
+    if subset_by_index is None:
+        return slice(None)
+    lo, hi = map(operator.index, subset_by_index)
+    if not 0 <= lo <= hi < n:
+        raise ValueError(
+            f"{name}() requires 0 <= lo <= hi < {n}, got subset_by_index={subset_by_index}"
+        )
+    return slice(lo, hi + 1)
+
+
+def _chain_order(shapes: Sequence[Tuple[int, int]]) -> List[List[int]]:
+    # Solves the matrix chain ordering problem, returning a table whose entry
+    # ``[i][j]`` is the index after which the product of matrices ``i`` through
+    # ``j`` is optimally split.
+    n = len(shapes)
+    dims = [shape[0] for shape in shapes] + [shapes[-1][1]]
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j], split[i][j] = min(
+                (cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k)
+                for k in range(i, j)
+            )
+    return split
+
+
+def _rank(name: str, a: np.ndarray, k: int) -> int:
+    # Validates the number of singular values to compute.
+    k = operator.index(k)
+    if not 1 <= k <= min(a.shape[-2:]):
+        raise ValueError(f"{name}() requires 1 <= k <= min(M, N), got k={k}")
+    return k
+
+
+def _structured(name: str, a: np.ndarray, assume_a: Structure) -> np.ndarray:
+    # Rebuilds each matrix of a stack from the elements which determine a matrix
+    # having the structure ``assume_a``, ignoring all other elements.
+    if assume_a == "general":
+        return a
+    if assume_a in ("symmetric", "hermitian", "positive definite"):
+        lower = np.tril(a, -1)
+        if assume_a == "symmetric" or not np.iscomplexobj(a):
+            return np.tril(a) + np.swapaxes(lower, -1, -2)
+        # The diagonal of a Hermitian matrix is real-valued.
+        diagonal = np.diagonal(a, axis1=-2, axis2=-1).real
+        upper = np.swapaxes(lower, -1, -2).conj()
+        return (
+            lower
+            + upper
+            + diagonal[..., None] * np.eye(a.shape[-1], dtype=diagonal.dtype)
+        )
+    if assume_a == "diagonal":
+        return np.diagonal(a, axis1=-2, axis2=-1)[..., None] * np.eye(
+            a.shape[-1], dtype=a.dtype
+        )
+    if assume_a == "lower triangular":
+        return np.tril(a)
+    if assume_a == "upper triangular":
+        return np.triu(a)
+    raise ValueError(f"{name}() got an unsupported assume_a {assume_a!r}")
+
+
+def _substitute(
+    a: np.ndarray, b: np.ndarray, upper: bool, unit_diagonal: bool
+) -> np.ndarray:
+    # Solves AX = B for triangular A by forward (or back) substitution, which
+    # requires O(M^2 K) operations and only reads the triangle of A (and, if not
+    # unit, its diagonal).
+    n = a.shape[-1]
+    batch = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+    x = np.broadcast_to(b, batch + b.shape[-2:]).copy()
+    for i in reversed(range(n)) if upper else range(n):
+        known = slice(i + 1, n) if upper else slice(0, i)
+        x[..., i, :] -= (a[..., i, None, known] @ x[..., known, :])[..., 0, :]
+        if not unit_diagonal:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x[..., i, :] /= a[..., i, i, None]
+    return x
+
+
+def _tolerance(rtol: Optional[Union[float, Array]]):
+    return rtol._array if isinstance(rtol, Array) else rtol
+
+
+def cho_solve(x1: Array, x2: Array, /, *, upper: bool = False) -> Array:
+    a = _square("cho_solve", x1)
+    # A = LL^H is solved as LY = B followed by L^H X = Y, and A = U^H U alike.
+    adjoint = Array._new(np.conj(np.swapaxes(a, -1, -2)))
+    lower, upper_ = (adjoint, x1) if upper else (x1, adjoint)
+    vector = x2.ndim == 1
+    b = Array._new(x2._array[:, None]) if vector else x2
+    x = solve_triangular(upper_, solve_triangular(lower, b), upper=True)
+    return Array._new(x._array[..., 0]) if vector else x
+
+
+def cholesky(x: Array, /, *, upper: bool = False) -> Array:
+    return Array._new(np.linalg.cholesky(_square("cholesky", x), upper=upper))
+
+
+def cross(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
+    check_dtype("cross", x1, NUMERIC)
+    check_dtype("cross", x2, NUMERIC)
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)._np_dtype
+    if not axis < 0:
+        raise ValueError("cross() requires a negative axis")
+    if x1.shape[axis] != 3 or x2.shape[axis] != 3:
+        raise ValueError("cross() requires vectors having three elements")
+    a, b = x1._array.astype(dtype, copy=False), x2._array.astype(dtype, copy=False)
+    return Array._new(np.cross(a, b, axis=axis))
+
+
+def det(x: Array, /, *, assume_a: Structure = "general") -> Array:
+    a = _structured("det", _square("det", x), assume_a)
+    return Array._new(np.asarray(np.linalg.det(a)))
+
+
+def diagonal(x: Array, /, *, offset: int = 0) -> Array:
+    if x.ndim < 2:
+        raise ValueError("diagonal() requires an array having at least two dimensions")
+    out = np.diagonal(x._array, offset=offset, axis1=-2, axis2=-1)
+    return Array._new(out.copy())
+
+
+def eig(x: Array, /) -> EigResult:
+    w, v = np.linalg.eig(_square("eig", x))
+    return EigResult(_complex(x, w), _complex(x, v))
+
+
+def eigh(
+    x: Array, /, *, subset_by_index: Optional[Tuple[int, int]] = None
+) -> EighResult:
+    a = _square("eigh", x)
+    w, v = np.linalg.eigh(a)
+    index = _subset("eigh", a.shape[-1], subset_by_index)
+    return EighResult(_real(x, w[..., index]), Array._new(v[..., index]))
+
+
+def eigvals(x: Array, /) -> Array:
+    return _complex(x, np.linalg.eigvals(_square("eigvals", x)))
+
+
+def eigvalsh(
+    x: Array, /, *, subset_by_index: Optional[Tuple[int, int]] = None
+) -> Array:
+    a = _square("eigvalsh", x)
+    index = _subset("eigvalsh", a.shape[-1], subset_by_index)
+    return _real(x, np.linalg.eigvalsh(a)[..., index])
+
+
+def inv(x: Array, /, *, assume_a: Structure = "general") -> Array:
+    return Array._new(np.linalg.inv(_structured("inv", _square("inv", x), assume_a)))
+
+
+def lstsq(
+    x1: Array, x2: Array, /, *, rtol: Optional[Union[float, Array]] = None
+) -> Array:
+    a = _matrices("lstsq", x1)
+    check_dtype("lstsq", x2, FLOATING)
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)._np_dtype
+    m, n = a.shape[-2:]
+    vector = x2.ndim == 1
+    b = x2._array[:, None] if vector else x2._array
+    batch = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+    k, size = b.shape[-1], int(np.prod(batch))
+    a = np.broadcast_to(a, batch + (m, n)).reshape(size, m, n).astype(dtype)
+    b = np.broadcast_to(b, batch + (m, k)).reshape(size, m, k).astype(dtype)
+    if rtol is None:
+        rtol = max(m, n) * np.finfo(dtype).eps
+    tol = np.broadcast_to(_tolerance(rtol), batch).reshape(size)
+    x = np.zeros((size, n, k), dtype=dtype)
+    full = np.zeros(size, dtype=bool)
+    if 0 < n <= m:
+        # A = QR solves the problem as RX = Q^H B, provided that R is not
+        # numerically singular (i.e., that A has full column rank).
+        q, r = np.linalg.qr(a)
+        d = np.abs(np.diagonal(r, axis1=-2, axis2=-1))
+        full = np.min(d, axis=-1) > tol * np.max(d, axis=-1)
+        y = np.conj(np.swapaxes(q[full], -1, -2)) @ b[full]
+        x[full] = _substitute(r[full], y, upper=True, unit_diagonal=False)
+    rest = ~full
+    if np.any(rest) and min(m, n) > 0:
+        # Rank-deficient (or wide) matrices fall back to an SVD, which yields the
+        # minimum-norm solution V S^+ U^H B.
+        u, s, vh = np.linalg.svd(a[rest], full_matrices=False)
+        cutoff = tol[rest, None] * np.max(s, axis=-1, keepdims=True)
+        with np.errstate(divide="ignore"):
+            s = np.where(s > cutoff, 1 / s, 0)
+        y = s[..., None] * (np.conj(np.swapaxes(u, -1, -2)) @ b[rest])
+        x[rest] = np.conj(np.swapaxes(vh, -1, -2)) @ y
+    x = x.reshape(batch + (n, k))
+    return Array._new(x[..., 0] if vector else x)
+
+
+def lu_factor(x: Array, /) -> LUFactorResult:
+    a = _square("lu_factor", x).copy()
+    n = a.shape[-1]
+    pivots = np.zeros(a.shape[:-1], dtype=_dtypes.DEFAULT_DTYPES["indexing"]._np_dtype)
+    # Right-looking Gaussian elimination with partial pivoting, as in ``getrf``.
+    for k in range(n):
+        p = k + np.argmax(np.abs(a[..., k:, k]), axis=-1)
+        pivots[..., k] = p
+        _swap_rows(a, k, p)
+        pivot = a[..., k, k, None]
+        column = a[..., k + 1 :, k]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # A zero pivot leaves an already zero column of L unchanged.
+            a[..., k + 1 :, k] = np.where(pivot == 0, column, column / pivot)
+        a[..., k + 1 :, k + 1 :] -= a[..., k + 1 :, k, None] * a[..., k, None, k + 1 :]
+    return LUFactorResult(Array._new(a), Array._new(pivots))
+
+
+def lu_solve(factors: Tuple[Array, Array], x2: Array, /) -> Array:
+    lu, pivots = factors
+    a = _square("lu_solve", lu)
+    check_dtype("lu_solve", pivots, INTEGER)
+    check_dtype("lu_solve", x2, FLOATING)
+    if pivots.shape != a.shape[:-1]:
+        raise ValueError("lu_solve() requires pivots having shape shape(LU)[:-1]")
+    dtype = _dtypes.result_type(lu.dtype, x2.dtype)._np_dtype
+    vector = x2.ndim == 1
+    b = x2._array[:, None] if vector else x2._array
+    batch = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+    b = np.broadcast_to(b, batch + b.shape[-2:]).astype(dtype)
+    p = np.broadcast_to(pivots._array, batch + pivots.shape[-1:])
+    # Applies the row interchanges, which yields P^T B.
+    for k in range(a.shape[-1]):
+        _swap_rows(b, k, p[..., k])
+    y = solve_triangular(lu, Array._new(b), unit_diagonal=True)
+    x = solve_triangular(lu, y, upper=True)
+    return Array._new(x._array[..., 0]) if vector else x
+
+
+def matrix_norm(
+    x: Array,
+    /,
+    *,
+    keepdims: bool = False,
+    ord: Optional[Union[int, float, Literal["fro", "nuc"]]] = "fro",
+) -> Array:
+    a = _matrices("matrix_norm", x)
+    return _real(x, np.linalg.matrix_norm(a, keepdims=keepdims, ord=ord))
+
+
+def matrix_power(x: Array, n: int, /) -> Array:
+    return Array._new(np.linalg.matrix_power(_square("matrix_power", x), n))
+
+
+def matrix_rank(x: Array, /, *, rtol: Optional[Union[float, Array]] = None) -> Array:
+    a = _matrices("matrix_rank", x)
+    out = np.linalg.matrix_rank(a, rtol=_tolerance(rtol))
+    index = _dtypes.DEFAULT_DTYPES["indexing"]._np_dtype
+    return Array._new(np.asarray(out, dtype=index))
+
+
+def multi_dot(arrays: Sequence[Array], /) -> Array:
+    arrays = list(arrays)
+    if len(arrays) < 2:
+        raise ValueError("multi_dot() requires at least two arrays")
+    for i, x in enumerate(arrays):
+        check_dtype("multi_dot", x, NUMERIC)
+        if x.ndim != 2 and not (x.ndim == 1 and i in (0, len(arrays) - 1)):
+            raise ValueError(
+                "multi_dot() requires two-dimensional arrays, except for a "
+                "one-dimensional first or last array"
+            )
+    dtype = _dtypes.result_type(*[x.dtype for x in arrays])._np_dtype
+    a = [x._array.astype(dtype, copy=False) for x in arrays]
+    first, last = a[0].ndim == 1, a[-1].ndim == 1
+    if first:
+        a[0] = a[0][None, :]
+    if last:
+        a[-1] = a[-1][:, None]
+    for x1, x2 in zip(a, a[1:]):
+        if x1.shape[1] != x2.shape[0]:
+            raise ValueError(
+                f"multi_dot() got incompatible shapes {x1.shape} and {x2.shape}"
+            )
+    split = _chain_order([x.shape for x in a])
+
+    def product(i: int, j: int) -> np.ndarray:
+        if i == j:
+            return a[i]
+        k = split[i][j]
+        return np.matmul(product(i, k), product(k + 1, j))
+
+    out = product(0, len(a) - 1)
+    if last:
+        out = out[..., 0]
+    if first:
+        out = out[0]
+    return Array._new(np.asarray(out))
+
+
+def outer(x1: Array, x2: Array, /) -> Array:
+    check_dtype("outer", x1, NUMERIC)
+    check_dtype("outer", x2, NUMERIC)
+    if x1.ndim != 1 or x2.ndim != 1:
+        raise ValueError("outer() requires one-dimensional arrays")
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)._np_dtype
+    return Array._new(np.outer(x1._array, x2._array).astype(dtype, copy=False))
+
+
+def pinv(x: Array, /, *, rtol: Optional[Union[float, Array]] = None) -> Array:
+    a = _matrices("pinv", x)
+    return Array._new(np.linalg.pinv(a, rtol=_tolerance(rtol)))
+
+
+def qr(x: Array, /, *, mode: Literal["reduced", "complete"] = "reduced") -> QRResult:
+    if mode not in ("reduced", "complete"):
+        raise ValueError(f"mode must be 'reduced' or 'complete', got {mode!r}")
+    q, r = np.linalg.qr(_matrices("qr", x), mode=mode)
+    return QRResult(Array._new(q), Array._new(r))
+
+
+def slogdet(x: Array, /, *, assume_a: Structure = "general") -> SlogdetResult:
+    a = _structured("slogdet", _square("slogdet", x), assume_a)
+    sign, logabsdet = np.linalg.slogdet(a)
+    return SlogdetResult(Array._new(np.asarray(sign)), _real(x, logabsdet))
+
+
+def solve(x1: Array, x2: Array, /, *, assume_a: Structure = "general") -> Array:
+    a = _structured("solve", _square("solve", x1), assume_a)
+    check_dtype("solve", x2, FLOATING)
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)._np_dtype
+    b = x2._array.astype(dtype, copy=False)
+    return Array._new(np.linalg.solve(a.astype(dtype, copy=False), b))
+
+
+def solve_triangular(
+    x1: Array,
+    x2: Array,
+    /,
+    *,
+    upper: bool = False,
+    left: bool = True,
+    unit_diagonal: bool = False,
+) -> Array:
+    a = _square("solve_triangular", x1)
+    check_dtype("solve_triangular", x2, FLOATING)
+    dtype = _dtypes.result_type(x1.dtype, x2.dtype)._np_dtype
+    a = a.astype(dtype, copy=False)
+    b = x2._array.astype(dtype, copy=False)
+    if not left:
+        # XA = B is equivalent to A^T X^T = B^T, where A^T has the other triangle.
+        a, upper = np.swapaxes(a, -1, -2), not upper
+        b = np.swapaxes(b, -1, -2) if b.ndim > 1 else b
+    vector = b.ndim == 1
+    x = _substitute(a, b[:, None] if vector else b, upper, unit_diagonal)
+    if vector:
+        return Array._new(x[..., 0])
+    return Array._new(x if left else np.swapaxes(x, -1, -2))
+
+
+def svd(
+    x: Array, /, *, full_matrices: bool = True, k: Optional[int] = None
+) -> SVDResult:
+    a = _matrices("svd", x)
+    if k is None:
+        u, s, vh = np.linalg.svd(a, full_matrices=full_matrices)
+        return SVDResult(Array._new(u), _real(x, s), Array._new(vh))
+    k = _rank("svd", a, k)
+    u, s, vh = np.linalg.svd(a, full_matrices=False)
+    return SVDResult(
+        Array._new(u[..., :k]), _real(x, s[..., :k]), Array._new(vh[..., :k, :])
+    )
+
+
+def svdvals(x: Array, /, *, k: Optional[int] = None) -> Array:
+    a = _matrices("svdvals", x)
+    s = np.linalg.svdvals(a)
+    return _real(x, s if k is None else s[..., : _rank("svdvals", a, k)])
+
+
+def trace(x: Array, /, *, offset: int = 0, dtype: Optional[DType] = None) -> Array:
+    dtype = accumulation_dtype("trace", x, dtype)
+    if x.ndim < 2:
+        raise ValueError("trace() requires an array having at least two dimensions")
+    out = np.trace(x._array, offset=offset, axis1=-2, axis2=-1, dtype=dtype._np_dtype)
+    return Array._new(np.asarray(out))
+
+
+def vector_norm(
+    x: Array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    ord: Union[int, float] = 2,
+) -> Array:
+    check_dtype("vector_norm", x, FLOATING)
+    out = np.linalg.vector_norm(x._array, axis=axis, keepdims=keepdims, ord=ord)
+    return _real(x, out)
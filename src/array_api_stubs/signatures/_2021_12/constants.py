@@ -0,0 +1,12 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2021_12/constants.py. Do not edit.
+e = 2.718281828459045
+
+inf = float("inf")
+
+nan = float("nan")
+
+newaxis = None
+
+pi = 3.141592653589793
+
+__all__ = ["e", "inf", "nan", "newaxis", "pi"]
@@ -0,0 +1,41 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2021_12/data_type_functions.py. Do not edit.
+from ._types import List, Tuple, Union, array, dtype, finfo_object, iinfo_object
+
+
+def astype(x: array, dtype: dtype, /, *, copy: bool = True) -> array:
+    ...
+
+
+def broadcast_arrays(*arrays: array) -> List[array]:
+    ...
+
+
+def broadcast_to(x: array, /, shape: Tuple[int, ...]) -> array:
+    ...
+
+
+def can_cast(from_: Union[dtype, array], to: dtype, /) -> bool:
+    ...
+
+
+def finfo(type: Union[dtype, array], /) -> finfo_object:
+    ...
+
+
+def iinfo(type: Union[dtype, array], /) -> iinfo_object:
+    ...
+
+
+def result_type(*arrays_and_dtypes: Union[array, dtype]) -> dtype:
+    ...
+
+
+__all__ = [
+    "astype",
+    "broadcast_arrays",
+    "broadcast_to",
+    "can_cast",
+    "finfo",
+    "iinfo",
+    "result_type",
+]
@@ -0,0 +1,79 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2021_12/statistical_functions.py. Do not edit.
+from ._types import Optional, Tuple, Union, array, dtype
+
+
+def max(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def mean(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def min(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def prod(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    dtype: Optional[dtype] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def std(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def sum(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    dtype: Optional[dtype] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def var(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+__all__ = ["max", "mean", "min", "prod", "std", "sum", "var"]
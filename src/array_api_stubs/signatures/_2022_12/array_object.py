@@ -0,0 +1,179 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2022_12/array_object.py. Do not edit.
+from __future__ import annotations
+
+from ._types import (
+    array,
+    dtype as Dtype,
+    device as Device,
+    Optional,
+    Tuple,
+    Union,
+    Any,
+    PyCapsule,
+    Enum,
+    ellipsis,
+)
+
+
+class _array:
+    def __init__(self: array) -> None:
+        ...
+
+    @property
+    def dtype(self: array) -> Dtype:
+        ...
+
+    @property
+    def device(self: array) -> Device:
+        ...
+
+    @property
+    def mT(self: array) -> array:
+        ...
+
+    @property
+    def ndim(self: array) -> int:
+        ...
+
+    @property
+    def shape(self: array) -> Tuple[Optional[int], ...]:
+        ...
+
+    @property
+    def size(self: array) -> Optional[int]:
+        ...
+
+    @property
+    def T(self: array) -> array:
+        ...
+
+    def __abs__(self: array, /) -> array:
+        ...
+
+    def __add__(self: array, other: Union[int, float, complex, array], /) -> array:
+        ...
+
+    def __and__(self: array, other: Union[int, bool, array], /) -> array:
+        ...
+
+    def __array_namespace__(
+        self: array, /, *, api_version: Optional[str] = None
+    ) -> Any:
+        ...
+
+    def __bool__(self: array, /) -> bool:
+        ...
+
+    def __complex__(self: array, /) -> complex:
+        ...
+
+    def __dlpack__(
+        self: array, /, *, stream: Optional[Union[int, Any]] = None
+    ) -> PyCapsule:
+        ...
+
+    def __dlpack_device__(self: array, /) -> Tuple[Enum, int]:
+        ...
+
+    def __eq__(self: array, other: Union[int, float, complex, bool, array], /) -> array:
+        ...
+
+    def __float__(self: array, /) -> float:
+        ...
+
+    def __floordiv__(self: array, other: Union[int, float, array], /) -> array:
+        ...
+
+    def __ge__(self: array, other: Union[int, float, array], /) -> array:
+        ...
+
+    def __getitem__(
+        self: array,
+        key: Union[
+            int,
+            slice,
+            ellipsis,
+            None,
+            Tuple[Union[int, slice, ellipsis, None], ...],
+            array,
+        ],
+        /,
+    ) -> array:
+        ...
+
+    def __gt__(self: array, other: Union[int, float, array], /) -> array:
+        ...
+
+    def __index__(self: array, /) -> int:
+        ...
+
+    def __int__(self: array, /) -> int:
+        ...
+
+    def __invert__(self: array, /) -> array:
+        ...
+
+    def __le__(self: array, other: Union[int, float, array], /) -> array:
+        ...
+
+    def __lshift__(self: array, other: Union[int, array], /) -> array:
+        ...
+
+    def __lt__(self: array, other: Union[int, float, array], /) -> array:
+        ...
+
+    def __matmul__(self: array, other: array, /) -> array:
+        ...
+
+    def __mod__(self: array, other: Union[int, float, array], /) -> array:
+        ...
+
+    def __mul__(self: array, other: Union[int, float, complex, array], /) -> array:
+        ...
+
+    def __ne__(self: array, other: Union[int, float, complex, bool, array], /) -> array:
+        ...
+
+    def __neg__(self: array, /) -> array:
+        ...
+
+    def __or__(self: array, other: Union[int, bool, array], /) -> array:
+        ...
+
+    def __pos__(self: array, /) -> array:
+        ...
+
+    def __pow__(self: array, other: Union[int, float, complex, array], /) -> array:
+        ...
+
+    def __rshift__(self: array, other: Union[int, array], /) -> array:
+        ...
+
+    def __setitem__(
+        self: array,
+        key: Union[
+            int, slice, ellipsis, Tuple[Union[int, slice, ellipsis], ...], array
+        ],
+        value: Union[int, float, complex, bool, array],
+        /,
+    ) -> None:
+        ...
+
+    def __sub__(self: array, other: Union[int, float, complex, array], /) -> array:
+        ...
+
+    def __truediv__(self: array, other: Union[int, float, complex, array], /) -> array:
+        ...
+
+    def __xor__(self: array, other: Union[int, bool, array], /) -> array:
+        ...
+
+    def to_device(
+        self: array, device: Device, /, *, stream: Optional[Union[int, Any]] = None
+    ) -> array:
+        ...
+
+
+array = _array
+
+__all__ = ["array"]
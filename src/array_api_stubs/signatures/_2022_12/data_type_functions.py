@@ -0,0 +1,31 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2022_12/data_type_functions.py. Do not edit.
+from ._types import Union, Tuple, array, dtype, finfo_object, iinfo_object
+
+
+def astype(x: array, dtype: dtype, /, *, copy: bool = True) -> array:
+    ...
+
+
+def can_cast(from_: Union[dtype, array], to: dtype, /) -> bool:
+    ...
+
+
+def finfo(type: Union[dtype, array], /) -> finfo_object:
+    ...
+
+
+def iinfo(type: Union[dtype, array], /) -> iinfo_object:
+    ...
+
+
+def isdtype(
+    dtype: dtype, kind: Union[dtype, str, Tuple[Union[dtype, str], ...]]
+) -> bool:
+    ...
+
+
+def result_type(*arrays_and_dtypes: Union[array, dtype]) -> dtype:
+    ...
+
+
+__all__ = ["astype", "can_cast", "finfo", "iinfo", "isdtype", "result_type"]
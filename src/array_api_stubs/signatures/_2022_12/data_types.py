@@ -0,0 +1,9 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2022_12/data_types.py. Do not edit.
+from ._types import dtype
+
+
+def __eq__(self: dtype, other: dtype, /) -> bool:
+    ...
+
+
+__all__ = ["__eq__"]
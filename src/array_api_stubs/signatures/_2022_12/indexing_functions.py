@@ -0,0 +1,9 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2022_12/indexing_functions.py. Do not edit.
+from ._types import Union, Optional, array
+
+
+def take(x: array, indices: array, /, *, axis: Optional[int] = None) -> array:
+    ...
+
+
+__all__ = ["take"]
@@ -0,0 +1,66 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2022_12/manipulation_functions.py. Do not edit.
+from ._types import List, Optional, Tuple, Union, array
+
+
+def broadcast_arrays(*arrays: array) -> List[array]:
+    ...
+
+
+def broadcast_to(x: array, /, shape: Tuple[int, ...]) -> array:
+    ...
+
+
+def concat(
+    arrays: Union[Tuple[array, ...], List[array]], /, *, axis: Optional[int] = 0
+) -> array:
+    ...
+
+
+def expand_dims(x: array, /, axis: int) -> array:
+    ...
+
+
+def flip(x: array, /, *, axis: Optional[Union[int, Tuple[int, ...]]] = None) -> array:
+    ...
+
+
+def permute_dims(x: array, /, axes: Tuple[int, ...]) -> array:
+    ...
+
+
+def reshape(
+    x: array, /, shape: Tuple[int, ...], *, copy: Optional[bool] = None
+) -> array:
+    ...
+
+
+def roll(
+    x: array,
+    /,
+    shift: Union[int, Tuple[int, ...]],
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+) -> array:
+    ...
+
+
+def squeeze(x: array, /, axis: Union[int, Tuple[int, ...]]) -> array:
+    ...
+
+
+def stack(arrays: Union[Tuple[array, ...], List[array]], /, *, axis: int = 0) -> array:
+    ...
+
+
+__all__ = [
+    "broadcast_arrays",
+    "broadcast_to",
+    "concat",
+    "expand_dims",
+    "flip",
+    "permute_dims",
+    "reshape",
+    "roll",
+    "squeeze",
+    "stack",
+]
@@ -0,0 +1,21 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2022_12/searching_functions.py. Do not edit.
+from ._types import Optional, Tuple, array
+
+
+def argmax(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+    ...
+
+
+def argmin(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+    ...
+
+
+def nonzero(x: array, /) -> Tuple[array, ...]:
+    ...
+
+
+def where(condition: array, x1: array, x2: array, /) -> array:
+    ...
+
+
+__all__ = ["argmax", "argmin", "nonzero", "where"]
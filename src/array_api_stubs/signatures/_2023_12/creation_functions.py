@@ -0,0 +1,171 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/creation_functions.py. Do not edit.
+__all__ = [
+    "arange",
+    "asarray",
+    "empty",
+    "empty_like",
+    "eye",
+    "from_dlpack",
+    "full",
+    "full_like",
+    "linspace",
+    "meshgrid",
+    "ones",
+    "ones_like",
+    "tril",
+    "triu",
+    "zeros",
+    "zeros_like",
+]
+
+
+from ._types import (
+    List,
+    Literal,
+    NestedSequence,
+    Optional,
+    SupportsBufferProtocol,
+    Tuple,
+    Union,
+    array,
+    device,
+    dtype,
+)
+
+
+def arange(
+    start: Union[int, float],
+    /,
+    stop: Optional[Union[int, float]] = None,
+    step: Union[int, float] = 1,
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def asarray(
+    obj: Union[
+        array, bool, int, float, complex, NestedSequence, SupportsBufferProtocol
+    ],
+    /,
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+    copy: Optional[bool] = None,
+) -> array:
+    ...
+
+
+def empty(
+    shape: Union[int, Tuple[int, ...]],
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def empty_like(
+    x: array, /, *, dtype: Optional[dtype] = None, device: Optional[device] = None
+) -> array:
+    ...
+
+
+def eye(
+    n_rows: int,
+    n_cols: Optional[int] = None,
+    /,
+    *,
+    k: int = 0,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def from_dlpack(
+    x: object,
+    /,
+    *,
+    device: Optional[device] = None,
+    copy: Optional[bool] = None,
+) -> array:
+    ...
+
+
+def full(
+    shape: Union[int, Tuple[int, ...]],
+    fill_value: Union[bool, int, float, complex],
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def full_like(
+    x: array,
+    /,
+    fill_value: Union[bool, int, float, complex],
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def linspace(
+    start: Union[int, float, complex],
+    stop: Union[int, float, complex],
+    /,
+    num: int,
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+    endpoint: bool = True,
+) -> array:
+    ...
+
+
+def meshgrid(*arrays: array, indexing: Literal["xy", "ij"] = "xy") -> List[array]:
+    ...
+
+
+def ones(
+    shape: Union[int, Tuple[int, ...]],
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def ones_like(
+    x: array, /, *, dtype: Optional[dtype] = None, device: Optional[device] = None
+) -> array:
+    ...
+
+
+def tril(x: array, /, *, k: int = 0) -> array:
+    ...
+
+
+def triu(x: array, /, *, k: int = 0) -> array:
+    ...
+
+
+def zeros(
+    shape: Union[int, Tuple[int, ...]],
+    *,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def zeros_like(
+    x: array, /, *, dtype: Optional[dtype] = None, device: Optional[device] = None
+) -> array:
+    ...
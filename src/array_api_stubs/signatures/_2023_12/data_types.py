@@ -0,0 +1,9 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/data_types.py. Do not edit.
+__all__ = ["__eq__"]
+
+
+from ._types import dtype
+
+
+def __eq__(self: dtype, other: dtype, /) -> bool:
+    ...
@@ -0,0 +1,336 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/elementwise_functions.py. Do not edit.
+__all__ = [
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "asin",
+    "asinh",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_left_shift",
+    "bitwise_invert",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "clip",
+    "conj",
+    "copysign",
+    "cos",
+    "cosh",
+    "divide",
+    "equal",
+    "exp",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "greater",
+    "greater_equal",
+    "hypot",
+    "imag",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "less",
+    "less_equal",
+    "log",
+    "log1p",
+    "log2",
+    "log10",
+    "logaddexp",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "multiply",
+    "negative",
+    "not_equal",
+    "positive",
+    "pow",
+    "real",
+    "remainder",
+    "round",
+    "sign",
+    "signbit",
+    "sin",
+    "sinh",
+    "square",
+    "sqrt",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+]
+
+
+from ._types import Optional, Union, array
+
+
+def abs(x: array, /) -> array:
+    ...
+
+
+def acos(x: array, /) -> array:
+    ...
+
+
+def acosh(x: array, /) -> array:
+    ...
+
+
+def add(x1: array, x2: array, /) -> array:
+    ...
+
+
+def asin(x: array, /) -> array:
+    ...
+
+
+def asinh(x: array, /) -> array:
+    ...
+
+
+def atan(x: array, /) -> array:
+    ...
+
+
+def atan2(x1: array, x2: array, /) -> array:
+    ...
+
+
+def atanh(x: array, /) -> array:
+    ...
+
+
+def bitwise_and(x1: array, x2: array, /) -> array:
+    ...
+
+
+def bitwise_left_shift(x1: array, x2: array, /) -> array:
+    ...
+
+
+def bitwise_invert(x: array, /) -> array:
+    ...
+
+
+def bitwise_or(x1: array, x2: array, /) -> array:
+    ...
+
+
+def bitwise_right_shift(x1: array, x2: array, /) -> array:
+    ...
+
+
+def bitwise_xor(x1: array, x2: array, /) -> array:
+    ...
+
+
+def ceil(x: array, /) -> array:
+    ...
+
+
+def clip(
+    x: array,
+    /,
+    min: Optional[Union[int, float, array]] = None,
+    max: Optional[Union[int, float, array]] = None,
+) -> array:
+    ...
+
+
+def conj(x: array, /) -> array:
+    ...
+
+
+def copysign(x1: array, x2: array, /) -> array:
+    ...
+
+
+def cos(x: array, /) -> array:
+    ...
+
+
+def cosh(x: array, /) -> array:
+    ...
+
+
+def divide(x1: array, x2: array, /) -> array:
+    ...
+
+
+def equal(x1: array, x2: array, /) -> array:
+    ...
+
+
+def exp(x: array, /) -> array:
+    ...
+
+
+def expm1(x: array, /) -> array:
+    ...
+
+
+def floor(x: array, /) -> array:
+    ...
+
+
+def floor_divide(x1: array, x2: array, /) -> array:
+    ...
+
+
+def greater(x1: array, x2: array, /) -> array:
+    ...
+
+
+def greater_equal(x1: array, x2: array, /) -> array:
+    ...
+
+
+def hypot(x1: array, x2: array, /) -> array:
+    ...
+
+
+def imag(x: array, /) -> array:
+    ...
+
+
+def isfinite(x: array, /) -> array:
+    ...
+
+
+def isinf(x: array, /) -> array:
+    ...
+
+
+def isnan(x: array, /) -> array:
+    ...
+
+
+def less(x1: array, x2: array, /) -> array:
+    ...
+
+
+def less_equal(x1: array, x2: array, /) -> array:
+    ...
+
+
+def log(x: array, /) -> array:
+    ...
+
+
+def log1p(x: array, /) -> array:
+    ...
+
+
+def log2(x: array, /) -> array:
+    ...
+
+
+def log10(x: array, /) -> array:
+    ...
+
+
+def logaddexp(x1: array, x2: array, /) -> array:
+    ...
+
+
+def logical_and(x1: array, x2: array, /) -> array:
+    ...
+
+
+def logical_not(x: array, /) -> array:
+    ...
+
+
+def logical_or(x1: array, x2: array, /) -> array:
+    ...
+
+
+def logical_xor(x1: array, x2: array, /) -> array:
+    ...
+
+
+def maximum(x1: array, x2: array, /) -> array:
+    ...
+
+
+def minimum(x1: array, x2: array, /) -> array:
+    ...
+
+
+def multiply(x1: array, x2: array, /) -> array:
+    ...
+
+
+def negative(x: array, /) -> array:
+    ...
+
+
+def not_equal(x1: array, x2: array, /) -> array:
+    ...
+
+
+def positive(x: array, /) -> array:
+    ...
+
+
+def pow(x1: array, x2: array, /) -> array:
+    ...
+
+
+def real(x: array, /) -> array:
+    ...
+
+
+def remainder(x1: array, x2: array, /) -> array:
+    ...
+
+
+def round(x: array, /) -> array:
+    ...
+
+
+def sign(x: array, /) -> array:
+    ...
+
+
+def signbit(x: array, /) -> array:
+    ...
+
+
+def sin(x: array, /) -> array:
+    ...
+
+
+def sinh(x: array, /) -> array:
+    ...
+
+
+def square(x: array, /) -> array:
+    ...
+
+
+def sqrt(x: array, /) -> array:
+    ...
+
+
+def subtract(x1: array, x2: array, /) -> array:
+    ...
+
+
+def tan(x: array, /) -> array:
+    ...
+
+
+def tanh(x: array, /) -> array:
+    ...
+
+
+def trunc(x: array, /) -> array:
+    ...
@@ -0,0 +1,8 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/indexing_functions.py. Do not edit.
+__all__ = ["take"]
+
+from ._types import Union, Optional, array
+
+
+def take(x: array, indices: array, /, *, axis: Optional[int] = None) -> array:
+    ...
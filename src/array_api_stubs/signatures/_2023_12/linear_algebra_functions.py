@@ -0,0 +1,27 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/linear_algebra_functions.py. Do not edit.
+__all__ = ["matmul", "matrix_transpose", "tensordot", "vecdot"]
+
+
+from ._types import Tuple, Union, Sequence, array
+
+
+def matmul(x1: array, x2: array, /) -> array:
+    ...
+
+
+def matrix_transpose(x: array, /) -> array:
+    ...
+
+
+def tensordot(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    axes: Union[int, Tuple[Sequence[int], Sequence[int]]] = 2,
+) -> array:
+    ...
+
+
+def vecdot(x1: array, x2: array, /, *, axis: int = -1) -> array:
+    ...
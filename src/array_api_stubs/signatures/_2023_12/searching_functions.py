@@ -0,0 +1,32 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/searching_functions.py. Do not edit.
+__all__ = ["argmax", "argmin", "nonzero", "searchsorted", "where"]
+
+
+from ._types import Optional, Tuple, Literal, array
+
+
+def argmax(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+    ...
+
+
+def argmin(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+    ...
+
+
+def nonzero(x: array, /) -> Tuple[array, ...]:
+    ...
+
+
+def searchsorted(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    side: Literal["left", "right"] = "left",
+    sorter: Optional[array] = None,
+) -> array:
+    ...
+
+
+def where(condition: array, x1: array, x2: array, /) -> array:
+    ...
@@ -0,0 +1,25 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2023_12/utility_functions.py. Do not edit.
+__all__ = ["all", "any"]
+
+
+from ._types import Optional, Tuple, Union, array
+
+
+def all(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def any(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
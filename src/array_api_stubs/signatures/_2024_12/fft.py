@@ -0,0 +1,161 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2024_12/fft.py. Do not edit.
+__all__ = [
+    "fft",
+    "ifft",
+    "fftn",
+    "ifftn",
+    "rfft",
+    "irfft",
+    "rfftn",
+    "irfftn",
+    "hfft",
+    "ihfft",
+    "fftfreq",
+    "rfftfreq",
+    "fftshift",
+    "ifftshift",
+]
+
+from ._types import Tuple, Union, Sequence, array, Optional, Literal, dtype, device
+
+
+def fft(
+    x: array,
+    /,
+    *,
+    n: Optional[int] = None,
+    axis: int = -1,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def ifft(
+    x: array,
+    /,
+    *,
+    n: Optional[int] = None,
+    axis: int = -1,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def fftn(
+    x: array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def ifftn(
+    x: array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def rfft(
+    x: array,
+    /,
+    *,
+    n: Optional[int] = None,
+    axis: int = -1,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def irfft(
+    x: array,
+    /,
+    *,
+    n: Optional[int] = None,
+    axis: int = -1,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def rfftn(
+    x: array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def irfftn(
+    x: array,
+    /,
+    *,
+    s: Optional[Sequence[int]] = None,
+    axes: Optional[Sequence[int]] = None,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def hfft(
+    x: array,
+    /,
+    *,
+    n: Optional[int] = None,
+    axis: int = -1,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def ihfft(
+    x: array,
+    /,
+    *,
+    n: Optional[int] = None,
+    axis: int = -1,
+    norm: Literal["backward", "ortho", "forward"] = "backward",
+) -> array:
+    ...
+
+
+def fftfreq(
+    n: int,
+    /,
+    *,
+    d: float = 1.0,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def rfftfreq(
+    n: int,
+    /,
+    *,
+    d: float = 1.0,
+    dtype: Optional[dtype] = None,
+    device: Optional[device] = None,
+) -> array:
+    ...
+
+
+def fftshift(x: array, /, *, axes: Optional[Union[int, Sequence[int]]] = None) -> array:
+    ...
+
+
+def ifftshift(
+    x: array, /, *, axes: Optional[Union[int, Sequence[int]]] = None
+) -> array:
+    ...
@@ -0,0 +1,53 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2024_12/info.py. Do not edit.
+__all__ = [
+    "__array_namespace_info__",
+    "capabilities",
+    "default_device",
+    "default_dtypes",
+    "devices",
+    "dtypes",
+]
+
+from ._types import (
+    Optional,
+    Union,
+    Tuple,
+    List,
+    device,
+    dtype,
+    DefaultDataTypes,
+    DataTypes,
+    Capabilities,
+    Info,
+)
+
+
+def __array_namespace_info__() -> Info:
+    ...
+
+
+def capabilities() -> Capabilities:
+    ...
+
+
+def default_device() -> device:
+    ...
+
+
+def default_dtypes(
+    *,
+    device: Optional[device] = None,
+) -> DefaultDataTypes:
+    ...
+
+
+def dtypes(
+    *,
+    device: Optional[device] = None,
+    kind: Optional[Union[str, Tuple[str, ...]]] = None,
+) -> DataTypes:
+    ...
+
+
+def devices() -> List[device]:
+    ...
@@ -0,0 +1,21 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2024_12/set_functions.py. Do not edit.
+__all__ = ["unique_all", "unique_counts", "unique_inverse", "unique_values"]
+
+
+from ._types import Tuple, array
+
+
+def unique_all(x: array, /) -> Tuple[array, array, array, array]:
+    ...
+
+
+def unique_counts(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def unique_inverse(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def unique_values(x: array, /) -> array:
+    ...
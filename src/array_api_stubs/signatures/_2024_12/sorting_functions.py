@@ -0,0 +1,17 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2024_12/sorting_functions.py. Do not edit.
+__all__ = ["argsort", "sort"]
+
+
+from ._types import array
+
+
+def argsort(
+    x: array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
+) -> array:
+    ...
+
+
+def sort(
+    x: array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
+) -> array:
+    ...
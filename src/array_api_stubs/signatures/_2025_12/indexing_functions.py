@@ -0,0 +1,12 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2025_12/indexing_functions.py. Do not edit.
+__all__ = ["take", "take_along_axis"]
+
+from ._types import Union, Optional, array
+
+
+def take(x: array, indices: array, /, *, axis: Optional[int] = None) -> array:
+    ...
+
+
+def take_along_axis(x: array, indices: array, /, *, axis: int = -1) -> array:
+    ...
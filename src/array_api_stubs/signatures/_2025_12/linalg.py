@@ -0,0 +1,153 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2025_12/linalg.py. Do not edit.
+__all__ = [
+    "cholesky",
+    "cross",
+    "det",
+    "diagonal",
+    "eig",
+    "eigh",
+    "eigvals",
+    "eigvalsh",
+    "inv",
+    "matmul",
+    "matrix_norm",
+    "matrix_power",
+    "matrix_rank",
+    "matrix_transpose",
+    "outer",
+    "pinv",
+    "qr",
+    "slogdet",
+    "solve",
+    "svd",
+    "svdvals",
+    "tensordot",
+    "trace",
+    "vecdot",
+    "vector_norm",
+]
+
+
+from ._types import Literal, Optional, Tuple, Union, Sequence, array, dtype
+from .constants import inf
+
+
+def cholesky(x: array, /, *, upper: bool = False) -> array:
+    ...
+
+
+def cross(x1: array, x2: array, /, *, axis: int = -1) -> array:
+    ...
+
+
+def det(x: array, /) -> array:
+    ...
+
+
+def diagonal(x: array, /, *, offset: int = 0) -> array:
+    ...
+
+
+def eig(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def eigh(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def eigvalsh(x: array, /) -> array:
+    ...
+
+
+def eigvals(x: array, /) -> array:
+    ...
+
+
+def inv(x: array, /) -> array:
+    ...
+
+
+def matmul(x1: array, x2: array, /) -> array:
+    ...
+
+
+def matrix_norm(
+    x: array,
+    /,
+    *,
+    keepdims: bool = False,
+    ord: Optional[Union[int, float, Literal[inf, -inf, "fro", "nuc"]]] = "fro",
+) -> array:
+    ...
+
+
+def matrix_power(x: array, n: int, /) -> array:
+    ...
+
+
+def matrix_rank(x: array, /, *, rtol: Optional[Union[float, array]] = None) -> array:
+    ...
+
+
+def matrix_transpose(x: array, /) -> array:
+    ...
+
+
+def outer(x1: array, x2: array, /) -> array:
+    ...
+
+
+def pinv(x: array, /, *, rtol: Optional[Union[float, array]] = None) -> array:
+    ...
+
+
+def qr(
+    x: array, /, *, mode: Literal["reduced", "complete"] = "reduced"
+) -> Tuple[array, array]:
+    ...
+
+
+def slogdet(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def solve(x1: array, x2: array, /) -> array:
+    ...
+
+
+def svd(x: array, /, *, full_matrices: bool = True) -> Tuple[array, array, array]:
+    ...
+
+
+def svdvals(x: array, /) -> array:
+    ...
+
+
+def tensordot(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    axes: Union[int, Tuple[Sequence[int], Sequence[int]]] = 2,
+) -> array:
+    ...
+
+
+def trace(x: array, /, *, offset: int = 0, dtype: Optional[dtype] = None) -> array:
+    ...
+
+
+def vecdot(x1: array, x2: array, /, *, axis: int = -1) -> array:
+    ...
+
+
+def vector_norm(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    ord: Union[int, float, Literal[inf, -inf]] = 2,
+) -> array:
+    ...
@@ -0,0 +1,47 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2025_12/searching_functions.py. Do not edit.
+__all__ = ["argmax", "argmin", "count_nonzero", "nonzero", "searchsorted", "where"]
+
+
+from ._types import Optional, Tuple, Literal, Union, array
+
+
+def argmax(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+    ...
+
+
+def argmin(x: array, /, *, axis: Optional[int] = None, keepdims: bool = False) -> array:
+    ...
+
+
+def count_nonzero(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> array:
+    ...
+
+
+def nonzero(x: array, /) -> Tuple[array, ...]:
+    ...
+
+
+def searchsorted(
+    x1: array,
+    x2: Union[array, int, float],
+    /,
+    *,
+    side: Literal["left", "right"] = "left",
+    sorter: Optional[array] = None,
+) -> array:
+    ...
+
+
+def where(
+    condition: array,
+    x1: Union[array, int, float, complex, bool],
+    x2: Union[array, int, float, complex, bool],
+    /,
+) -> array:
+    ...
@@ -0,0 +1,31 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_2025_12/set_functions.py. Do not edit.
+__all__ = ["isin", "unique_all", "unique_counts", "unique_inverse", "unique_values"]
+
+
+from ._types import Tuple, Union, array
+
+
+def isin(
+    x1: Union[array, int],
+    x2: Union[array, int],
+    /,
+    *,
+    invert: bool = False,
+) -> array:
+    ...
+
+
+def unique_all(x: array, /) -> Tuple[array, array, array, array]:
+    ...
+
+
+def unique_counts(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def unique_inverse(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def unique_values(x: array, /) -> array:
+    ...
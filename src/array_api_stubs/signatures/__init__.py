@@ -0,0 +1,25 @@
+"""
+Signature-only variants of the array API stubs.
+
+Each version of the specification is mirrored as a subpackage (e.g.,
+``array_api_stubs.signatures._draft``) which defines the same objects as the
+corresponding stubs in ``array_api_stubs``, but without docstrings. Tools which
+only inspect the API surface (e.g., using ``inspect.signature``) can import
+these modules at a fraction of the memory of the full stubs.
+
+The subpackages are generated from the full stubs by ``src/_array_api_generate.py``
+and must not be edited by hand.
+"""
+import importlib
+
+from .. import _VERSIONS
+
+
+def __getattr__(name):
+    if name in _VERSIONS:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VERSIONS))
@@ -0,0 +1,508 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/elementwise_functions.py. Do not edit.
+__all__ = [
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "asin",
+    "asinh",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_left_shift",
+    "bitwise_invert",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "clip",
+    "conj",
+    "copysign",
+    "cos",
+    "cosh",
+    "divide",
+    "equal",
+    "exp",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "fma",
+    "greater",
+    "greater_equal",
+    "hypot",
+    "imag",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "less",
+    "less_equal",
+    "log",
+    "log1p",
+    "log2",
+    "log10",
+    "logaddexp",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "multiply",
+    "negative",
+    "nextafter",
+    "not_equal",
+    "positive",
+    "pow",
+    "real",
+    "reciprocal",
+    "remainder",
+    "round",
+    "sign",
+    "signbit",
+    "sin",
+    "sinh",
+    "square",
+    "sqrt",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+]
+
+
+from ._types import Optional, Union, array
+
+
+def abs(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def acos(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def acosh(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def add(
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def asin(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def asinh(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def atan(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def atan2(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def atanh(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def bitwise_and(
+    x1: Union[array, int, bool],
+    x2: Union[array, int, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def bitwise_left_shift(
+    x1: Union[array, int], x2: Union[array, int], /, *, out: Optional[array] = None
+) -> array:
+    ...
+
+
+def bitwise_invert(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def bitwise_or(
+    x1: Union[array, int, bool],
+    x2: Union[array, int, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def bitwise_right_shift(
+    x1: Union[array, int], x2: Union[array, int], /, *, out: Optional[array] = None
+) -> array:
+    ...
+
+
+def bitwise_xor(
+    x1: Union[array, int, bool],
+    x2: Union[array, int, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def ceil(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def clip(
+    x: array,
+    /,
+    min: Optional[Union[int, float, array]] = None,
+    max: Optional[Union[int, float, array]] = None,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def conj(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def copysign(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def cos(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def cosh(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def divide(
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def equal(
+    x1: Union[array, int, float, complex, bool],
+    x2: Union[array, int, float, complex, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def exp(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def expm1(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def floor(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def floor_divide(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def fma(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    x3: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def greater(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def greater_equal(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def hypot(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def imag(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def isfinite(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def isinf(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def isnan(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def less(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def less_equal(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def log(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def log1p(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def log2(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def log10(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def logaddexp(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def logical_and(
+    x1: Union[array, bool], x2: Union[array, bool], /, *, out: Optional[array] = None
+) -> array:
+    ...
+
+
+def logical_not(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def logical_or(
+    x1: Union[array, bool], x2: Union[array, bool], /, *, out: Optional[array] = None
+) -> array:
+    ...
+
+
+def logical_xor(
+    x1: Union[array, bool], x2: Union[array, bool], /, *, out: Optional[array] = None
+) -> array:
+    ...
+
+
+def maximum(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def minimum(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def multiply(
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def negative(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def nextafter(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def not_equal(
+    x1: Union[array, int, float, complex, bool],
+    x2: Union[array, int, float, complex, bool],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def positive(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def pow(
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def real(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def reciprocal(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def remainder(
+    x1: Union[array, int, float],
+    x2: Union[array, int, float],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def round(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def sign(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def signbit(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def sin(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def sinh(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def square(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def sqrt(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def subtract(
+    x1: Union[array, int, float, complex],
+    x2: Union[array, int, float, complex],
+    /,
+    *,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def tan(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def tanh(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
+
+
+def trunc(x: array, /, *, out: Optional[array] = None) -> array:
+    ...
@@ -0,0 +1,36 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/indexing_functions.py. Do not edit.
+__all__ = ["put", "put_along_axis", "take", "take_along_axis"]
+
+from ._types import Literal, Union, Optional, array
+
+
+def put(
+    x: array,
+    indices: array,
+    values: Union[int, float, complex, bool, array],
+    /,
+    *,
+    axis: Optional[int] = None,
+    reduction: Literal["replace", "add", "multiply", "max", "min"] = "replace",
+) -> array:
+    ...
+
+
+def put_along_axis(
+    x: array,
+    indices: array,
+    values: Union[int, float, complex, bool, array],
+    /,
+    *,
+    axis: int = -1,
+    reduction: Literal["replace", "add", "multiply", "max", "min"] = "replace",
+) -> array:
+    ...
+
+
+def take(x: array, indices: array, /, *, axis: Optional[int] = None) -> array:
+    ...
+
+
+def take_along_axis(x: array, indices: array, /, *, axis: int = -1) -> array:
+    ...
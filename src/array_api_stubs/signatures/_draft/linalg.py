@@ -0,0 +1,261 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/linalg.py. Do not edit.
+__all__ = [
+    "cho_solve",
+    "cholesky",
+    "cross",
+    "det",
+    "diagonal",
+    "eig",
+    "eigh",
+    "eigvals",
+    "eigvalsh",
+    "inv",
+    "lstsq",
+    "lu_factor",
+    "lu_solve",
+    "matmul",
+    "matrix_norm",
+    "matrix_power",
+    "matrix_rank",
+    "matrix_transpose",
+    "multi_dot",
+    "outer",
+    "pinv",
+    "qr",
+    "slogdet",
+    "solve",
+    "solve_triangular",
+    "svd",
+    "svdvals",
+    "tensordot",
+    "trace",
+    "vecdot",
+    "vector_norm",
+]
+
+
+from ._types import Literal, Optional, Tuple, Union, Sequence, array, dtype
+from .constants import inf
+
+
+def cho_solve(x1: array, x2: array, /, *, upper: bool = False) -> array:
+    ...
+
+
+def cholesky(x: array, /, *, upper: bool = False) -> array:
+    ...
+
+
+def cross(x1: array, x2: array, /, *, axis: int = -1) -> array:
+    ...
+
+
+def det(
+    x: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> array:
+    ...
+
+
+def diagonal(x: array, /, *, offset: int = 0) -> array:
+    ...
+
+
+def eig(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def eigh(
+    x: array, /, *, subset_by_index: Optional[Tuple[int, int]] = None
+) -> Tuple[array, array]:
+    ...
+
+
+def eigvalsh(
+    x: array, /, *, subset_by_index: Optional[Tuple[int, int]] = None
+) -> array:
+    ...
+
+
+def eigvals(x: array, /) -> array:
+    ...
+
+
+def inv(
+    x: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> array:
+    ...
+
+
+def lstsq(
+    x1: array, x2: array, /, *, rtol: Optional[Union[float, array]] = None
+) -> array:
+    ...
+
+
+def lu_factor(x: array, /) -> Tuple[array, array]:
+    ...
+
+
+def lu_solve(factors: Tuple[array, array], x2: array, /) -> array:
+    ...
+
+
+def matmul(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    transpose_a: bool = False,
+    transpose_b: bool = False,
+    adjoint_a: bool = False,
+    adjoint_b: bool = False,
+) -> array:
+    ...
+
+
+def matrix_norm(
+    x: array,
+    /,
+    *,
+    keepdims: bool = False,
+    ord: Optional[Union[int, float, Literal[inf, -inf, "fro", "nuc"]]] = "fro",
+) -> array:
+    ...
+
+
+def matrix_power(x: array, n: int, /) -> array:
+    ...
+
+
+def matrix_rank(x: array, /, *, rtol: Optional[Union[float, array]] = None) -> array:
+    ...
+
+
+def matrix_transpose(x: array, /) -> array:
+    ...
+
+
+def multi_dot(arrays: Sequence[array], /) -> array:
+    ...
+
+
+def outer(x1: array, x2: array, /) -> array:
+    ...
+
+
+def pinv(x: array, /, *, rtol: Optional[Union[float, array]] = None) -> array:
+    ...
+
+
+def qr(
+    x: array, /, *, mode: Literal["reduced", "complete"] = "reduced"
+) -> Tuple[array, array]:
+    ...
+
+
+def slogdet(
+    x: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> Tuple[array, array]:
+    ...
+
+
+def solve(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    assume_a: Literal[
+        "general",
+        "symmetric",
+        "hermitian",
+        "positive definite",
+        "diagonal",
+        "lower triangular",
+        "upper triangular",
+    ] = "general",
+) -> array:
+    ...
+
+
+def solve_triangular(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    upper: bool = False,
+    left: bool = True,
+    unit_diagonal: bool = False,
+) -> array:
+    ...
+
+
+def svd(
+    x: array, /, *, full_matrices: bool = True, k: Optional[int] = None
+) -> Tuple[array, array, array]:
+    ...
+
+
+def svdvals(x: array, /, *, k: Optional[int] = None) -> array:
+    ...
+
+
+def tensordot(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    axes: Union[int, Tuple[Sequence[int], Sequence[int]]] = 2,
+) -> array:
+    ...
+
+
+def trace(x: array, /, *, offset: int = 0, dtype: Optional[dtype] = None) -> array:
+    ...
+
+
+def vecdot(x1: array, x2: array, /, *, axis: int = -1) -> array:
+    ...
+
+
+def vector_norm(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    ord: Union[int, float, Literal[inf, -inf]] = 2,
+) -> array:
+    ...
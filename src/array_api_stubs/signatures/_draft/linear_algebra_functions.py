@@ -0,0 +1,45 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/linear_algebra_functions.py. Do not edit.
+__all__ = ["einsum", "matmul", "matrix_transpose", "tensordot", "vecdot"]
+
+
+from ._types import Tuple, Union, Sequence, array
+
+
+def einsum(
+    subscripts: str,
+    /,
+    *operands: array,
+    optimize: Union[bool, str, Sequence[Tuple[int, ...]]] = True,
+) -> array:
+    ...
+
+
+def matmul(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    transpose_a: bool = False,
+    transpose_b: bool = False,
+    adjoint_a: bool = False,
+    adjoint_b: bool = False,
+) -> array:
+    ...
+
+
+def matrix_transpose(x: array, /) -> array:
+    ...
+
+
+def tensordot(
+    x1: array,
+    x2: array,
+    /,
+    *,
+    axes: Union[int, Tuple[Sequence[int], Sequence[int]]] = 2,
+) -> array:
+    ...
+
+
+def vecdot(x1: array, x2: array, /, *, axis: int = -1) -> array:
+    ...
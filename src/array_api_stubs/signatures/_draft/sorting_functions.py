@@ -0,0 +1,37 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/sorting_functions.py. Do not edit.
+__all__ = ["argpartition", "argsort", "partition", "sort", "top_k"]
+
+
+from ._types import Tuple, array
+
+
+def argpartition(x: array, kth: int, /, *, axis: int = -1) -> array:
+    ...
+
+
+def argsort(
+    x: array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
+) -> array:
+    ...
+
+
+def partition(x: array, kth: int, /, *, axis: int = -1) -> array:
+    ...
+
+
+def sort(
+    x: array, /, *, axis: int = -1, descending: bool = False, stable: bool = True
+) -> array:
+    ...
+
+
+def top_k(
+    x: array,
+    k: int,
+    /,
+    *,
+    axis: int = -1,
+    largest: bool = True,
+    sorted: bool = True,
+) -> Tuple[array, array]:
+    ...
@@ -0,0 +1,294 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/statistical_functions.py. Do not edit.
+__all__ = [
+    "bincount",
+    "cumulative_sum",
+    "cumulative_prod",
+    "histogram",
+    "log_softmax",
+    "logsumexp",
+    "max",
+    "mean",
+    "mean_var",
+    "merge_moments",
+    "min",
+    "minmax",
+    "moments",
+    "moments_var",
+    "prod",
+    "segment_max",
+    "segment_mean",
+    "segment_min",
+    "segment_sum",
+    "softmax",
+    "std",
+    "sum",
+    "var",
+]
+
+
+from ._types import Literal, Optional, Tuple, Union, array, dtype
+
+
+def bincount(
+    x: array,
+    /,
+    *,
+    weights: Optional[array] = None,
+    minlength: int = 0,
+    length: Optional[int] = None,
+) -> array:
+    ...
+
+
+def cumulative_prod(
+    x: array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    dtype: Optional[dtype] = None,
+    include_initial: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def cumulative_sum(
+    x: array,
+    /,
+    *,
+    axis: Optional[int] = None,
+    dtype: Optional[dtype] = None,
+    include_initial: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def histogram(
+    x: array,
+    /,
+    bins: Union[int, array] = 10,
+    *,
+    range: Optional[Tuple[Union[int, float], Union[int, float]]] = None,
+    weights: Optional[array] = None,
+) -> Tuple[array, array]:
+    ...
+
+
+def log_softmax(x: array, /, *, axis: int = -1, out: Optional[array] = None) -> array:
+    ...
+
+
+def logsumexp(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def max(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def mean(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def mean_var(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[Tuple[array, array]] = None,
+) -> Tuple[array, array]:
+    ...
+
+
+def merge_moments(
+    moments1: Tuple[array, array, array], moments2: Tuple[array, array, array], /
+) -> Tuple[array, array, array]:
+    ...
+
+
+def min(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def minmax(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[Tuple[array, array]] = None,
+) -> Tuple[array, array]:
+    ...
+
+
+def moments(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+) -> Tuple[array, array, array]:
+    ...
+
+
+def moments_var(
+    moments: Tuple[array, array, array],
+    /,
+    *,
+    correction: Union[int, float] = 0.0,
+) -> array:
+    ...
+
+
+def prod(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    dtype: Optional[dtype] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def segment_max(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def segment_mean(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def segment_min(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def segment_sum(
+    x: array,
+    segment_ids: array,
+    /,
+    num_segments: int,
+    *,
+    axis: int = 0,
+    dtype: Optional[dtype] = None,
+    indices_are_sorted: bool = False,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def softmax(x: array, /, *, axis: int = -1, out: Optional[array] = None) -> array:
+    ...
+
+
+def std(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def sum(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    dtype: Optional[dtype] = None,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def var(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    correction: Union[int, float] = 0.0,
+    keepdims: bool = False,
+    nan_policy: Literal["propagate", "omit"] = "propagate",
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
@@ -0,0 +1,41 @@
+# Generated by src/_array_api_generate.py from array_api_stubs/_draft/utility_functions.py. Do not edit.
+__all__ = ["all", "any", "diff"]
+
+
+from ._types import Optional, Tuple, Union, array
+
+
+def all(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def any(
+    x: array,
+    /,
+    *,
+    axis: Optional[Union[int, Tuple[int, ...]]] = None,
+    keepdims: bool = False,
+    where: Optional[array] = None,
+    out: Optional[array] = None,
+) -> array:
+    ...
+
+
+def diff(
+    x: array,
+    /,
+    *,
+    axis: int = -1,
+    n: int = 1,
+    prepend: Optional[array] = None,
+    append: Optional[array] = None,
+) -> array:
+    ...
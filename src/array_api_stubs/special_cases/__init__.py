@@ -0,0 +1,76 @@
+"""
+Special cases of element-wise functions as structured data.
+
+For each version of the specification, the special cases listed in the
+docstrings of element-wise functions (e.g., "If ``x_i`` is ``NaN``, the result
+is ``NaN``.") are provided as a table generated from the stubs by
+``src/_array_api_generate.py``. A table has the following layout::
+
+    {
+      "version": "draft",
+      "source": "array_api_stubs/_draft/elementwise_functions.py",
+      "functions": {
+        "acos": {
+          "equivalences": [{"dtypes": [...], "expression": "..."}, ...],
+          "rules": [rule, ...]
+        },
+        ...
+      }
+    }
+
+where ``equivalences`` lists expressions whose special cases a function must
+follow (e.g., ``-1j * asinh(x*1j)``) and each rule is an object containing
+
+* ``dtypes``: the data type kinds (as accepted by ``isdtype``) to which the rule
+  applies, or ``null`` if the rule applies to all data types.
+* ``text``: the special case as stated in the specification.
+* ``conditions``: a list of conditions which must all hold, or ``null`` if the
+  condition could not be parsed. Each condition has ``operands`` (e.g.,
+  ``"x1_i"`` or ``"real(x_i)"``), a ``quantifier`` (``"all"`` or ``"any"``)
+  when there are several operands, and a ``predicate``, such as ``"equal"``,
+  ``"in"``, ``"greater"``, ``"finite"`` or ``"odd_integer"``, together with its
+  ``value`` or ``values``. Disjunctions are represented as ``{"any_of": [...]}``.
+* ``result``: the ``value`` of the result (e.g., ``"NaN"``, ``"+0"`` or
+  ``"x1_i"``), or only its ``text`` if the result could not be parsed. Results
+  may further specify a ``component`` (``"real"`` or ``"imaginary"``), a
+  ``sign_bit``, a mathematical ``sign``, whether the value is ``approximate``,
+  and a ``note``.
+* ``otherwise``: ``true`` if the rule applies to all remaining cases.
+"""
+import functools
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+__all__ = ["load", "versions"]
+
+_TABLES = Path(__file__).parent
+
+
+def versions() -> Tuple[str, ...]:
+    """Returns the versions (e.g., ``"2022.12"`` or ``"draft"``) having a table."""
+    return tuple(sorted(p.stem for p in _TABLES.glob("*.json")))
+
+
+@functools.lru_cache()
+def load(version: str = "draft") -> Dict[str, Any]:
+    """
+    Returns the special-case table for a version of the specification.
+
+    Parameters
+    ----------
+    version: str
+        version of the specification (e.g., ``"2022.12"``). Default: ``"draft"``.
+
+    Returns
+    -------
+    out: Dict[str, Any]
+        special-case table. The returned object is cached and must not be mutated.
+    """
+    path = _TABLES / f"{version}.json"
+    if not path.exists():
+        raise ValueError(
+            f"unknown version {version!r}; expected one of {list(versions())}"
+        )
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)